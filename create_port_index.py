@@ -0,0 +1,104 @@
+import csv
+import gzip
+import re
+import sys
+
+# Builds ports.tsv.gz (protocol/port index for the OSI tab).
+#
+#   python create_port_index.py                                  -> from /etc/services
+#   python create_port_index.py service-names-port-numbers.csv   -> full IANA registry
+#
+# The IANA CSV can be downloaded from
+# https://www.iana.org/assignments/service-names-port-numbers/service-names-port-numbers.csv
+#
+# Line format: port \t proto \t name \t aliases \t layer \t description
+
+OUT = "ports.tsv.gz"
+
+# Services that are not application layer in the classic OSI teaching model
+LAYER_OVERRIDES = {
+    "netbios-ns": 5, "netbios-dgm": 5, "netbios-ssn": 5, "sunrpc": 5, "rpcbind": 5,
+    "socks": 5, "pptp": 5, "h323hostcall": 5, "sip": 5, "sip-tls": 5,
+    "isakmp": 3, "ipsec-nat-t": 3, "l2tp": 2, "l2f": 2,
+    "tls": 6, "ssl": 6,
+}
+
+# Protocols without a port, so the index can also be searched by layer
+LAYER_PROTOCOLS = [
+    ("", "", "Ethernet", "IEEE-802.3", 2, "Kabelgebundenes LAN"),
+    ("", "", "WLAN", "IEEE-802.11 WiFi", 2, "Funk-LAN"),
+    ("", "", "ARP", "", 2, "Address Resolution Protocol (IP -> MAC)"),
+    ("", "", "PPP", "", 2, "Point-to-Point Protocol"),
+    ("", "", "VLAN", "IEEE-802.1Q", 2, "Virtuelle LANs (Tagging)"),
+    ("", "", "STP", "IEEE-802.1D", 2, "Spanning Tree Protocol"),
+    ("", "", "IPv4", "IP", 3, "Internet Protocol Version 4"),
+    ("", "", "IPv6", "", 3, "Internet Protocol Version 6"),
+    ("", "", "ICMP", "ping", 3, "Internet Control Message Protocol"),
+    ("", "", "IPsec", "ESP AH", 3, "Verschlüsselung/Authentisierung auf IP-Ebene"),
+    ("", "", "OSPF", "", 3, "Open Shortest Path First (Routing)"),
+    ("", "", "TCP", "", 4, "Transmission Control Protocol"),
+    ("", "", "UDP", "", 4, "User Datagram Protocol"),
+    ("", "", "SCTP", "", 4, "Stream Control Transmission Protocol"),
+    ("", "", "QUIC", "", 4, "Transport über UDP (HTTP/3)"),
+    ("", "", "RPC", "", 5, "Remote Procedure Call"),
+    ("", "", "NetBIOS", "", 5, "NetBIOS-Sitzungsdienst"),
+    ("", "", "TLS", "SSL", 6, "Transport Layer Security"),
+    ("", "", "ASCII", "UTF-8 Unicode", 6, "Zeichenkodierung"),
+    ("", "", "JPEG", "PNG MPEG", 6, "Datenformate/Kompression"),
+    ("", "", "DSL", "", 1, "Digital Subscriber Line"),
+    ("", "", "ISDN", "", 1, "Integrated Services Digital Network"),
+    ("", "", "Bluetooth", "", 1, "Funkübertragung (Nahbereich)"),
+    ("", "", "10GBASE-T", "1000BASE-T Kupfer", 1, "Ethernet über Twisted Pair"),
+    ("", "", "Glasfaser", "LWL SFP", 1, "Lichtwellenleiter"),
+]
+
+
+def clean(text):
+    return " ".join(text.replace("\t", " ").split())
+
+
+def read_etc_services(path="/etc/services"):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line, _, comment = line.partition("#")
+            parts = line.split()
+            if len(parts) < 2 or "/" not in parts[1]:
+                continue
+            port, proto = parts[1].split("/", 1)
+            yield port, proto, parts[0], " ".join(parts[2:]), clean(comment)
+
+
+def read_iana_csv(path):
+    with open(path, encoding="utf-8", errors="replace", newline="") as f:
+        for row in csv.DictReader(f):
+            # Short rows (no port/description) leave columns as None
+            row = {key: (value or "").strip() for key, value in row.items() if key}
+            name = row.get("Service Name", "")
+            port = row.get("Port Number", "")
+            proto = row.get("Transport Protocol", "")
+            # Also skips continuation lines of unquoted multi-line descriptions
+            if not name or not proto or not re.fullmatch(r"\d+(-\d+)?", port):
+                continue
+            start, _, end = port.partition("-")
+            # Ranges are expanded only if they are small
+            ports = range(int(start), int(end or start) + 1)
+            if len(ports) > 16:
+                ports = [int(start)]
+            for p in ports:
+                yield str(p), proto, name, "", clean(row.get("Description", ""))
+
+
+def main():
+    rows = read_iana_csv(sys.argv[1]) if len(sys.argv) > 1 else read_etc_services()
+    entries = {(port, proto, name): (aliases, desc) for port, proto, name, aliases, desc in rows}
+    lines = [f"{port}\t{proto}\t{name}\t{aliases}\t{LAYER_OVERRIDES.get(name.lower(), 7)}\t{desc}"
+             for (port, proto, name), (aliases, desc) in sorted(entries.items(), key=lambda e: (int(e[0][0]), e[0][1:]))]
+    lines += ["\t".join(map(str, p)) for p in LAYER_PROTOCOLS]
+
+    with gzip.open(OUT, "wt", encoding="utf-8", compresslevel=9) as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"{OUT} created: {len(lines)} entries")
+
+
+if __name__ == "__main__":
+    main()
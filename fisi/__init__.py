@@ -0,0 +1 @@
+"""FISI Toolkit: Engines ohne GUI-Abhängigkeiten, Tabs unter fisi.tabs, Fenster in fisi.app."""
@@ -0,0 +1,236 @@
+import asyncio
+import json
+import logging
+import math
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .network import NetworkEngine
+from .raid import RaidEngine
+from .units import UnitConverterEngine
+
+log = logging.getLogger(__name__)
+
+
+def _finite(value):
+    """float(value) for finite numbers only; JSON has no Infinity/NaN."""
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"Zahl außerhalb des gültigen Bereichs: {value!r}")
+    return number
+
+
+def _check_result(value):
+    """Raises ValueError if a result contains Infinity/NaN (e.g. after an overflow)."""
+    items = value.values() if isinstance(value, dict) else value if isinstance(value, list) else None
+    if items is not None:
+        for item in items:
+            _check_result(item)
+    elif isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("Ergebnis außerhalb des gültigen Zahlenbereichs")
+    return value
+
+
+def _reject_constant(name):
+    raise ValueError(f"{name} ist kein gültiger JSON-Wert")
+
+
+def api_process_batch(endpoint: str, items: list) -> list:
+    """Runs a batch of API items through the matching engine; item errors are returned inline."""
+    handler = ApiServer.HANDLERS[endpoint]
+    results = []
+    for item in items:
+        try:
+            results.append(_check_result(handler(item)))
+        except (ValueError, KeyError, TypeError, OverflowError) as e:
+            results.append({"error": f"{type(e).__name__}: {e}"})
+    return results
+
+
+class ApiServer:
+    """
+    Lokale JSON-API (HTTP/1.1) für die Engines.
+    POST /api/subnet, /api/raid, /api/units (Objekt oder Array), GET /api/metrics.
+    """
+    INLINE_BATCH = 64           # batches up to this size run directly on the loop
+    MAX_BODY = 16 * 1024 * 1024
+    LATENCY_SAMPLES = 10000
+
+    _network = NetworkEngine()
+    _raid = RaidEngine()
+    _units = UnitConverterEngine()
+
+    @staticmethod
+    def _subnet(item):
+        return ApiServer._network.calculate(item["ip"], int(item["cidr"]))
+
+    @staticmethod
+    def _raid_level(item):
+        spans = int(item.get("spans", 2))
+        # Vor dem Aufbau der Disk-Liste begrenzen
+        num_disks = len(item["sizes"]) if "sizes" in item else int(item["disks"])
+        if num_disks > RaidEngine.MAX_DISKS or spans > RaidEngine.MAX_DISKS:
+            raise ValueError(f"Max. {RaidEngine.MAX_DISKS} Disks")
+        if "sizes" in item:
+            return ApiServer._raid.calculate_sizes(item["raid"], [_finite(size) for size in item["sizes"]], spans)
+        return ApiServer._raid.calculate(item["raid"], num_disks, _finite(item["size"]), spans)
+
+    @staticmethod
+    def _convert(item):
+        result, bytes_val = ApiServer._units.convert(_finite(item["value"]), item["src"], item["dst"])
+        return {"result": result, "bytes": bytes_val}
+
+    HANDLERS = {
+        "/api/subnet": _subnet.__func__,
+        "/api/raid": _raid_level.__func__,
+        "/api/units": _convert.__func__,
+    }
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, workers: int = None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.executor = None  # erst beim ersten großen Batch
+        self.metrics = {path: {"requests": 0, "items": 0, "errors": 0,
+                               "latency": deque(maxlen=self.LATENCY_SAMPLES)}
+                        for path in list(self.HANDLERS) + ["/api/metrics"]}
+
+    def run(self):
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.executor:
+                self.executor.shutdown(cancel_futures=True)
+
+    async def serve(self):
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        print(f"FISI Toolkit API läuft auf http://{self.host}:{self.port}/ (Strg+C zum Beenden)")
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.send(writer, 400, {"error": "Ungültige Anfrage"}, keep_alive=False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                length = headers.get("content-length", "") or "0"
+                if not re.fullmatch(r"[0-9]+", length):
+                    await self.send(writer, 400, {"error": "Ungültige Content-Length"}, keep_alive=False)
+                    break
+                length = int(length)
+                if length > self.MAX_BODY:
+                    await self.send(writer, 413, {"error": "Anfrage zu groß"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload = await self.dispatch(method, target.split("?", 1)[0], body)
+                except Exception:
+                    log.exception("API request failed: %s %s", method, target)
+                    status, payload, keep_alive = 500, {"error": "Interner Fehler"}, False
+                await self.send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception:
+            log.exception("API connection failed")
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        start = time.perf_counter()
+        if path == "/api/metrics":
+            if method != "GET":
+                return 405, {"error": "Nur GET erlaubt"}
+            status, payload = 200, self.metrics_report()
+        elif path in self.HANDLERS:
+            if method != "POST":
+                return 405, {"error": "Nur POST erlaubt"}
+            status, payload = await self.run_endpoint(path, body)
+        else:
+            return 404, {"error": f"Unbekannter Endpunkt: {path}",
+                         "endpunkte": list(self.HANDLERS) + ["/api/metrics"]}
+
+        stats = self.metrics[path]
+        stats["requests"] += 1
+        if status != 200:
+            stats["errors"] += 1
+        stats["latency"].append(time.perf_counter() - start)
+        return status, payload
+
+    async def run_endpoint(self, path, body):
+        try:
+            data = json.loads(body or b"null", parse_constant=_reject_constant, parse_float=_finite)
+        except ValueError as e:
+            return 400, {"error": f"Ungültiges JSON: {e}"}
+
+        batch = isinstance(data, list)
+        items = data if batch else [data]
+        if not all(isinstance(item, dict) for item in items):
+            return 400, {"error": "Erwartet ein Objekt oder ein Array von Objekten"}
+
+        if len(items) > self.INLINE_BATCH:
+            loop = asyncio.get_running_loop()
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            results = await loop.run_in_executor(self.executor, api_process_batch, path, items)
+        else:
+            results = api_process_batch(path, items)
+
+        stats = self.metrics[path]
+        stats["items"] += len(items)
+        stats["errors"] += sum(1 for r in results if "error" in r)
+        return 200, results if batch else results[0]
+
+    def metrics_report(self) -> dict:
+        report = {}
+        for path, stats in self.metrics.items():
+            samples = sorted(stats["latency"])
+
+            def pct(p):
+                return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 3) if samples else None
+
+            report[path] = {
+                "requests": stats["requests"],
+                "items": stats["items"],
+                "errors": stats["errors"],
+                "latency_ms": {
+                    "mean": round(sum(samples) / len(samples) * 1000, 3) if samples else None,
+                    "p50": pct(0.50), "p95": pct(0.95), "p99": pct(0.99),
+                    "max": round(samples[-1] * 1000, 3) if samples else None,
+                },
+            }
+        return report
+
+    @staticmethod
+    async def send(writer, status, payload, keep_alive=True):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found",
+                   405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+        body = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {reasons.get(status, 'Error')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
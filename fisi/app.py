@@ -0,0 +1,180 @@
+import customtkinter as ctk
+from tkinter import messagebox
+import logging
+import sqlite3
+
+from .history import HistoryStore
+from .paths import app_data_path, resource_path
+from .plugins import TabRegistry
+from .profiler import MemoryProfiler
+from .settings import AppSettings
+
+log = logging.getLogger(__name__)
+
+
+# Konfiguration des Erscheinungsbildes
+ctk.set_appearance_mode("System")  # Standard: System (Light/Dark je nach OS)
+ctk.set_default_color_theme("blue")  # Standard-Theme: Blau
+
+
+class App(ctk.CTk):
+    def __init__(self, profile_memory: bool = False):
+        # Gespeichertes Design vor dem ersten Widget setzen (kein zweites Neuzeichnen)
+        self.settings = AppSettings(app_data_path("settings.json"))
+        self.settings.apply()
+        super().__init__()
+
+        # Fenster Konfiguration
+        self.title("FISI Toolkit - IT Fachinformatiker Werkzeuge")
+        self.geometry("1000x700")
+        self.minsize(800, 600)
+
+        # Grid Layout 1x2 (Sidebar + Main Content)
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        # Sidebar
+        self.sidebar_expanded = True
+        self.sidebar_width_expanded = 140
+        self.sidebar_width_collapsed = 45
+
+        self.sidebar_frame = ctk.CTkFrame(self, width=self.sidebar_width_expanded, corner_radius=0)
+        self.sidebar_frame.grid(row=0, column=0, rowspan=4, sticky="nsew")
+        self.sidebar_frame.grid_propagate(False)  # Prevent children from resizing the frame
+        
+        # Toggle Button
+        self.btn_toggle = ctk.CTkButton(self.sidebar_frame, text="☰", width=30, height=30, fg_color="transparent", 
+                                        text_color=("gray10", "gray90"), hover_color=("gray70", "gray30"),
+                                        command=self.toggle_sidebar)
+        self.btn_toggle.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+
+        # Logo / Title (fix truncation by using grid_remove instead of grid_forget)
+        self.logo_label = ctk.CTkLabel(self.sidebar_frame, text="FISI Toolkit", font=ctk.CTkFont(size=16, weight="bold"))
+        self.logo_label.grid(row=1, column=0, padx=10, pady=(0,10), sticky="ew")
+
+        # Set App Icon if exists
+        try:
+            self.iconbitmap(resource_path("icon.ico"))
+        except:
+            pass
+
+        # Verlauf & Favoriten (lokale SQLite-Datenbank, vor den Tabs erstellen)
+        try:
+            self.history = HistoryStore(app_data_path("history.sqlite3"))
+        except (OSError, sqlite3.Error) as e:
+            log.warning("History disabled: %s", e)
+            self.history = None
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Speicher-Profiling (opt-in, vor den Tabs, damit deren Aufbau gemessen wird)
+        self.memory = MemoryProfiler()
+        if profile_memory:
+            self.memory.enable()
+
+        # Navigation Buttons
+        self.nav_buttons = {}
+        self.current_frame = None
+
+        # Tabs (eingebaut + Plugins); Frames entstehen erst beim ersten Öffnen
+        self.tab_specs = {spec.name: spec for spec in TabRegistry.discover()}
+        self.frames = {}
+        
+        # Layout Order in Sidebar
+        # Group Tools at top (from row 2), Settings/Info at bottom
+        # A spacer row between them pushes the bottom elements down
+        tools = [spec for spec in self.tab_specs.values() if spec.section == "tools"]
+        bottom = [spec for spec in self.tab_specs.values() if spec.section == "bottom"]
+        spacer_row = len(tools) + 2  # 2 header rows + tools
+        self.sidebar_frame.grid_rowconfigure(spacer_row, weight=1)
+
+        rows = [(i + 2, spec) for i, spec in enumerate(tools)] + \
+               [(spacer_row + 1 + i, spec) for i, spec in enumerate(bottom)]
+        for row, spec in rows:
+            btn = ctk.CTkButton(self.sidebar_frame, corner_radius=0, height=40, border_spacing=10, text=f"{spec.icon}  {spec.label}",
+                                fg_color="transparent", text_color=("gray10", "gray90"), hover_color=("gray70", "gray30"),
+                                anchor="w", font=ctk.CTkFont(size=14), command=lambda n=spec.name: self.select_frame(n))
+            btn.grid(row=row, column=0, sticky="ew")
+            self.nav_buttons[spec.name] = btn
+
+        # Select first tab (Converter)
+        self.select_frame("converter")
+
+    def on_close(self):
+        # Ausstehende Verlaufseinträge noch schreiben
+        if self.history:
+            self.history.close()
+        self.destroy()
+
+    def get_frame(self, name):
+        """Baut den Tab beim ersten Aufruf (Plugin-Module werden erst jetzt importiert)."""
+        if name not in self.frames:
+            spec = self.tab_specs[name]
+            try:
+                with self.memory.measure("tab", name):
+                    self.frames[name] = TabRegistry.load_factory(spec)(self)
+            except Exception as e:
+                messagebox.showerror("Fehler", f"Tab '{spec.label}' konnte nicht geladen werden:\n{e}")
+                return None
+        return self.frames[name]
+
+    def select_frame(self, name):
+        frame = self.get_frame(name)
+        if frame is None:
+            return
+
+        # Update Buttons
+        for n, btn in self.nav_buttons.items():
+            if n == name:
+                btn.configure(fg_color=("gray75", "gray25"), text_color=("black", "white"))
+            else:
+                btn.configure(fg_color="transparent", text_color=("gray10", "gray90"))
+
+        # Switch Frame
+        if self.current_frame:
+            self.current_frame.grid_forget()
+
+        self.current_frame = frame
+        self.current_frame.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
+
+        # Optionaler Hook, z.B. für Daten, die erst beim ersten Öffnen geladen werden
+        on_show = getattr(self.current_frame, "on_show", None)
+        if on_show:
+            on_show()
+
+    def toggle_sidebar(self):
+        if self.sidebar_expanded:
+            self.sidebar_width_expanded = self.sidebar_frame.winfo_width()
+            self.sidebar_frame.configure(width=self.sidebar_width_collapsed)
+            
+            # Hide texts, show only icons
+            self.logo_label.grid_forget()
+            self.btn_toggle.grid(padx=5) 
+
+            for name, btn in self.nav_buttons.items():
+                # Show only Icon. 
+                # Note: We need to ensure the button is wide enough or text is centered.
+                btn.configure(text=self.tab_specs[name].icon, anchor="center", width=40)
+            
+            self.sidebar_expanded = False
+        else:
+            self.sidebar_frame.configure(width=self.sidebar_width_expanded)
+            
+            # Show texts
+            self.logo_label.grid(row=1, column=0, padx=10, pady=(0,10), sticky="ew")
+            self.btn_toggle.grid(padx=10)
+
+            for name, btn in self.nav_buttons.items():
+                # Show Icon + Text
+                spec = self.tab_specs[name]
+                btn.configure(text=f"{spec.icon}  {spec.label}", anchor="w", width=self.sidebar_width_expanded - 20)
+                
+            self.sidebar_expanded = True
+
+
+    def change_appearance_mode_event(self, new_appearance_mode: str):
+        self.settings.save(appearance=new_appearance_mode)
+        ctk.set_appearance_mode(new_appearance_mode)
+
+    def change_scaling_event(self, new_scaling: str):
+        self.settings.save(scaling=new_scaling)
+        ctk.set_widget_scaling(AppSettings.scaling_factor(new_scaling))
@@ -0,0 +1,86 @@
+import os
+import mmap
+
+from .checksum import ChecksumEngine
+
+
+class BinaryFileView:
+    """
+    Zeilenweiser Zugriff und Suche in beliebig großen Binärdateien (mmap).
+    """
+    SEARCH_CHUNK = 64 * 1024 * 1024
+    _ASCII = bytes(b if 32 <= b < 127 else ord(".") for b in range(256))
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self._file = open(path, "rb")
+        # mmap kann keine leeren Dateien abbilden
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.offset_digits = max(8, len(f"{self.size:X}"))
+
+    def close(self):
+        if self.size:
+            self._map.close()
+        self._file.close()
+
+    def row_count(self, bytes_per_row: int) -> int:
+        return max(1, -(-self.size // bytes_per_row))
+
+    def read(self, offset: int, length: int) -> bytes:
+        return self._map[offset:offset + length]
+
+    def hex_column(self, byte_index: int, binary: bool = False) -> int:
+        """Text column where byte_index (within a row) starts in format_rows() output."""
+        return self.offset_digits + 2 + byte_index * (9 if binary else 3)
+
+    def ascii_column(self, byte_index: int, bytes_per_row: int, binary: bool = False) -> int:
+        """Text column of byte_index in the ASCII part of format_rows() output."""
+        return self.hex_column(bytes_per_row, binary) + 2 + byte_index
+
+    def byte_at_column(self, col: int, bytes_per_row: int, binary: bool = False) -> int:
+        """Byte index within a row for a text column of the hex/binary area, or None."""
+        width = 9 if binary else 3
+        rel = col - (self.offset_digits + 2)
+        if rel < 0 or rel >= bytes_per_row * width:
+            return None
+        return rel // width
+
+    def format_rows(self, first_row: int, count: int, bytes_per_row: int = 16, binary: bool = False) -> list:
+        """Formats rows as 'offset  hex|binary  |ascii|'."""
+        lines = []
+        width = bytes_per_row * (9 if binary else 3) - 1
+        for row in range(first_row, min(first_row + count, self.row_count(bytes_per_row))):
+            offset = row * bytes_per_row
+            data = self._map[offset:offset + bytes_per_row]
+            if binary:
+                cells = " ".join(f"{b:08b}" for b in data)
+            else:
+                cells = data.hex(" ")
+            lines.append(f"{offset:0{self.offset_digits}X}  {cells.ljust(width)}  |{data.translate(self._ASCII).decode('ascii')}|")
+        return lines
+
+    def find(self, pattern: bytes, start: int = 0, progress=None) -> int:
+        """Returns the offset of the next occurrence at or after start (-1 if none).
+        Searches in chunks so progress((done, total)) can report and cancel."""
+        if not pattern or not self.size:
+            return -1
+        overlap = len(pattern) - 1
+        pos = start
+        while pos < self.size:
+            end = min(pos + self.SEARCH_CHUNK + overlap, self.size)
+            found = self._map.find(pattern, pos, end)
+            if found != -1:
+                return found
+            pos += self.SEARCH_CHUNK
+            if progress:
+                progress((min(pos, self.size) - start, self.size - start))
+        return -1
+
+    @staticmethod
+    def parse_pattern(txt: str) -> bytes:
+        """Search pattern as hex ('de ad be ef') or text in quotes ('"PNG"')."""
+        txt = txt.strip()
+        if len(txt) >= 2 and txt[0] == txt[-1] and txt[0] in "\"'":
+            return txt[1:-1].encode("utf-8")
+        return ChecksumEngine.parse_hex(txt)
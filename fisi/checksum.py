@@ -0,0 +1,117 @@
+import os
+import sys
+import hashlib
+import zlib
+from array import array
+import time
+
+try:
+    import numpy as np  # Optional: beschleunigt Prüfsummen und Massenauswertungen
+except ImportError:
+    np = None
+
+from .profiler import profiled
+
+
+class ChecksumEngine:
+    """
+    Prüfsummen und Hashes für Bytes und Dateien (gestreamt).
+    """
+    ALGORITHMS = ["CRC32", "Adler-32", "Internet (RFC 1071)", "MD5", "SHA-1", "SHA-256"]
+    HASHES = {"MD5": "md5", "SHA-1": "sha1", "SHA-256": "sha256"}
+    BUFFER_SIZE = 1 << 20  # gerade Größe, damit 16-Bit-Wörter nicht über Chunks verteilt werden
+
+    def new_state(self, algorithms=None) -> dict:
+        state = {}
+        for name in algorithms or self.ALGORITHMS:
+            if name == "CRC32":
+                state[name] = 0
+            elif name == "Adler-32":
+                state[name] = 1
+            elif name == "Internet (RFC 1071)":
+                state[name] = [0, b""]  # [Summe, übrig gebliebenes ungerades Byte]
+            elif name in self.HASHES:
+                state[name] = hashlib.new(self.HASHES[name])
+            else:
+                raise ValueError(f"Unbekannter Algorithmus: {name}")
+        return state
+
+    def update(self, state: dict, data):
+        for name, value in state.items():
+            if name == "CRC32":
+                state[name] = zlib.crc32(data, value)
+            elif name == "Adler-32":
+                state[name] = zlib.adler32(data, value)
+            elif name == "Internet (RFC 1071)":
+                # Eigene Variable: data wird danach noch von den Hashes gebraucht
+                chunk = value[1] + bytes(data) if value[1] else data
+                if len(chunk) % 2:
+                    chunk, value[1] = chunk[:-1], bytes(chunk[-1:])
+                else:
+                    value[1] = b""
+                value[0] += self.ones_complement_sum(chunk)
+            else:
+                value.update(data)
+
+    def finalize(self, state: dict) -> dict:
+        results = {}
+        for name, value in state.items():
+            if name in ("CRC32", "Adler-32"):
+                results[name] = f"0x{value:08X}"
+            elif name == "Internet (RFC 1071)":
+                total = value[0]
+                if value[1]:
+                    total += value[1][0] << 8  # ungerades Ende mit Null auffüllen
+                while total >> 16:
+                    total = (total & 0xFFFF) + (total >> 16)
+                results[name] = f"0x{~total & 0xFFFF:04X}"
+            else:
+                results[name] = value.hexdigest()
+        return results
+
+    @staticmethod
+    def ones_complement_sum(data) -> int:
+        """Sum of big-endian 16-bit words (even length), not yet folded."""
+        if not data:
+            return 0
+        if np is not None:
+            return int(np.frombuffer(data, dtype=">u2").sum(dtype=np.uint64))
+        words = array("H", bytes(data))
+        if sys.byteorder == "little":
+            words.byteswap()
+        return sum(words)
+
+    @profiled
+    def compute_bytes(self, data: bytes, algorithms=None) -> dict:
+        state = self.new_state(algorithms)
+        self.update(state, data)
+        return self.finalize(state)
+
+    @profiled
+    def compute_file(self, path: str, algorithms=None, progress=None) -> tuple[dict, int, float]:
+        """Streams the file through all algorithms. progress((done, total)) is called per chunk.
+        Returns (results, size, seconds)."""
+        state = self.new_state(algorithms)
+        total = os.path.getsize(path)
+        done = 0
+        start = time.perf_counter()
+        buf = bytearray(self.BUFFER_SIZE)
+        view = memoryview(buf)
+        with open(path, "rb") as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                self.update(state, view[:n])
+                done += n
+                if progress:
+                    progress((done, total))
+        return self.finalize(state), done, time.perf_counter() - start
+
+    @staticmethod
+    def parse_hex(txt: str) -> bytes:
+        """Parses pasted hex data like '45 00 00 3c', '45:00:00:3C' or '0x4500003c'."""
+        cleaned = txt.replace("0x", " ").replace("0X", " ")
+        for sep in ":-,;":
+            cleaned = cleaned.replace(sep, " ")
+        return bytes.fromhex(cleaned)
@@ -0,0 +1,81 @@
+import csv
+import gzip
+import io
+import itertools
+import json
+
+
+class ResultExporter:
+    """
+    Schreibt Ergebniszeilen gestreamt als CSV oder JSONL, optional gzip (.gz).
+    """
+    CHUNK_ROWS = 4096
+    FILETYPES = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl"),
+                 ("CSV (gzip)", "*.csv.gz"), ("JSON Lines (gzip)", "*.jsonl.gz")]
+
+    def __init__(self, path: str, columns, fmt: str = None, compress: bool = None,
+                 buffer_size: int = 1 << 20):
+        name = path.lower()
+        if compress is None:
+            compress = name.endswith(".gz")
+        if name.endswith(".gz"):
+            name = name[:-3]
+        if fmt is None:
+            fmt = "jsonl" if name.endswith((".jsonl", ".json")) else "csv"
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError(f"Unbekanntes Exportformat: {fmt}")
+
+        self.path = path
+        self.columns = tuple(columns)
+        self.fmt = fmt
+        self.compress = compress
+        self.buffer_size = buffer_size
+        self.rows_written = 0
+        self._raw = None
+        self._gzip = None
+        self._text = None
+
+    def __enter__(self):
+        self._raw = open(self.path, "wb", buffering=self.buffer_size)
+        stream = self._raw
+        if self.compress:
+            self._gzip = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+            stream = io.BufferedWriter(self._gzip, buffer_size=self.buffer_size)
+        self._text = io.TextIOWrapper(stream, encoding="utf-8", newline="",
+                                      write_through=False)
+        if self.fmt == "csv":
+            self._csv = csv.writer(self._text)
+            self._csv.writerow(self.columns)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        if self._text is not None:
+            self._text.close()  # flushes and closes the gzip/raw layers below
+            self._text = None
+            if self._gzip is not None:
+                self._raw.close()
+                self._gzip = None
+
+    def write_rows(self, rows, progress=None) -> int:
+        """Writes rows (tuples in column order) and returns the number written.
+        progress(count) is called after every chunk."""
+        rows = iter(rows)
+        while True:
+            chunk = list(itertools.islice(rows, self.CHUNK_ROWS))
+            if not chunk:
+                break
+            if self.fmt == "csv":
+                self._csv.writerows(chunk)
+            else:
+                columns = self.columns
+                dumps = json.dumps
+                self._text.write("".join(
+                    [dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in chunk]))
+            self.rows_written += len(chunk)
+            if progress:
+                progress(self.rows_written)
+        return self.rows_written
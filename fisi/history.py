@@ -0,0 +1,112 @@
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+
+class HistoryStore:
+    """
+    Verlauf und Favoriten in einer lokalen SQLite-Datenbank.
+    Geschrieben wird gesammelt in einem Hintergrund-Thread.
+    """
+    BATCH_SIZE = 256
+    FLUSH_INTERVAL = 0.5  # seconds to wait for more writes before committing
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY,
+            tab TEXT NOT NULL,
+            ts REAL NOT NULL,
+            key TEXT NOT NULL,
+            inputs TEXT NOT NULL,
+            result TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_tab_ts ON history(tab, ts);
+        CREATE INDEX IF NOT EXISTS idx_history_tab_key ON history(tab, key, ts);
+        CREATE TABLE IF NOT EXISTS presets (
+            tab TEXT NOT NULL,
+            key TEXT NOT NULL,
+            inputs TEXT NOT NULL,
+            ts REAL NOT NULL,
+            PRIMARY KEY (tab, key)
+        );
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    # --- Schreiben (Hintergrund-Thread) ---
+
+    def record(self, tab: str, key: str, inputs: dict, result: dict):
+        """Queues a calculation for the history."""
+        self._queue.put(("INSERT INTO history (tab, ts, key, inputs, result) VALUES (?, ?, ?, ?, ?)",
+                         (tab, time.time(), key, json.dumps(inputs), json.dumps(result))))
+
+    def save_preset(self, tab: str, key: str, inputs: dict):
+        self._queue.put(("INSERT OR REPLACE INTO presets (tab, key, inputs, ts) VALUES (?, ?, ?, ?)",
+                         (tab, key, json.dumps(inputs), time.time())))
+
+    def _write_loop(self):
+        conn = sqlite3.connect(self.path)
+        running = True
+        while running:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    item = self._queue.get(timeout=self.FLUSH_INTERVAL)
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+            try:
+                with conn:
+                    for sql, params in batch:
+                        conn.execute(sql, params)
+            except sqlite3.Error:
+                log.exception("History write failed")
+        conn.close()
+
+    def close(self):
+        """Flushes pending writes and stops the writer thread."""
+        self._queue.put(None)
+        self._writer.join(timeout=5)
+        self._conn.close()
+
+    # --- Lesen (UI-Thread) ---
+
+    def search(self, tab: str, prefix: str, limit: int = 20) -> list:
+        """Returns [(key, inputs)] of presets and history entries starting with prefix, newest first.
+        Uses a range scan on the (tab, key) index instead of LIKE."""
+        bounds = (prefix, prefix + "\U0010ffff")
+        presets = self._conn.execute(
+            "SELECT key, inputs FROM presets WHERE tab = ? AND key >= ? AND key < ? ORDER BY ts DESC LIMIT ?",
+            (tab, *bounds, limit)).fetchall()
+        history = self._conn.execute(
+            "SELECT key, inputs FROM history WHERE tab = ? AND key >= ? AND key < ? "
+            "GROUP BY key ORDER BY MAX(ts) DESC LIMIT ?",
+            (tab, *bounds, limit)).fetchall()
+
+        seen = set()
+        entries = []
+        for key, inputs in presets + history:
+            if key not in seen:
+                seen.add(key)
+                entries.append((key, json.loads(inputs)))
+        return entries[:limit]
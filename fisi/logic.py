@@ -0,0 +1,269 @@
+import os
+import ast
+import functools
+import re
+
+try:
+    import numpy as np  # Optional: beschleunigt Prüfsummen und Massenauswertungen
+except ImportError:
+    np = None
+
+from .profiler import profiled
+
+
+class LogicEngine:
+    """
+    Core logic for the Hex/Dez/Bin conversion and the bit matrix.
+    """
+    MAX_VALUE = 0xFFFFFFFF
+
+    def parse(self, txt: str, base: int) -> int:
+        """Parses txt in the given base and clamps it to 32 bit. Raises ValueError."""
+        val = int(txt, base)
+        if val > self.MAX_VALUE: val = self.MAX_VALUE
+        return val
+
+    @profiled
+    def to_bits(self, val: int, bit_count: int) -> list:
+        """Returns the bits of val, index 0 = LSB."""
+        return [(val >> i) & 1 for i in range(bit_count)]
+
+    @profiled
+    def from_bits(self, bits: list) -> int:
+        """Builds the integer value from a bit list (index 0 = LSB)."""
+        val = 0
+        for i, bit in enumerate(bits):
+            if bit:
+                val |= 1 << i
+        return val
+
+    def format_value(self, val: int) -> tuple[str, str, str]:
+        """Returns (dec, hex, bin) strings as shown in the entry fields."""
+        return str(val), f"{val:X}", f"{val:b}"
+
+
+class BitExpression:
+    """
+    Bit-Ausdruck wie "(x >> 4) & 0xF0 ^ ~y" mit fester Bitbreite.
+    Auswertung mit ints oder (mit numpy) mit ganzen Arrays.
+    """
+    WIDTHS = [8, 16, 32, 64]
+    OPERATORS = {ast.BitAnd: "&", ast.BitOr: "|", ast.BitXor: "^", ast.LShift: "<<", ast.RShift: ">>",
+                 ast.Add: "+", ast.Sub: "-", ast.Mult: "*"}
+    MAX_LENGTH = 1000
+    MAX_DEPTH = 64  # Verschachtelung; tiefer würden Übersetzung/compile() an die Rekursionsgrenze stoßen
+    CHUNK_LINES = 65536
+    COLUMNS = ("x", "ergebnis", "hex")
+    FILETYPES = [("Text (ein Wert pro Zeile)", "*.txt *.csv"), ("Binär (Little Endian)", "*.bin *.dump"),
+                 ("Alle Dateien", "*.*")]
+
+    def __init__(self, text: str, width: int):
+        if width not in self.WIDTHS:
+            raise ValueError(f"Bitbreite muss {', '.join(map(str, self.WIDTHS))} sein")
+        if not text.strip():
+            raise ValueError("Leerer Ausdruck")
+        if len(text) > self.MAX_LENGTH:
+            raise ValueError("Ausdruck zu lang")
+        self.text = text
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.constants = []
+        names = set()
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+            body = self._rewrite(tree.body, names)
+            self.code = compile(ast.fix_missing_locations(ast.Expression(body)), "<ausdruck>", "eval")
+        except SyntaxError:
+            raise ValueError("Syntaxfehler im Ausdruck") from None
+        except (RecursionError, MemoryError):
+            raise ValueError("Ausdruck zu komplex") from None
+        self.names = tuple(sorted(names))
+
+    @classmethod
+    @profiled
+    @functools.lru_cache(maxsize=256)
+    def compile(cls, text: str, width: int = 32) -> "BitExpression":
+        """Cached constructor; typing the same prefix again costs a dict lookup."""
+        return cls(text, width)
+
+    # --- Übersetzung -----------------------------------------------------
+
+    @staticmethod
+    def _call(helper: str, *args):
+        return ast.Call(func=ast.Name(helper, ast.Load()), args=list(args), keywords=[])
+
+    def _rewrite(self, node, names, depth=0):
+        """Checks node against the whitelist and returns the rewritten AST."""
+        if depth > self.MAX_DEPTH:
+            raise ValueError("Ausdruck zu komplex")
+        if isinstance(node, ast.Constant) and type(node.value) is int:
+            if node.value > self.mask:
+                raise ValueError(f"Konstante {node.value:#x} passt nicht in {self.width} Bit")
+            self.constants.append(node.value)
+            return ast.Name(f"_c{len(self.constants) - 1}", ast.Load())
+        if isinstance(node, ast.Name):
+            if node.id.startswith("_"):
+                raise ValueError(f"Ungültiger Name: {node.id}")
+            names.add(node.id)
+            return ast.Name(node.id, ast.Load())
+        if isinstance(node, ast.UnaryOp):
+            operand = self._rewrite(node.operand, names, depth + 1)
+            if isinstance(node.op, ast.Invert):
+                return ast.BinOp(operand, ast.BitXor(), ast.Name("_M", ast.Load()))
+            if isinstance(node.op, ast.USub):
+                return self._call("_neg", operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+        if isinstance(node, ast.BinOp) and type(node.op) in self.OPERATORS:
+            left, right = self._rewrite(node.left, names, depth + 1), self._rewrite(node.right, names, depth + 1)
+            if isinstance(node.op, ast.LShift):
+                return self._call("_shl", left, right)
+            if isinstance(node.op, ast.RShift):
+                return self._call("_shr", left, right)
+            expr = ast.BinOp(left, node.op, right)
+            if isinstance(node.op, (ast.Add, ast.Sub, ast.Mult)):
+                # Überlauf abschneiden; &, |, ^ bleiben von selbst in der Bitbreite
+                expr = ast.BinOp(expr, ast.BitAnd(), ast.Name("_M", ast.Load()))
+            return expr
+        raise ValueError(f"Nicht erlaubt: {type(node).__name__} "
+                         f"(erlaubt: Zahlen, Namen, ~ - {' '.join(self.OPERATORS.values())}, Klammern)")
+
+    # --- Auswertung ------------------------------------------------------
+
+    def _int_namespace(self) -> dict:
+        width, mask = self.width, self.mask
+        ns = {"__builtins__": {}, "_M": mask,
+              "_neg": lambda a: -a & mask,
+              "_shl": lambda a, n: (a << n) & mask if n < width else 0,
+              "_shr": lambda a, n: a >> n}
+        ns.update((f"_c{i}", c) for i, c in enumerate(self.constants))
+        return ns
+
+    def _numpy_namespace(self) -> dict:
+        width = self.width
+        mask = np.uint64(self.mask)
+        zero = np.uint64(0)
+
+        def shift(a, n, op):
+            # Verschiebungen >= Bitbreite ergeben 0 (numpy/C wären hier undefiniert)
+            n = np.asarray(n, dtype=np.uint64)
+            return np.where(n < width, op(a, np.minimum(n, np.uint64(width - 1))) & mask, zero)
+
+        ns = {"__builtins__": {}, "_M": mask,
+              "_neg": lambda a: (a ^ mask) + np.uint64(1) & mask,
+              "_shl": lambda a, n: shift(a, n, np.left_shift),
+              "_shr": lambda a, n: shift(a, n, np.right_shift)}
+        ns.update((f"_c{i}", np.uint64(c)) for i, c in enumerate(self.constants))
+        return ns
+
+    def _check_names(self, values: dict):
+        missing = [name for name in self.names if name not in values]
+        if missing:
+            raise ValueError(f"Unbekannte Variable: {', '.join(missing)}")
+
+    @profiled
+    def evaluate(self, values: dict = None) -> int:
+        """Evaluates with int values (masked to the width). Raises ValueError."""
+        values = values or {}
+        self._check_names(values)
+        ns = self._int_namespace()
+        ns.update((name, int(values[name]) & self.mask) for name in self.names)
+        return eval(self.code, ns)
+
+    @profiled
+    def evaluate_array(self, values: dict):
+        """Evaluates element-wise. Arrays and scalars broadcast (also values the
+        expression does not use, so every input row gets a result); returns a
+        uint64 array, or a list without numpy (evaluated value by value)."""
+        self._check_names(values)
+        if np is None:
+            columns = {name: value for name, value in values.items() if isinstance(value, (list, tuple, range))}
+            length = max((len(col) for col in columns.values()), default=1)
+            return [self.evaluate({name: columns[name][i] if name in columns else values[name]
+                                   for name in self.names}) for i in range(length)]
+
+        ns = self._numpy_namespace()
+        for name in self.names:
+            arr = np.asarray(values[name])
+            if arr.dtype.kind not in "ui":
+                raise ValueError(f"{name}: nur ganze Zahlen erlaubt")
+            ns[name] = arr.astype(np.uint64, copy=False) & ns["_M"]
+        # uint64 läuft bei +, -, * absichtlich über; Warnungen nur für Skalare
+        with np.errstate(over="ignore"):
+            result = eval(self.code, ns)
+        shape = np.broadcast_shapes(*(np.shape(value) for value in values.values()))
+        return np.broadcast_to(np.asarray(result, dtype=np.uint64), shape).copy()
+
+    @staticmethod
+    def parse_value(text: str) -> int:
+        """Parses '42', '0x2A', '0b101010' or '0o52'. Raises ValueError."""
+        value = int(text.strip().replace("_", ""), 0)
+        if value < 0:
+            raise ValueError(f"Negativer Wert: {text}")
+        return value
+
+    @classmethod
+    def parse_assignments(cls, text: str) -> dict:
+        """Parses 'x=0x12, y=3' into {'x': 18, 'y': 3}. Raises ValueError."""
+        values = {}
+        for part in re.split(r"[,;\s]+", text.strip()):
+            if not part:
+                continue
+            name, sep, value = part.partition("=")
+            if not sep or not name.isidentifier() or name.startswith("_"):
+                raise ValueError(f"Erwartet name=wert: {part}")
+            values[name] = cls.parse_value(value)
+        return values
+
+    @classmethod
+    @profiled
+    def load_values(cls, path: str, width: int, progress=None):
+        """Loads register samples: raw little-endian words of the given width
+        for .bin/.dump files, otherwise text with one value per line (dec/0x/0b).
+        progress((done, total)) is called per chunk."""
+        total = os.path.getsize(path)
+        if path.lower().endswith((".bin", ".dump")):
+            size = width // 8
+            if np is not None:
+                values = np.fromfile(path, dtype=f"<u{size}", count=total // size)
+            else:
+                with open(path, "rb") as f:
+                    data = f.read(total - total % size)
+                values = [int.from_bytes(data[i:i + size], "little") for i in range(0, len(data), size)]
+            if progress:
+                progress((total, total))
+            return values
+
+        parts = []
+        with open(path, encoding="utf-8", errors="replace") as f:
+            while True:
+                lines = f.readlines(cls.CHUNK_LINES * 16)
+                if not lines:
+                    break
+                chunk = []
+                for line in lines:
+                    line = line.split("#", 1)[0].strip()
+                    if line:
+                        try:
+                            chunk.append(cls.parse_value(line))
+                        except ValueError:
+                            raise ValueError(f"Ungültiger Wert: {line[:40]}") from None
+                if chunk and max(chunk) >> 64:
+                    raise ValueError("Wert größer als 64 Bit")
+                parts.append(np.array(chunk, dtype=np.uint64) if np is not None else chunk)
+                if progress:
+                    progress((f.tell(), total))
+        if np is not None:
+            return np.concatenate(parts) if parts else np.zeros(0, dtype=np.uint64)
+        return [value for chunk in parts for value in chunk]
+
+    def result_rows(self, values, results):
+        """(x, ergebnis, hex) rows for ResultExporter, converted chunk by chunk."""
+        digits = self.width // 4
+        for start in range(0, len(results), self.CHUNK_LINES):
+            xs = values[start:start + self.CHUNK_LINES]
+            rs = results[start:start + self.CHUNK_LINES]
+            if np is not None:
+                xs, rs = xs.tolist(), rs.tolist()
+            for x, r in zip(xs, rs):
+                yield x, r, f"{r:0{digits}X}"
@@ -0,0 +1,350 @@
+import ipaddress
+import functools
+import gzip
+import io
+import socket
+import struct
+from array import array
+import time
+
+try:
+    import numpy as np  # Optional: beschleunigt Prüfsummen und Massenauswertungen
+except ImportError:
+    np = None
+
+from .profiler import profiled
+
+
+class NetworkEngine:
+    """
+    Core logic for IPv4 subnet calculations.
+    """
+    SUBNET_COLUMNS = ("nr", "netzwerk", "erste_ip", "letzte_ip", "broadcast", "hosts")
+
+    @profiled
+    def calculate(self, ip_str: str, cidr: int) -> dict:
+        """Calculates network data for ip_str/cidr. Raises ValueError on invalid input."""
+        if not 0 <= cidr <= 32:
+            raise ValueError(f"Ungültiger CIDR-Wert: {cidr}")
+        ip = int(ipaddress.IPv4Address(ip_str))
+
+        mask = (0xFFFFFFFF << (32 - cidr)) & 0xFFFFFFFF
+        net = ip & mask
+        broadcast = net | (~mask & 0xFFFFFFFF)
+        num_addresses = 1 << (32 - cidr)
+        num_hosts = num_addresses - 2 if num_addresses > 2 else 0
+
+        return {
+            "network": self.int_to_ip(net),
+            "netmask": self.int_to_ip(mask),
+            "broadcast": self.int_to_ip(broadcast),
+            "num_hosts": num_hosts,
+            "first_host": self.int_to_ip(net + 1) if num_hosts > 0 else None,
+            "last_host": self.int_to_ip(broadcast - 1) if num_hosts > 0 else None,
+            "bin_ip": self.format_bin(ip),
+            "bin_mask": self.format_bin(mask),
+            "bin_net": self.format_bin(net),
+        }
+
+    def iter_subnets(self, ip_str: str, cidr: int, new_cidr: int):
+        """Returns a lazy iterator over SUBNET_COLUMNS rows for the network split into /new_cidr subnets."""
+        if not 0 <= cidr <= new_cidr <= 32:
+            raise ValueError(f"Ziel-CIDR muss zwischen /{cidr} und /32 liegen")
+        base = int(ipaddress.IPv4Address(ip_str)) & ((0xFFFFFFFF << (32 - cidr)) & 0xFFFFFFFF)
+        return self._subnet_rows(base, cidr, new_cidr)
+
+    def _subnet_rows(self, base: int, cidr: int, new_cidr: int):
+        size = 1 << (32 - new_cidr)
+        num_hosts = size - 2 if size > 2 else 0
+        suffix = f"/{new_cidr}"
+        # inet_ntoa/pack is about twice as fast as formatting the octets by hand
+        ntoa, pack = socket.inet_ntoa, struct.Struct(">I").pack
+
+        net = base
+        for nr in range(1, (1 << (new_cidr - cidr)) + 1):
+            broadcast = net + size - 1
+            if num_hosts:
+                yield (nr, ntoa(pack(net)) + suffix, ntoa(pack(net + 1)),
+                       ntoa(pack(broadcast - 1)), ntoa(pack(broadcast)), num_hosts)
+            else:
+                yield (nr, ntoa(pack(net)) + suffix, "N/A", "N/A", ntoa(pack(broadcast)), 0)
+            net += size
+
+    @staticmethod
+    def int_to_ip(value: int) -> str:
+        """Formats a 32-bit integer as dotted quad."""
+        return f"{value >> 24}.{(value >> 16) & 0xFF}.{(value >> 8) & 0xFF}.{value & 0xFF}"
+
+    @staticmethod
+    def format_bin(value: int) -> str:
+        """Formats a 32-bit integer as dotted binary octets."""
+        b = f"{value:032b}"
+        return ".".join([b[i:i+8] for i in range(0, 32, 8)])
+
+
+class AddressSpaceMap:
+    """
+    Auslastung eines IPv4-Blocks (/8 bis /24), ein Bit pro Adresse.
+    Heatmap entlang einer Hilbert-Kurve. Benötigt numpy.
+    """
+    MIN_PREFIX, MAX_PREFIX = 8, 24
+    MIN_VIEW_BITS = 8  # kleinste Ansicht: /24 (16x16 Zellen)
+    MAX_CELL_BITS = 16  # höchstens 256x256 Zellen
+
+    def __init__(self, network: str):
+        if np is None:
+            raise ValueError("Die Heatmap benötigt numpy (pip install numpy)")
+        try:
+            net = ipaddress.IPv4Network(network.strip(), strict=False)
+        except ValueError:
+            raise ValueError(f"Ungültiges Netz: {network}")
+        if not self.MIN_PREFIX <= net.prefixlen <= self.MAX_PREFIX:
+            raise ValueError(f"Netz muss zwischen /{self.MIN_PREFIX} und /{self.MAX_PREFIX} liegen")
+        self.base = int(net.network_address)
+        self.prefix = net.prefixlen
+        self.size = 1 << (32 - self.prefix)
+        self.bits = np.zeros(self.size // 8, dtype=np.uint8)
+        self._popcount = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    @staticmethod
+    def parse_allocations(lines) -> tuple:
+        """Parses 'a.b.c.d' or 'a.b.c.d/len' lines into (starts, ends) int64 arrays (end exclusive)."""
+        starts = array("q")
+        ends = array("q")
+        for line_no, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            addr, _, length = line.partition("/")
+            try:
+                start = struct.unpack("!I", socket.inet_aton(addr.strip()))[0]
+                length = int(length) if length else 32
+                if addr.count(".") != 3 or not 0 <= length <= 32:
+                    raise ValueError
+            except (OSError, ValueError):
+                raise ValueError(f"Zeile {line_no}: ungültige Adresse/Präfix '{line}'")
+            size = 1 << (32 - length)
+            start &= ~(size - 1)
+            starts.append(start)
+            ends.append(start + size)
+        return np.frombuffer(starts, dtype=np.int64), np.frombuffer(ends, dtype=np.int64)
+
+    @profiled
+    def mark(self, starts, ends):
+        """Rebuilds the bitmap from allocation intervals [start, end)."""
+        starts = np.clip(np.asarray(starts, dtype=np.int64) - self.base, 0, self.size)
+        ends = np.clip(np.asarray(ends, dtype=np.int64) - self.base, 0, self.size)
+        keep = ends > starts
+        starts, ends = starts[keep], ends[keep]
+        bitmap = np.zeros(self.size, dtype=np.int8)
+        if len(starts):
+            # Überlappende/angrenzende Intervalle verschmelzen, damit die
+            # Differenzen nur +1/-1 sind und in int8 passen
+            order = np.argsort(starts, kind="stable")
+            starts, ends = starts[order], np.maximum.accumulate(ends[order])
+            new_group = np.empty(len(starts), dtype=bool)
+            new_group[0] = True
+            new_group[1:] = starts[1:] > ends[:-1]
+            group_starts = starts[new_group]
+            group_ends = ends[np.append(np.flatnonzero(new_group)[1:] - 1, len(ends) - 1)]
+            bitmap[group_starts] += 1
+            bitmap[group_ends[group_ends < self.size]] -= 1
+            np.cumsum(bitmap, dtype=np.int8, out=bitmap)
+        self.bits = np.packbits(bitmap.view(bool))
+
+    def used(self) -> int:
+        return int(self._popcount[self.bits].sum(dtype=np.int64))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def hilbert_layout(side: int):
+        """(x, y) of every position d on a Hilbert curve filling side x side cells."""
+        d = np.arange(side * side, dtype=np.int64)
+        x = np.zeros_like(d)
+        y = np.zeros_like(d)
+        t = d.copy()
+        s = 1
+        while s < side:
+            rx = 1 & (t // 2)
+            ry = 1 & (t ^ rx)
+            # Quadrant drehen/spiegeln
+            flip = (ry == 0) & (rx == 1)
+            x = np.where(flip, s - 1 - x, x)
+            y = np.where(flip, s - 1 - y, y)
+            swap = ry == 0
+            x, y = np.where(swap, y, x), np.where(swap, x, y)
+            x += s * rx
+            y += s * ry
+            t //= 4
+            s *= 2
+        return x, y
+
+    def view_shape(self, view_prefix: int) -> tuple:
+        """(side, addresses per cell) for a view of the given prefix length."""
+        host_bits = 32 - view_prefix
+        cell_bits = min(self.MAX_CELL_BITS, host_bits)
+        cell_bits -= cell_bits % 2
+        return 1 << (cell_bits // 2), 1 << (host_bits - cell_bits)
+
+    @profiled
+    def heatmap(self, view_base: int, view_prefix: int):
+        """Utilization (0..1) per cell as a side x side float array for the view prefix."""
+        if not self.prefix <= view_prefix <= 32 - self.MIN_VIEW_BITS:
+            raise ValueError("Ansicht liegt außerhalb des Netzes")
+        side, per_cell = self.view_shape(view_prefix)
+        offset = (view_base - self.base) // 8
+        region = self.bits[offset:offset + (1 << (32 - view_prefix)) // 8]
+        if per_cell >= 8:
+            counts = self._popcount[region].reshape(side * side, per_cell // 8).sum(axis=1, dtype=np.int64)
+        else:
+            counts = np.unpackbits(region).reshape(side * side, per_cell).sum(axis=1, dtype=np.int64)
+        x, y = self.hilbert_layout(side)
+        grid = np.empty((side, side), dtype=np.float64)
+        grid[y, x] = counts / per_cell
+        return grid
+
+    def cell_prefix(self, view_base: int, view_prefix: int, col: int, row: int) -> tuple:
+        """(first address, prefix length) of the cell at col/row of a view."""
+        side, per_cell = self.view_shape(view_prefix)
+        x, y = self.hilbert_layout(side)
+        d = int(np.flatnonzero((x == col) & (y == row))[0])
+        return view_base + d * per_cell, 32 - per_cell.bit_length() + 1
+
+    @staticmethod
+    def to_ppm(grid) -> bytes:
+        """Binary PPM (P6) with empty cells dark gray and used cells from blue to red."""
+        level = np.rint(grid * 255).astype(np.uint8)
+        ramp = np.linspace(0, 1, 256)
+        lut = np.stack([np.interp(ramp, [0, 0.5, 1], [31, 240, 220]),
+                        np.interp(ramp, [0, 0.5, 1], [106, 200, 40]),
+                        np.interp(ramp, [0, 0.5, 1], [165, 60, 40])], axis=1).astype(np.uint8)
+        rgb = lut[level]
+        rgb[grid == 0] = (45, 45, 45)
+        height, width = grid.shape
+        return f"P6 {width} {height} 255\n".encode("ascii") + rgb.tobytes()
+
+
+class ZoneGenerator:
+    """
+    PTR-Records, hosts-Einträge oder DHCP-Deklaration für ein IPv4/IPv6-Netz,
+    gestreamt in eine Datei.
+    """
+    FORMATS = {"PTR (Reverse-Zone)": "ptr", "hosts-Datei": "hosts", "DHCP (ISC dhcpd)": "dhcp"}
+    FILETYPES = [("Zonendatei", "*.zone"), ("Text", "*.txt"), ("gzip", "*.gz"), ("Alle Dateien", "*.*")]
+    CHUNK_LINES = 8192
+    MAX_RECORDS = 1 << 32  # IPv6 /64 & Co. nur mit Begrenzung
+
+    def __init__(self, network: str, domain: str = "example.com", template: str = "host-{ip}", limit: int = None):
+        try:
+            self.net = ipaddress.ip_network(network.strip(), strict=False)
+        except ValueError:
+            raise ValueError(f"Ungültiges Netz: {network}")
+        self.domain = domain.strip().strip(".")
+        if not self.domain:
+            raise ValueError("Domain fehlt")
+        try:
+            template.format(ip="1-2-3-4", n=1)
+        except (KeyError, IndexError, ValueError):
+            raise ValueError("Vorlage darf nur {ip} und {n} enthalten")
+        self.template = template
+
+        self.v6 = self.net.version == 6
+        first = int(self.net.network_address)
+        last = int(self.net.broadcast_address)
+        if self.v6:
+            if self.net.prefixlen < 128:
+                first += 1  # Subnet-Router-Anycast auslassen
+        elif self.net.prefixlen < 31:
+            first, last = first + 1, last - 1
+        self.first = first
+        self.total = last - first + 1
+        if limit is not None:
+            if limit < 1:
+                raise ValueError("Anzahl muss mind. 1 sein")
+            self.total = min(self.total, limit)
+        if self.total > self.MAX_RECORDS:
+            raise ValueError("Zu viele Adressen, bitte Anzahl begrenzen")
+
+        # Reverse-Zone auf Oktett-/Nibble-Grenze; Records relativ dazu
+        if self.v6:
+            self._origin_digits = self.net.prefixlen // 4
+            digits = f"{int(self.net.network_address):032x}"[:self._origin_digits]
+            self.origin = ".".join(reversed(digits)) + ".ip6.arpa." if digits else "ip6.arpa."
+        else:
+            self._origin_digits = self.net.prefixlen // 8
+            octets = str(self.net.network_address).split(".")[:self._origin_digits]
+            self.origin = ".".join(reversed(octets)) + ".in-addr.arpa." if octets else "in-addr.arpa."
+
+    def format_ip(self, value: int) -> str:
+        if self.v6:
+            return socket.inet_ntop(socket.AF_INET6, value.to_bytes(16, "big"))
+        return socket.inet_ntoa(struct.pack("!I", value))
+
+    def reverse_label(self, value: int) -> str:
+        """Record name relative to self.origin."""
+        if self.v6:
+            return ".".join(f"{value:032x}"[self._origin_digits:][::-1])
+        return ".".join(reversed(socket.inet_ntoa(struct.pack("!I", value)).split(".")[self._origin_digits:]))
+
+    def header(self, fmt: str) -> str:
+        comment = ";" if fmt == "ptr" else "#"
+        count = f"{self.total:,}".replace(",", ".")
+        lines = [f"{comment} {self.net} ({count} Adressen), erzeugt vom FISI Toolkit"]
+        if fmt == "ptr":
+            serial = time.strftime("%Y%m%d01")
+            lines += ["$TTL 3600", f"$ORIGIN {self.origin}",
+                      f"@\tIN\tSOA\tns1.{self.domain}. hostmaster.{self.domain}. ( {serial} 3600 900 604800 3600 )",
+                      f"@\tIN\tNS\tns1.{self.domain}."]
+        return "\n".join(lines) + "\n"
+
+    def dhcp_block(self) -> str:
+        first, last = self.first, self.first + self.total - 1
+        if self.v6:
+            return (f"subnet6 {self.net} {{\n"
+                    f"    range6 {self.format_ip(first)} {self.format_ip(last)};\n"
+                    f"    option dhcp6.domain-search \"{self.domain}\";\n}}\n")
+        # Erste Adresse als Gateway, Rest als Pool
+        pool_first = first + 1 if self.total > 1 else first
+        return (f"subnet {self.net.network_address} netmask {self.net.netmask} {{\n"
+                f"    range {self.format_ip(pool_first)} {self.format_ip(last)};\n"
+                f"    option routers {self.format_ip(first)};\n"
+                f"    option domain-name \"{self.domain}\";\n}}\n")
+
+    def iter_chunks(self, fmt: str):
+        """Lazily yields (text, records) chunks of CHUNK_LINES records."""
+        if fmt == "dhcp":
+            yield self.dhcp_block(), 1
+            return
+        if fmt not in ("ptr", "hosts"):
+            raise ValueError(f"Unbekanntes Format: {fmt}")
+        template, domain = self.template, self.domain
+        format_ip, reverse_label = self.format_ip, self.reverse_label
+        sep = ":" if self.v6 else "."
+        for chunk_start in range(0, self.total, self.CHUNK_LINES):
+            lines = []
+            for n in range(chunk_start + 1, min(chunk_start + self.CHUNK_LINES, self.total) + 1):
+                value = self.first + n - 1
+                ip = format_ip(value)
+                host = template.format(ip=ip.replace(sep, "-").strip("-"), n=n)
+                if fmt == "ptr":
+                    lines.append(f"{reverse_label(value)}\tIN\tPTR\t{host}.{domain}.\n")
+                else:
+                    lines.append(f"{ip}\t{host}.{domain}\t{host}\n")
+            yield "".join(lines), len(lines)
+
+    @profiled
+    def write(self, path: str, fmt: str, progress=None, buffer_size: int = 1 << 20) -> int:
+        """Writes header and records to path (gzip if it ends in .gz); returns the record count.
+        progress((done, total)) is called after every chunk."""
+        total = 1 if fmt == "dhcp" else self.total
+        done = 0
+        with open(path, "wb", buffering=buffer_size) as raw:
+            stream = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) if path.lower().endswith(".gz") else raw
+            with io.TextIOWrapper(stream, encoding="utf-8", newline="\n") as text:
+                text.write(self.header(fmt))
+                for chunk, count in self.iter_chunks(fmt):
+                    text.write(chunk)
+                    done += count
+                    if progress:
+                        progress((done, total))
+        return done
@@ -0,0 +1,19 @@
+import os
+import sys
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+
+    return os.path.join(base_path, relative_path)
+
+def app_data_path(filename):
+    """ Get path inside the per-user data folder (~/.fisi_toolkit), created on demand """
+    base_path = os.path.join(os.path.expanduser("~"), ".fisi_toolkit")
+    os.makedirs(base_path, exist_ok=True)
+    return os.path.join(base_path, filename)
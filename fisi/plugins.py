@@ -0,0 +1,88 @@
+import importlib
+import importlib.metadata
+import logging
+from typing import NamedTuple
+
+log = logging.getLogger(__name__)
+
+
+class TabSpec(NamedTuple):
+    """Eintrag in der Sidebar. factory: Frame-Klasse oder 'modul:Klasse'."""
+    name: str
+    label: str
+    icon: str
+    order: int
+    factory: object
+    section: str = "tools"  # "tools" oben, "bottom" unten (Einstellungen/Info)
+
+
+class TabRegistry:
+    """
+    Eingebaute Tabs plus Plugins aus der Entry-Point-Gruppe 'fisi_toolkit.tabs'.
+    Der Entry Point zeigt auf ein Metadaten-Dict, z.B. in pyproject.toml:
+
+        [project.entry-points."fisi_toolkit.tabs"]
+        vlsm = "my_tools.meta:VLSM_TAB"
+
+    mit VLSM_TAB = {"label": "VLSM", "icon": "🧮", "order": 45, "factory": "my_tools.vlsm:VlsmTab"}.
+    Das Modul der factory wird erst beim ersten Öffnen des Tabs importiert.
+    """
+    GROUP = "fisi_toolkit.tabs"
+    PLUGIN_ORDER = 100
+
+    @staticmethod
+    def builtin() -> list:
+        return [
+            TabSpec("converter", "Einheiten", "📏", 10, "fisi.tabs.converter:UnitConverterTab"),
+            TabSpec("logic", "Logik", "🧠", 30, "fisi.tabs.logic:LogicTab"),
+            TabSpec("network", "Netzwerk", "🌐", 40, "fisi.tabs.network:NetworkTab"),
+            TabSpec("storage", "Speicher", "💾", 50, "fisi.tabs.storage:StorageTab"),
+            TabSpec("osi", "OSI-Modell", "📚", 60, "fisi.tabs.osi:OSITab"),
+            TabSpec("settings", "Einstellungen", "⚙️", 10, "fisi.tabs.settings:SettingsTab", "bottom"),
+            TabSpec("info", "Info", "ℹ️", 20, "fisi.tabs.info:InfoTab", "bottom"),
+        ]
+
+    @classmethod
+    def entry_points(cls) -> list:
+        eps = importlib.metadata.entry_points()
+        # Python 3.10+: select(); 3.8/3.9: dict nach Gruppen
+        return list(eps.select(group=cls.GROUP) if hasattr(eps, "select") else eps.get(cls.GROUP, []))
+
+    @classmethod
+    def spec_from_metadata(cls, name: str, meta) -> TabSpec:
+        """Validates plugin metadata. Raises ValueError."""
+        if not isinstance(meta, dict) or not meta.get("label") or ":" not in str(meta.get("factory", "")):
+            raise ValueError("erwartet dict mit 'label' und 'factory' ('modul:Klasse')")
+        section = meta.get("section", "tools")
+        if section not in ("tools", "bottom"):
+            raise ValueError(f"unbekannte section: {section}")
+        return TabSpec(name, str(meta["label"]), str(meta.get("icon", "🧩")),
+                       int(meta.get("order", cls.PLUGIN_ORDER)), meta["factory"], section)
+
+    @classmethod
+    def discover(cls) -> list:
+        """All tab specs sorted by section and order. Broken plugins are skipped."""
+        specs = cls.builtin()
+        names = {spec.name for spec in specs}
+        for ep in cls.entry_points():
+            try:
+                if ep.name in names:
+                    raise ValueError("Name bereits vergeben")
+                spec = cls.spec_from_metadata(ep.name, ep.load())
+            except Exception as e:
+                log.warning("Plugin '%s' ignored: %s", ep.name, e)
+                continue
+            specs.append(spec)
+            names.add(spec.name)
+        return sorted(specs, key=lambda spec: (spec.section == "bottom", spec.order))
+
+    @staticmethod
+    def load_factory(spec: TabSpec):
+        """Returns the frame class, importing 'module:Class' factories on demand."""
+        if not isinstance(spec.factory, str):
+            return spec.factory
+        module_name, _, attr = spec.factory.partition(":")
+        obj = importlib.import_module(module_name)
+        for part in attr.split("."):
+            obj = getattr(obj, part)
+        return obj
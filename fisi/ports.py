@@ -0,0 +1,64 @@
+import bisect
+import gzip
+import re
+from collections.abc import Sequence
+
+from .paths import resource_path
+from .profiler import profiled
+
+
+class PortIndex:
+    """
+    Protokoll-/Port-Verzeichnis (IANA, mit OSI-Schicht) aus ports.tsv.gz.
+    """
+    FILE = "ports.tsv.gz"
+    LAYER_NAMES = {7: "Anwendung", 6: "Darstellung", 5: "Sitzung", 4: "Transport",
+                   3: "Vermittlung", 2: "Sicherung", 1: "Bitübertragung"}
+    _LAYER_QUERY = re.compile(r"(?:l|layer|schicht)\s*([1-7])")
+
+    def __init__(self, entries: list):
+        # entry: (port or None, proto, name, aliases, layer, description)
+        self.entries = entries
+        pairs = []
+        self.by_layer = {layer: [] for layer in self.LAYER_NAMES}
+        for i, (port, _, name, aliases, layer, _) in enumerate(entries):
+            pairs.append((name.lower(), i))
+            pairs.extend((alias.lower(), i) for alias in aliases.split())
+            if port is not None:
+                pairs.append((str(port), i))
+            self.by_layer[layer].append(i)
+        pairs.sort()
+        self._keys = [key for key, _ in pairs]
+        self._ids = [i for _, i in pairs]
+
+    @classmethod
+    @profiled
+    def load(cls, path: str = None) -> "PortIndex":
+        entries = []
+        with gzip.open(path or resource_path(cls.FILE), "rt", encoding="utf-8") as f:
+            for line in f:
+                port, proto, name, aliases, layer, desc = line.rstrip("\n").split("\t")
+                entries.append((int(port) if port else None, proto, name, aliases, int(layer), desc))
+        return cls(entries)
+
+    @profiled
+    def search(self, query: str) -> Sequence[int]:
+        """Entry ids matching a name/alias/port prefix or a layer ('L4', 'Schicht 4').
+        An empty query returns a range over all entries instead of copying them."""
+        q = query.strip().lower()
+        if not q:
+            return range(len(self.entries))
+        match = self._LAYER_QUERY.fullmatch(q)
+        if match:
+            return list(self.by_layer[int(match.group(1))])
+        lo = bisect.bisect_left(self._keys, q)
+        hi = bisect.bisect_left(self._keys, q + "\uffff", lo)
+        # Gleiche Einträge über Name und Alias nur einmal
+        return list(dict.fromkeys(self._ids[lo:hi]))
+
+    def format_entry(self, i: int) -> str:
+        port, proto, name, aliases, layer, desc = self.entries[i]
+        port_str = f"{port}/{proto}" if port is not None else "-"
+        if aliases:
+            desc = f"{desc} ({aliases})" if desc else aliases
+        return f"{port_str:>10}  {name:<22} L{layer} {self.LAYER_NAMES[layer]:<14} {desc}"
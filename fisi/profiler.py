@@ -0,0 +1,170 @@
+import os
+import sys
+import contextlib
+import functools
+import json
+import threading
+import tracemalloc
+
+try:
+    import numpy as np  # Optional: beschleunigt Prüfsummen und Massenauswertungen
+except ImportError:
+    np = None
+
+
+class MemoryProfiler:
+    """
+    Speicher-Messung mit tracemalloc (opt-in): Peak und behaltener Speicher
+    je Tab-Aufbau und je Engine-Operation (@profiled), dazu die größten
+    Allokationsstellen. Erfasst nur Python-Objekte, nicht Tcl/Tk.
+    """
+    TOP_SITES = 10
+    SNAPSHOT_CALLS = 1
+    active = None  # eingeschalteter Profiler, wird von @profiled gelesen
+
+    def __init__(self):
+        self.entries = {}  # (kind, name) -> dict
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._running = []  # laufende Messungen aller Threads
+
+    # --- Ein/Aus ---------------------------------------------------------
+
+    def enable(self):
+        if self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        MemoryProfiler.active = self
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+        if MemoryProfiler.active is self:
+            MemoryProfiler.active = None
+        tracemalloc.stop()
+        self.enabled = False
+
+    def reset(self):
+        self.entries.clear()
+
+    # --- Messung ---------------------------------------------------------
+
+    def _fold_peak(self) -> int:
+        """Credits the peak since the last reset to every running measurement,
+        resets it and returns the current traced size. Caller holds _lock."""
+        current, peak = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        else:
+            peak = current
+        for run in self._running:
+            run["peak"] = max(run["peak"], peak)
+        return current
+
+    @contextlib.contextmanager
+    def measure(self, kind: str, name: str):
+        """Records peak/retained bytes of the block. Nested measurements are
+        recorded on their own and also count towards the outer one; overlaps
+        with measurements of other threads are counted as "concurrent".
+        Allocation sites are only taken for top-level measurements."""
+        if not self.enabled:
+            yield
+            return
+        entry = self.entries.get((kind, name))
+        # Snapshots belegen selbst Speicher, daher nur ohne umgebende Messung
+        first_calls = entry is None or entry["calls"] < self.SNAPSHOT_CALLS
+        before_snapshot = tracemalloc.take_snapshot() if first_calls and not self._running else None
+        thread = threading.get_ident()
+        with self._lock:
+            before = self._fold_peak()
+            run = {"thread": thread, "before": before, "peak": before, "concurrent": False}
+            for other in self._running:
+                if other["thread"] != thread:
+                    other["concurrent"] = run["concurrent"] = True
+            self._running.append(run)
+        try:
+            yield
+        finally:
+            with self._lock:
+                # Während der Messung ausgeschaltet: nichts aufzeichnen
+                tracing = tracemalloc.is_tracing()
+                after = self._fold_peak() if tracing else 0
+                self._running.remove(run)
+            if tracing:
+                self._record(kind, name, run["peak"] - before, after - before, before_snapshot, run["concurrent"])
+
+    def _record(self, kind, name, peak, retained, before_snapshot, concurrent=False):
+        entry = self.entries.setdefault((kind, name), {
+            "kind": kind, "name": name, "calls": 0, "concurrent": 0, "peak": 0, "retained": 0,
+            "retained_total": 0, "top_peak": 0, "top": []})
+        entry["calls"] += 1
+        entry["concurrent"] += concurrent
+        entry["retained"] = retained
+        entry["retained_total"] += retained
+        if peak >= entry["peak"]:
+            entry["peak"] = peak
+        if before_snapshot is not None and peak >= entry["top_peak"]:
+            # Allokationsstellen vom teuersten der ersten Aufrufe
+            entry["top_peak"] = peak
+            # Erst nach dem Gruppieren filtern; filter_traces() ist pro Block in Python und viel langsamer
+            stats = [s for s in tracemalloc.take_snapshot().compare_to(before_snapshot, "lineno")
+                     if s.size_diff and s.traceback[0].filename != tracemalloc.__file__]
+            entry["top"] = [{"site": f"{os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}",
+                             "size_diff": s.size_diff, "count_diff": s.count_diff}
+                            for s in stats[:self.TOP_SITES]]
+
+    # --- Bericht ---------------------------------------------------------
+
+    def report(self) -> dict:
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        entries = sorted(self.entries.values(), key=lambda e: (e["kind"], -e["peak"]))
+        return {"python": sys.version.split()[0], "numpy": np.__version__ if np is not None else None,
+                "traced_current": current, "traced_peak": peak,
+                "entries": [dict(e, top=list(e["top"])) for e in entries]}
+
+    def dump(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    @staticmethod
+    def format_bytes(size: int) -> str:
+        sign = "-" if size < 0 else ""
+        size = abs(size)
+        for unit in ("B", "KiB", "MiB"):
+            if size < 1024:
+                return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+            size /= 1024
+        return f"{sign}{size:.1f} GiB"
+
+    def format_report(self, report: dict = None, top: int = 3) -> str:
+        report = report or self.report()
+        fmt = self.format_bytes
+        lines = [f"{'Tab/Operation':<38} {'Aufrufe':>7} {'Peak':>11} {'Behalten':>11}"]
+        for e in report["entries"]:
+            label = f"{'Tab' if e['kind'] == 'tab' else 'Op'}  {e['name']}" + (" *" if e["concurrent"] else "")
+            lines.append(f"{label:<38} {e['calls']:>7} {fmt(e['peak']):>11} {fmt(e['retained']):>11}")
+        if not report["entries"]:
+            lines.append("(noch keine Messungen)")
+        if any(e["concurrent"] for e in report["entries"]):
+            lines.append("* lief teilweise gleichzeitig mit Messungen anderer Threads, Werte enthalten deren Speicher")
+        lines.append(f"\nGesamt verfolgt: {fmt(report['traced_current'])} (Peak {fmt(report['traced_peak'])})")
+        for e in sorted(report["entries"], key=lambda e: -e["peak"])[:top]:
+            lines.append(f"\nBehaltene Allokationen {e['name']} (Peak {fmt(e['peak'])}):")
+            lines.extend(f"  {fmt(s['size_diff']):>11}  {s['count_diff']:>7} Blöcke  {s['site']}" for s in e["top"][:5])
+        return "\n".join(lines)
+
+
+def profiled(func):
+    """Measures every call as operation 'Class.method' while a MemoryProfiler is enabled."""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = MemoryProfiler.active
+        if profiler is None:
+            return func(*args, **kwargs)
+        with profiler.measure("op", name):
+            return func(*args, **kwargs)
+    return wrapper
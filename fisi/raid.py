@@ -0,0 +1,259 @@
+import heapq
+import itertools
+import math
+import re
+
+try:
+    import numpy as np  # Optional: beschleunigt Prüfsummen und Massenauswertungen
+except ImportError:
+    np = None
+
+from .profiler import profiled
+
+
+class RaidEngine:
+    """
+    Core logic for RAID capacity calculations (sizes in GB).
+    """
+    LEVELS = ["RAID 0", "RAID 1", "RAID 5", "RAID 6", "RAID 10", "RAID 50", "RAID 60"]
+    MAX_DISKS = 1024  # Obergrenze je Verbund, auch für Spans
+    SWEEP_COLUMNS = ("raid", "disks", "size_gb", "brutto_gb", "netto_gb", "effizienz_pct", "ausfallsicherheit")
+    OPTIMIZE_COLUMNS = ("raid", "spans", "sku", "disks", "size_gb", "netto_gb", "ausfallsicherheit", "preis", "preis_pro_tb")
+    # Disk failures every array of the level survives (worst case); RAID 1 survives n-1
+    GUARANTEED_FAILURES = {"RAID 0": 0, "RAID 5": 1, "RAID 6": 2, "RAID 10": 1, "RAID 50": 1, "RAID 60": 2}
+
+    @profiled
+    def calculate(self, raid_type: str, num_disks: int, size_disk: float, spans: int = 2) -> dict:
+        """Returns brutto/netto capacity, efficiency, fault tolerance and formula. Raises ValueError."""
+        if size_disk <= 0:
+            raise ValueError("Größe muss größer 0 sein")
+        if num_disks > self.MAX_DISKS:
+            raise ValueError(f"Max. {self.MAX_DISKS} Disks")
+        return self.calculate_sizes(raid_type, [size_disk] * num_disks, spans)
+
+    def _validate(self, raid_type: str, num_disks: int, spans: int):
+        if num_disks > self.MAX_DISKS or spans > self.MAX_DISKS:
+            raise ValueError(f"Max. {self.MAX_DISKS} Disks")
+        if raid_type in ("RAID 0", "RAID 1"):
+            if num_disks < 2: raise ValueError("Min. 2 Disks")
+        elif raid_type == "RAID 5":
+            if num_disks < 3: raise ValueError("Min. 3 Disks")
+        elif raid_type == "RAID 6":
+            if num_disks < 4: raise ValueError("Min. 4 Disks")
+        elif raid_type == "RAID 10":
+            if num_disks < 4 or num_disks % 2 != 0: raise ValueError("Min. 4 Disks, gerade Anzahl")
+        elif raid_type in ("RAID 50", "RAID 60"):
+            min_span = 3 if raid_type == "RAID 50" else 4
+            if spans < 2 or num_disks % spans != 0 or num_disks // spans < min_span:
+                raise ValueError(f"Min. 2 Spans zu je {min_span} Disks, Disks durch Spans teilbar")
+        else:
+            raise ValueError(f"Unbekanntes RAID Level: {raid_type}")
+
+    @staticmethod
+    def set_shape(raid_type: str, num_disks: int, spans: int) -> tuple:
+        """(sets, disks per set): RAID 10 mirrors pairs, RAID 50/60 stripe over spans,
+        all other levels form one set. Disks are assigned to sets in the given order."""
+        if raid_type == "RAID 10":
+            return num_disks // 2, 2
+        if raid_type in ("RAID 50", "RAID 60"):
+            return spans, num_disks // spans
+        return 1, num_disks
+
+    @profiled
+    def calculate_sizes(self, raid_type: str, sizes: list, spans: int = 2) -> dict:
+        """Like calculate() for per-disk sizes; adds the wasted capacity per disk."""
+        if any(size <= 0 for size in sizes):
+            raise ValueError("Größe muss größer 0 sein")
+        num_disks = len(sizes)
+        self._validate(raid_type, num_disks, spans)
+
+        sets, per_set = self.set_shape(raid_type, num_disks, spans)
+        used = min(min(sizes[i * per_set:(i + 1) * per_set]) for i in range(sets))
+        net_capacity = self._data_disks(raid_type, num_disks, spans) * used
+        size_txt = f"{used:g} GB" if min(sizes) == max(sizes) else f"{used:g} GB (kleinste Disk)"
+
+        if raid_type == "RAID 0":
+            fault_tolerance = "Keine (0 Disks)"
+            formula = f"{num_disks} * {size_txt} = {net_capacity:g} GB"
+        elif raid_type == "RAID 1":
+            fault_tolerance = f"{num_disks-1} Disks (Spiegelung)"
+            formula = f"{size_txt} (Spiegelung)"
+        elif raid_type == "RAID 5":
+            fault_tolerance = "1 Disk"
+            formula = f"({num_disks} - 1) * {size_txt} = {net_capacity:g} GB"
+        elif raid_type == "RAID 6":
+            fault_tolerance = "2 Disks"
+            formula = f"({num_disks} - 2) * {size_txt} = {net_capacity:g} GB"
+        elif raid_type == "RAID 10":
+            fault_tolerance = "Bis zu n/2 (Sub-Array)"
+            formula = f"({num_disks} / 2) * {size_txt} = {net_capacity:g} GB"
+        else:
+            parity = 1 if raid_type == "RAID 50" else 2
+            fault_tolerance = f"{parity} Disk{'s' if parity > 1 else ''} pro Span (bis zu {parity * spans})"
+            formula = f"{spans} * ({per_set} - {parity}) * {size_txt} = {net_capacity:g} GB"
+
+        brutto = math.fsum(sizes)
+        waste = [size - used for size in sizes]
+        return {
+            "brutto": brutto,
+            "netto": net_capacity,
+            "efficiency": (net_capacity / brutto) * 100,
+            "fault_tolerance": fault_tolerance,
+            "formula": formula,
+            "waste": waste,
+            "waste_total": math.fsum(waste),
+        }
+
+    @profiled
+    def calculate_batch(self, raid_type: str, layouts, spans: int = 2) -> tuple:
+        """
+        Evaluates many layouts with the same level and disk count at once.
+        layouts: rows of per-disk sizes (list of lists or 2D numpy array).
+        Returns (brutto, netto, waste_total) as numpy arrays, or lists without numpy.
+        """
+        if np is None:
+            results = [self.calculate_sizes(raid_type, list(sizes), spans) for sizes in layouts]
+            return ([r["brutto"] for r in results], [r["netto"] for r in results],
+                    [r["waste_total"] for r in results])
+
+        sizes = np.asarray(layouts, dtype=np.float64)
+        if sizes.ndim != 2 or sizes.shape[0] == 0:
+            raise ValueError("Erwartet eine Liste von Layouts gleicher Disk-Anzahl")
+        if sizes.min() <= 0:
+            raise ValueError("Größe muss größer 0 sein")
+        count, num_disks = sizes.shape
+        self._validate(raid_type, num_disks, spans)
+
+        sets, per_set = self.set_shape(raid_type, num_disks, spans)
+        used = sizes.reshape(count, sets, per_set).min(axis=2).min(axis=1)
+        brutto = sizes.sum(axis=1)
+        netto = self._data_disks(raid_type, num_disks, spans) * used
+        return brutto, netto, brutto - used * num_disks
+
+    def sweep(self, levels, disk_counts, sizes):
+        """Lazily yields SWEEP_COLUMNS rows for every valid level/disk count/size combination."""
+        for raid_type in levels:
+            for num_disks in disk_counts:
+                for size_disk in sizes:
+                    try:
+                        r = self.calculate(raid_type, num_disks, size_disk)
+                    except ValueError:
+                        continue
+                    yield (raid_type, num_disks, size_disk, r["brutto"], r["netto"],
+                           round(r["efficiency"], 2), r["fault_tolerance"])
+
+    @staticmethod
+    def _data_disks(raid_type: str, num_disks: int, spans: int) -> float:
+        """Number of disks worth of net capacity."""
+        if raid_type == "RAID 0": return num_disks
+        if raid_type == "RAID 1": return 1
+        if raid_type == "RAID 5": return num_disks - 1
+        if raid_type == "RAID 6": return num_disks - 2
+        if raid_type == "RAID 10": return num_disks / 2
+        if raid_type == "RAID 50": return num_disks - spans
+        return num_disks - 2 * spans  # RAID 60
+
+    @staticmethod
+    def _layouts(raid_type: str, data_disks: int, max_disks: int):
+        """Yields (spans, disk counts) for the level; the counts ascend from the
+        fewest disks reaching data_disks up to max_disks."""
+        if raid_type == "RAID 0":
+            yield 1, range(max(2, data_disks), max_disks + 1)
+        elif raid_type == "RAID 1":
+            if data_disks == 1:
+                yield 1, range(2, max_disks + 1)
+        elif raid_type == "RAID 5":
+            yield 1, range(max(3, data_disks + 1), max_disks + 1)
+        elif raid_type == "RAID 6":
+            yield 1, range(max(4, data_disks + 2), max_disks + 1)
+        elif raid_type == "RAID 10":
+            yield 1, range(max(4, 2 * data_disks), max_disks + 1, 2)
+        else:
+            # RAID 50/60: Stripe über mehrere RAID 5/6 Sets gleicher Größe
+            parity = 1 if raid_type == "RAID 50" else 2
+            min_span = parity + 2
+            for spans in range(2, max_disks // min_span + 1):
+                per_span = max(min_span, -(-data_disks // spans) + parity)
+                yield spans, range(spans * per_span, max_disks + 1, spans)
+
+    def _failures(self, raid_type: str, num_disks: int) -> int:
+        """Disk failures the array survives in the worst case."""
+        return num_disks - 1 if raid_type == "RAID 1" else self.GUARANTEED_FAILURES[raid_type]
+
+    @profiled
+    def optimize(self, target: float, min_failures: int, catalogue: list, max_disks: int,
+                 top_n: int = 10, levels=None) -> list:
+        """
+        Cheapest arrays (one SKU per array) reaching target GB net with at least
+        min_failures survivable disk failures. catalogue: [(name, size_gb, price), ...].
+        Every disk count up to max_disks is a candidate, so top_n also lists layouts
+        with more disks than needed. Branch and bound: SKUs are visited by a lower cost
+        bound and the search stops as soon as that bound cannot beat the current top_n.
+        Returns OPTIMIZE_COLUMNS rows.
+        """
+        if target <= 0:
+            raise ValueError("Ziel-Kapazität muss größer 0 sein")
+        if max_disks < 2:
+            raise ValueError("Mind. 2 Slots")
+        if top_n < 1:
+            raise ValueError("Top-N muss mind. 1 sein")
+        if not catalogue:
+            raise ValueError("Katalog ist leer")
+        max_disks = min(max_disks, self.MAX_DISKS)
+        levels = levels or self.LEVELS
+
+        bounded = []
+        for name, size, price in catalogue:
+            if size <= 0 or price < 0:
+                raise ValueError(f"Ungültige SKU: {name}")
+            data_disks = max(1, math.ceil(target / size - 1e-9))
+            # Jedes Level braucht mind. data_disks + Redundanz Disks
+            min_disks = max(2, data_disks + min_failures)
+            if min_disks <= max_disks:
+                bounded.append((min_disks * price, name, size, price, data_disks))
+        bounded.sort(key=lambda b: b[0])
+
+        heap = []  # (-Preis, -Disks, Nr., Zeile): heap[0] ist die schlechteste Lösung
+        seq = itertools.count()
+        for bound, name, size, price, data_disks in bounded:
+            if len(heap) == top_n and bound >= -heap[0][0]:
+                break
+            for raid_type in levels:
+                for spans, disk_counts in self._layouts(raid_type, data_disks, max_disks):
+                    for num_disks in disk_counts:
+                        cost = num_disks * price
+                        if len(heap) == top_n and cost >= -heap[0][0]:
+                            break  # Weitere Disks werden nur teurer
+                        failures = self._failures(raid_type, num_disks)
+                        if failures < min_failures:
+                            continue
+                        netto = self._data_disks(raid_type, num_disks, spans) * size
+                        row = (raid_type, spans, name, num_disks, size, netto, failures,
+                               round(cost, 2), round(cost / (netto / 1000), 2))
+                        entry = (-cost, -num_disks, next(seq), row)
+                        if len(heap) < top_n:
+                            heapq.heappush(heap, entry)
+                        else:
+                            heapq.heapreplace(heap, entry)
+        return [row for _, _, _, row in sorted(heap, key=lambda e: (-e[0], -e[1], -e[3][5]))]
+
+    @staticmethod
+    def parse_catalogue(text: str) -> list:
+        """Parses 'Name; Größe GB; Preis' lines (';', Tab or ','; German decimals allowed)."""
+        catalogue = []
+        for line_no, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = [p.strip() for p in re.split(r"[;\t]", line)]
+            if len(parts) == 1:
+                parts = [p.strip() for p in line.split(",")]
+            try:
+                if len(parts) != 3:
+                    raise ValueError
+                catalogue.append((parts[0], float(parts[1].replace(",", ".")), float(parts[2].replace(",", "."))))
+            except ValueError:
+                if not catalogue and line_no == 1:
+                    continue  # Kopfzeile
+                raise ValueError(f"Zeile {line_no}: erwartet 'Name; Größe GB; Preis'")
+        return catalogue
@@ -0,0 +1,51 @@
+import customtkinter as ctk
+import logging
+import os
+import json
+
+log = logging.getLogger(__name__)
+
+
+class AppSettings:
+    """
+    Design und Skalierung, gespeichert als JSON im Benutzerordner.
+    """
+    APPEARANCE_MODES = ["System", "Light", "Dark"]
+    SCALINGS = ["80%", "90%", "100%", "110%", "120%"]
+    DEFAULTS = {"appearance": "System", "scaling": "100%"}
+
+    def __init__(self, path: str):
+        self.path = path
+        self.values = dict(self.DEFAULTS)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        # Unbekannte oder kaputte Werte fallen auf den Standard zurück
+        if isinstance(data, dict):
+            if data.get("appearance") in self.APPEARANCE_MODES:
+                self.values["appearance"] = data["appearance"]
+            if data.get("scaling") in self.SCALINGS:
+                self.values["scaling"] = data["scaling"]
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    @staticmethod
+    def scaling_factor(text: str) -> float:
+        return int(text.replace("%", "")) / 100
+
+    def apply(self):
+        ctk.set_appearance_mode(self.values["appearance"])
+        ctk.set_widget_scaling(self.scaling_factor(self.values["scaling"]))
+
+    def save(self, **changes):
+        self.values.update(changes)
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.values, f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.warning("Settings not saved: %s", e)
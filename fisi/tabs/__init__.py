@@ -0,0 +1 @@
+"""Eingebaute Tabs, werden über TabRegistry erst beim ersten Öffnen importiert."""
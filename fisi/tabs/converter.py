@@ -0,0 +1,349 @@
+import customtkinter as ctk
+import itertools
+
+from ..units import UnitConverterEngine
+from ..widgets import HistoryBar, VirtualList
+
+
+class UnitConverterTab(ctk.CTkFrame):
+    """
+    Tab für Einheiten-Umrechnung (Bit, Byte, KiB, KB, etc.).
+    Features: Premium UI (Cards), Detaillierter Rechenweg (Text).
+    Modus „Übertragung“: Übertragungszeiten und What-if Tabelle (TransferPanel).
+    Uses UnitConverterEngine for logic.
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        
+        self.engine = UnitConverterEngine()
+        self.history = getattr(master, "history", None)
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=0) # Title
+        self.grid_rowconfigure(1, weight=0) # Modus & Verlauf
+        self.grid_rowconfigure(2, weight=0) # Input Card
+        self.grid_rowconfigure(3, weight=0) # Output Card
+        
+        # Title
+        self.label_title = ctk.CTkLabel(self, text="Einheiten-Rechner", font=("Arial", 22, "bold"))
+        self.label_title.grid(row=0, column=0, pady=(20, 15))
+
+        # Modus (Umrechnen / Übertragung) & Verlauf
+        self.frame_top = ctk.CTkFrame(self, fg_color="transparent")
+        self.frame_top.grid(row=1, column=0, padx=20, sticky="ew")
+        self.option_mode = ctk.CTkSegmentedButton(self.frame_top, values=["Umrechnen", "Übertragung"], command=self.switch_mode)
+        self.option_mode.set("Umrechnen")
+        self.option_mode.pack(side="left")
+        self.transfer_panel = None  # wird beim ersten Wechsel aufgebaut
+
+        # --- Card 1: EINGABE ---
+        self.card_in = ctk.CTkFrame(self, fg_color=("gray85", "gray25"), corner_radius=10)
+        self.card_in.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
+        
+        ctk.CTkLabel(self.card_in, text="Eingabe", font=("Arial", 12, "bold"), text_color="gray50").pack(anchor="w", padx=15, pady=(10, 0))
+        
+        self.frame_in_row = ctk.CTkFrame(self.card_in, fg_color="transparent")
+        self.frame_in_row.pack(padx=15, pady=(5, 15), fill="x")
+        
+        self.entry_amount = ctk.CTkEntry(self.frame_in_row, placeholder_text="Menge", width=120, font=("Arial", 14), justify="center")
+        self.entry_amount.pack(side="left", padx=(0, 10))
+        self.entry_amount.bind("<KeyRelease>", self.calculate)
+        self.entry_amount.bind("<Return>", self.commit_history)
+        self.entry_amount.bind("<FocusOut>", self.commit_history)
+        
+        self.option_src = ctk.CTkOptionMenu(self.frame_in_row, values=self.engine.unit_names, command=self.select_unit, width=120)
+        self.option_src.set("GB")
+        self.option_src.pack(side="left")
+
+        self.switch_all = ctk.CTkSwitch(self.frame_in_row, text="Alle Einheiten", command=self.toggle_show_all)
+        self.switch_all.pack(side="right")
+
+        # --- Card 2: ERGEBNIS ---
+        self.card_out = ctk.CTkFrame(self, fg_color=("white", "gray20"), corner_radius=10, border_width=2, border_color="#1f6aa5")
+        self.card_out.grid(row=3, column=0, padx=20, pady=10, sticky="ew")
+        
+        ctk.CTkLabel(self.card_out, text="Ergebnis", font=("Arial", 12, "bold"), text_color="#1f6aa5").pack(anchor="w", padx=15, pady=(10, 0))
+        
+        self.frame_out_row = ctk.CTkFrame(self.card_out, fg_color="transparent")
+        self.frame_out_row.pack(padx=15, pady=(5, 5), fill="x")
+        
+        self.label_result = ctk.CTkLabel(self.frame_out_row, text="---", font=("Consolas", 28, "bold"), text_color="#1f6aa5")
+        self.label_result.pack(side="left", padx=(0, 10))
+        
+        self.option_dst = ctk.CTkOptionMenu(self.frame_out_row, values=self.engine.unit_names, command=self.select_unit, width=120)
+        self.option_dst.set("GiB")
+        self.option_dst.pack(side="right")
+        
+        self.label_unit_full = ctk.CTkLabel(self.card_out, text="", font=("Arial", 12), text_color="gray60")
+        self.label_unit_full.pack(anchor="w", padx=15, pady=(0, 15))
+
+
+        # --- Card 3: RECHENWEG ---
+        self.card_path = ctk.CTkFrame(self, fg_color="transparent")
+        self.card_path.grid(row=4, column=0, padx=20, pady=10, sticky="ew")
+        
+        ctk.CTkLabel(self.card_path, text="Rechenweg:", font=("Arial", 12, "bold")).pack(anchor="w", padx=0, pady=(0, 5))
+        
+        self.txt_explanation = ctk.CTkTextbox(self.card_path, height=120, fg_color=("gray95", "gray15"), text_color=("black", "white"), font=("Consolas", 12))
+        self.txt_explanation.pack(fill="x")
+        self.txt_explanation.configure(state="disabled")
+
+        # --- Card 4: ALLE EINHEITEN (eine Liste, wird nur neu gerendert) ---
+        self.card_all = ctk.CTkFrame(self, fg_color=("white", "gray20"), corner_radius=10, border_width=2, border_color="#1f6aa5")
+        self.card_all.grid_columnconfigure(0, weight=1)
+        self.all_values = ["---"] * len(self.engine.unit_names)
+        self.all_src = None
+        self.list_all = VirtualList(self.card_all, format_row=self.format_all_row, height=250)
+        self.list_all.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+        self.list_all.set_items(range(len(self.engine.unit_names)))
+
+        # Verlauf & Favoriten
+        if self.history:
+            self.history_bar = HistoryBar(self.frame_top, self.history, "converter", self.apply_history)
+            self.history_bar.pack(side="right")
+
+
+    def calculate(self, event=None):
+        if self.history:
+            self.history_bar.clear()
+        val_str = self.entry_amount.get()
+        if not val_str:
+            self.label_result.configure(text="---")
+            self.set_explanation("")
+            self.clear_all_table()
+            return
+
+        try:
+            val = self.engine.parse_input(val_str)
+        except ValueError:
+            self.label_result.configure(text="Err")
+            self.set_explanation("Ungültige Eingabe.")
+            self.clear_all_table("Err")
+            return
+
+        src = self.option_src.get()
+        dst = self.option_dst.get()
+
+        if self.switch_all.get():
+            self.update_all_table(val, src)
+            return
+
+        key = f"{val_str} {src} {dst}"
+        try:
+            result, bytes_val = self.engine.convert(val, src, dst)
+            
+            res_str = self.engine.format_number(result)
+            self.label_result.configure(text=res_str)
+            self.label_unit_full.configure(text=self.engine.units_map[dst][0])
+            
+            explanation = self.engine.generate_explanation(val, src, dst, bytes_val, result)
+            self.set_explanation(explanation)
+
+            # Erst bei Enter, Verlassen des Feldes oder Einheitenwahl in den Verlauf
+            if self.history:
+                self.history_bar.set_current(key, {"amount": val_str, "src": src, "dst": dst},
+                                             {"result": result, "bytes": bytes_val})
+            
+        except Exception as e:
+            self.label_result.configure(text="Err")
+            self.set_explanation(f"Fehler: {str(e)}")
+
+    def select_unit(self, _value):
+        self.calculate()
+        self.commit_history()
+
+    def commit_history(self, event=None):
+        if self.history:
+            self.history_bar.commit()
+
+    def switch_mode(self, mode):
+        if mode == "Übertragung":
+            for card in (self.card_in, self.card_out, self.card_path, self.card_all):
+                card.grid_remove()
+            if self.transfer_panel is None:
+                self.transfer_panel = TransferPanel(self, self.engine, fg_color="transparent")
+            self.transfer_panel.grid(row=2, column=0, rowspan=3, padx=10, pady=10, sticky="nsew")
+            self.grid_rowconfigure(2, weight=1)
+        else:
+            if self.transfer_panel is not None:
+                self.transfer_panel.grid_remove()
+            self.grid_rowconfigure(2, weight=0)
+            self.card_in.grid()
+            self.toggle_show_all()
+
+    def toggle_show_all(self):
+        if self.switch_all.get():
+            self.card_out.grid_remove()
+            self.card_path.grid_remove()
+            self.card_all.grid(row=3, column=0, padx=20, pady=10, sticky="ew")
+        else:
+            self.card_all.grid_remove()
+            self.card_out.grid()
+            self.card_path.grid()
+        self.calculate()
+
+    def clear_all_table(self, text="---"):
+        self.set_all_values([text] * len(self.all_values), None)
+
+    def update_all_table(self, val, src):
+        """Rendert die Liste nur neu, wenn sich Werte oder Quelleinheit geändert haben."""
+        results = self.engine.convert_all(val, src)
+        self.set_all_values([self.engine.format_number(result) for result in results], src)
+
+    def set_all_values(self, values, src):
+        if values != self.all_values or src != self.all_src:
+            self.all_values = values
+            self.all_src = src
+            self.list_all.render()
+
+    def format_all_row(self, i):
+        unit = self.engine.unit_names[i]
+        mark = "▶" if unit == self.all_src else " "
+        return f"{mark} {unit:<5} {self.all_values[i]:>34}  {self.engine.units_map[unit][0]}"
+
+    def apply_history(self, inputs):
+        if self.option_mode.get() != "Umrechnen":
+            self.option_mode.set("Umrechnen")
+            self.switch_mode("Umrechnen")
+        self.entry_amount.delete(0, "end")
+        self.entry_amount.insert(0, inputs["amount"])
+        self.option_src.set(inputs["src"])
+        self.option_dst.set(inputs["dst"])
+        self.calculate()
+
+    def set_explanation(self, text):
+        self.txt_explanation.configure(state="normal")
+        self.txt_explanation.delete("0.0", "end")
+        self.txt_explanation.insert("0.0", text)
+        self.txt_explanation.configure(state="disabled")
+
+
+class TransferPanel(ctk.CTkFrame):
+    """
+    Modus „Übertragung“ des Einheiten-Rechners (Datenmenge über Bandbreite bei Effizienz).
+    Funktionen:
+    - Dauer und effektive Rate
+    - Benötigte Bandbreite für ein Zeitfenster
+    - What-if Tabelle: mehrere Werte mit ";" trennen (Mengen x Links x Effizienzen)
+    """
+    def __init__(self, master, engine, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.engine = engine
+
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(7, weight=1)
+
+        # Datenmenge
+        ctk.CTkLabel(self, text="Datenmenge:").grid(row=1, column=0, padx=10, pady=5, sticky="w")
+        self.entry_sizes = ctk.CTkEntry(self, placeholder_text="z.B. 10 oder 1; 10; 50")
+        self.entry_sizes.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
+        self.option_size_unit = ctk.CTkOptionMenu(self, values=self.engine.unit_names, command=self.calculate, width=110)
+        self.option_size_unit.set("TiB")
+        self.option_size_unit.grid(row=1, column=2, padx=10, pady=5)
+
+        # Bandbreite
+        ctk.CTkLabel(self, text="Bandbreite:").grid(row=2, column=0, padx=10, pady=5, sticky="w")
+        self.entry_rates = ctk.CTkEntry(self, placeholder_text="z.B. 10 oder 1; 10; 25; 100")
+        self.entry_rates.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+        self.option_rate_unit = ctk.CTkOptionMenu(self, values=self.engine.rate_unit_names, command=self.calculate, width=110)
+        self.option_rate_unit.set("Gbit/s")
+        self.option_rate_unit.grid(row=2, column=2, padx=10, pady=5)
+
+        # Effizienz
+        ctk.CTkLabel(self, text="Effizienz (%):").grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        self.entry_effs = ctk.CTkEntry(self, placeholder_text="z.B. 80 oder 70; 80; 95")
+        self.entry_effs.insert(0, "80")
+        self.entry_effs.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+
+        # Zeitfenster (optional, für die benötigte Bandbreite)
+        ctk.CTkLabel(self, text="Zeitfenster (h):").grid(row=4, column=0, padx=10, pady=5, sticky="w")
+        self.entry_window = ctk.CTkEntry(self, placeholder_text="optional, z.B. 8")
+        self.entry_window.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
+
+        for entry in (self.entry_sizes, self.entry_rates, self.entry_effs, self.entry_window):
+            entry.bind("<KeyRelease>", self.calculate)
+
+        # Ergebnisse (Cards)
+        self.result_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.result_frame.grid(row=5, column=0, columnspan=3, padx=10, pady=5, sticky="ew")
+        for col in range(3):
+            self.result_frame.grid_columnconfigure(col, weight=1)
+
+        def create_card(parent, title, value_var, col):
+            card = ctk.CTkFrame(parent)
+            card.grid(row=0, column=col, padx=5, pady=5, sticky="ew")
+            ctk.CTkLabel(card, text=title, font=("Arial", 12, "bold"), text_color="gray70").pack(anchor="w", padx=10, pady=(5,0))
+            ctk.CTkLabel(card, textvariable=value_var, font=("Consolas", 14)).pack(anchor="w", padx=10, pady=(0,5))
+            return card
+
+        self.var_duration = ctk.StringVar(value="---")
+        self.var_effective = ctk.StringVar(value="---")
+        self.var_required = ctk.StringVar(value="---")
+        create_card(self.result_frame, "Dauer", self.var_duration, 0)
+        create_card(self.result_frame, "Effektive Rate", self.var_effective, 1)
+        create_card(self.result_frame, "Benötigt für Zeitfenster", self.var_required, 2)
+
+        # What-if Tabelle
+        ctk.CTkLabel(self, text="What-if Tabelle (Mengen x Bandbreite @ Effizienz):", font=("Arial", 12, "bold")).grid(
+            row=6, column=0, columnspan=3, padx=10, pady=(10, 0), sticky="w")
+        self.txt_grid = ctk.CTkTextbox(self, wrap="none", font=("Consolas", 12), fg_color=("gray95", "gray15"))
+        self.txt_grid.grid(row=7, column=0, columnspan=3, padx=10, pady=(5, 10), sticky="nsew")
+        self.txt_grid.configure(state="disabled")
+
+        self.error_label = ctk.CTkLabel(self, text="", text_color="red")
+        self.error_label.grid(row=8, column=0, columnspan=3, pady=5)
+
+    def parse_list(self, txt):
+        """Parses '10; 25,5; 100' into floats (German number format)."""
+        return [self.engine.parse_input(part) for part in txt.replace(";", " ").split()]
+
+    def calculate(self, event=None):
+        self.error_label.configure(text="")
+        try:
+            sizes = self.parse_list(self.entry_sizes.get())
+            rates = self.parse_list(self.entry_rates.get())
+            effs = [e / 100 for e in self.parse_list(self.entry_effs.get())]
+            window_txt = self.entry_window.get().strip()
+            window_h = self.engine.parse_input(window_txt) if window_txt else None
+        except ValueError:
+            self.error_label.configure(text="Bitte gültige Zahlen eingeben!")
+            return
+        if not (sizes and rates and effs):
+            return
+
+        size_unit = self.option_size_unit.get()
+        rate_unit = self.option_rate_unit.get()
+        fmt = self.engine.format_number
+
+        try:
+            grid = self.engine.transfer_grid([(s, size_unit) for s in sizes],
+                                             [(r, rate_unit) for r in rates], effs)
+            required = None
+            if window_h is not None:
+                required = self.engine.required_rate(sizes[0], size_unit, window_h * 3600, rate_unit, effs[0])
+
+            # Tabelle (format_duration lehnt unendliche Dauern ab)
+            columns = [f"{fmt(r)} {rate_unit} @{fmt(e * 100)}%" for r, e in itertools.product(rates, effs)]
+            row_labels = [f"{fmt(s)} {size_unit}" for s in sizes]
+            first_width = max(len(label) for label in row_labels)
+            widths = [max(len(c), 14) for c in columns]
+
+            lines = ["  ".join([" " * first_width] + [c.rjust(w) for c, w in zip(columns, widths)])]
+            for label, row in zip(row_labels, grid):
+                cells = [self.engine.format_duration(sec).rjust(w) for sec, w in zip(row, widths)]
+                lines.append("  ".join([label.rjust(first_width)] + cells))
+        except ValueError as e:
+            self.error_label.configure(text=f"Fehler: {e}")
+            return
+
+        # Cards: erste Kombination
+        effective_bytes = rates[0] * self.engine.rate_units_map[rate_unit][1] * effs[0] / 8
+        self.var_duration.set(self.engine.format_duration(grid[0][0]))
+        self.var_effective.set(f"{fmt(effective_bytes / 1000**2)} MB/s")
+        self.var_required.set(f"{fmt(required)} {rate_unit}" if required is not None else "---")
+
+        self.txt_grid.configure(state="normal")
+        self.txt_grid.delete("0.0", "end")
+        self.txt_grid.insert("0.0", "\n".join(lines))
+        self.txt_grid.configure(state="disabled")
@@ -0,0 +1,26 @@
+import customtkinter as ctk
+
+
+class InfoTab(ctk.CTkFrame):
+    """
+    Info Tab mit Credits und Links.
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        import webbrowser
+
+        self.pack_propagate(False) # Prevent shrinking
+
+        self.label_title = ctk.CTkLabel(self, text="Über das FISI Toolkit", font=("Arial", 24, "bold"))
+        self.label_title.pack(pady=(40, 20))
+
+        self.label_author = ctk.CTkLabel(self, text="Erstellt von Ivan Krznaric-Bertic", font=("Arial", 16))
+        self.label_author.pack(pady=10)
+
+        self.btn_linkedin = ctk.CTkButton(self, text="LinkedIn Profil", 
+                                          command=lambda: webbrowser.open("www.linkedin.com/in/ivan-krznaric-bertic"))
+        self.btn_linkedin.pack(pady=10)
+
+        self.btn_github = ctk.CTkButton(self, text="GitHub Profil", 
+                                        command=lambda: webbrowser.open("https://github.com/Whitefox75"))
+        self.btn_github.pack(pady=10)
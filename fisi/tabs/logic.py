@@ -0,0 +1,650 @@
+import customtkinter as ctk
+from tkinter import messagebox, filedialog
+import os
+import time
+
+from ..binary import BinaryFileView
+from ..checksum import ChecksumEngine
+from ..export import ResultExporter
+from ..logic import BitExpression, LogicEngine
+from ..widgets import BackgroundTask, HistoryBar
+
+
+class HexDumpWindow(ctk.CTkToplevel):
+    """
+    Hex-/Binär-Dump einer Datei (beliebig groß, per mmap).
+    Markierte Bytes (max. 4) gehen an on_select.
+    """
+    FONT_SIZE = 12
+    MAX_SELECTION = 4
+
+    def __init__(self, master, path, on_select=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.view = BinaryFileView(path)
+        self.on_select = on_select
+        self.top_row = 0
+        self.visible_rows = 1
+        self.selection = None  # (start, end) inklusive
+        self.anchor = None
+        self.search_task = None
+        self.closed = False
+        self.line_height = ctk.CTkFont(family="Consolas", size=self.FONT_SIZE).metrics("linespace")
+
+        self.title(f"Hex-Dump: {os.path.basename(path)}")
+        self.geometry("900x600")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Steuerung
+        frame_ctrl = ctk.CTkFrame(self)
+        frame_ctrl.grid(row=0, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
+        frame_ctrl.grid_columnconfigure(3, weight=1)
+
+        self.entry_offset = ctk.CTkEntry(frame_ctrl, width=140, placeholder_text="Offset, z.B. 0x1F40")
+        self.entry_offset.grid(row=0, column=0, padx=5, pady=5)
+        self.entry_offset.bind("<Return>", self.jump)
+        ctk.CTkButton(frame_ctrl, text="Springe", width=80, command=self.jump).grid(row=0, column=1, padx=5, pady=5)
+
+        self.switch_binary = ctk.CTkSwitch(frame_ctrl, text="Binär", command=self.toggle_binary)
+        self.switch_binary.grid(row=0, column=2, padx=10, pady=5)
+
+        self.entry_search = ctk.CTkEntry(frame_ctrl, placeholder_text='Suche: de ad be ef oder "Text"')
+        self.entry_search.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
+        self.entry_search.bind("<Return>", self.search)
+        self.btn_search = ctk.CTkButton(frame_ctrl, text="Suchen", width=90, command=self.search)
+        self.btn_search.grid(row=0, column=4, padx=5, pady=5)
+
+        # Dump (nur sichtbare Zeilen) + virtuelle Scrollbar
+        self.txt = ctk.CTkTextbox(self, wrap="none", activate_scrollbars=False,
+                                  font=("Consolas", self.FONT_SIZE), fg_color=("gray95", "gray15"))
+        self.txt.grid(row=1, column=0, padx=(10, 0), pady=0, sticky="nsew")
+        self.txt.tag_config("auswahl", background="#1f6aa5", foreground="white")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scroll)
+        self.scrollbar.grid(row=1, column=1, padx=(0, 10), pady=0, sticky="ns")
+
+        self.txt.bind("<Configure>", self.on_resize)
+        self.txt.bind("<MouseWheel>", self.on_wheel)
+        self.txt.bind("<Button-4>", self.on_wheel)
+        self.txt.bind("<Button-5>", self.on_wheel)
+        self.txt.bind("<Button-1>", self.on_click)
+        self.txt.bind("<B1-Motion>", self.on_drag)
+
+        self.label_info = ctk.CTkLabel(self, text=f"{self.view.size:,} Byte".replace(",", "."), text_color="gray60", anchor="w")
+        self.label_info.grid(row=2, column=0, columnspan=2, padx=10, pady=(5, 10), sticky="ew")
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.render()
+
+    @property
+    def bytes_per_row(self):
+        return 4 if self.switch_binary.get() else 16
+
+    @property
+    def binary(self):
+        return bool(self.switch_binary.get())
+
+    def render(self):
+        bpr = self.bytes_per_row
+        rows = self.view.row_count(bpr)
+        self.top_row = max(0, min(self.top_row, rows - self.visible_rows))
+        lines = self.view.format_rows(self.top_row, self.visible_rows, bpr, self.binary)
+
+        self.txt.configure(state="normal")
+        self.txt.delete("0.0", "end")
+        self.txt.insert("0.0", "\n".join(lines))
+        if self.selection:
+            cell_width = 8 if self.binary else 2
+            start, end = self.selection
+            for offset in range(start, end + 1):
+                row, byte = divmod(offset, bpr)
+                if not self.top_row <= row < self.top_row + self.visible_rows:
+                    continue
+                line = row - self.top_row + 1
+                col = self.view.hex_column(byte, self.binary)
+                self.txt.tag_add("auswahl", f"{line}.{col}", f"{line}.{col + cell_width}")
+                col = self.view.ascii_column(byte, bpr, self.binary)
+                self.txt.tag_add("auswahl", f"{line}.{col}", f"{line}.{col + 1}")
+        self.txt.configure(state="disabled")
+
+        self.scrollbar.set(self.top_row / rows, min(1.0, (self.top_row + self.visible_rows) / rows))
+
+    def scroll_to_offset(self, offset):
+        row = offset // self.bytes_per_row
+        if not self.top_row <= row < self.top_row + self.visible_rows:
+            self.top_row = max(0, row - self.visible_rows // 3)
+
+    def on_resize(self, event):
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        rows = max(1, int(event.height // (self.line_height * scaling)))
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.render()
+
+    def on_scroll(self, action, value, unit=None):
+        if action == "moveto":
+            self.top_row = int(float(value) * self.view.row_count(self.bytes_per_row))
+        else:
+            step = self.visible_rows if unit == "pages" else 1
+            self.top_row += int(value) * step
+        self.render()
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.top_row -= 3
+        else:
+            self.top_row += 3
+        self.render()
+        return "break"
+
+    def offset_at(self, event):
+        line, col = map(int, self.txt.index(f"@{event.x},{event.y}").split("."))
+        bpr = self.bytes_per_row
+        byte = self.view.byte_at_column(col, bpr, self.binary)
+        if byte is None:
+            return None
+        offset = (self.top_row + line - 1) * bpr + byte
+        return offset if offset < self.view.size else None
+
+    def on_click(self, event):
+        offset = self.offset_at(event)
+        if offset is not None:
+            self.anchor = offset
+            self.select(offset, offset)
+        return "break"
+
+    def on_drag(self, event):
+        offset = self.offset_at(event)
+        if offset is not None and self.anchor is not None:
+            # Auswahl auf MAX_SELECTION Bytes ab dem Anker begrenzen
+            limit = self.MAX_SELECTION - 1
+            offset = max(self.anchor - limit, min(offset, self.anchor + limit))
+            self.select(min(self.anchor, offset), max(self.anchor, offset))
+        return "break"
+
+    def select(self, start, end):
+        if self.selection == (start, end):
+            return
+        self.selection = (start, end)
+        self.render()
+        data = self.view.read(start, end - start + 1)
+        value = int.from_bytes(data, "big")
+        self.label_info.configure(
+            text=f"Auswahl 0x{start:X}–0x{end:X} ({len(data)} Byte): {data.hex(' ').upper()} = {value}",
+            text_color="gray60")
+        if self.on_select:
+            self.on_select(value)
+
+    def jump(self, event=None):
+        try:
+            offset = int(self.entry_offset.get().strip().replace("_", ""), 0)
+            if not 0 <= offset < self.view.size:
+                raise ValueError
+        except ValueError:
+            self.label_info.configure(text="Ungültiger Offset!", text_color="red")
+            return
+        self.scroll_to_offset(offset)
+        self.anchor = offset
+        self.selection = None
+        self.select(offset, offset)
+
+    def toggle_binary(self):
+        # Erste sichtbare Position beibehalten
+        old_bpr = 16 if self.binary else 4
+        self.top_row = self.top_row * old_bpr // self.bytes_per_row
+        self.render()
+
+    def search(self, event=None):
+        if self.search_task:
+            self.search_task.cancel()
+            return
+        try:
+            pattern = self.view.parse_pattern(self.entry_search.get())
+            if not pattern:
+                raise ValueError
+        except ValueError:
+            self.label_info.configure(text="Ungültiges Suchmuster!", text_color="red")
+            return
+        start = self.selection[0] + 1 if self.selection else 0
+
+        def on_progress(value):
+            done, total = value
+            self.label_info.configure(text=f"Suche... {done / total:.0%}", text_color="gray60")
+
+        def on_done(result, error):
+            self.search_task = None
+            if self.closed:
+                self.view.close()
+                return
+            self.btn_search.configure(text="Suchen")
+            if error:
+                msg = "Suche abgebrochen" if isinstance(error, InterruptedError) else f"Fehler: {error}"
+                self.label_info.configure(text=msg, text_color="red")
+            elif result == -1:
+                self.label_info.configure(text="Nicht gefunden (bis Dateiende)", text_color="red")
+            else:
+                self.scroll_to_offset(result)
+                self.anchor = result
+                self.selection = None
+                self.select(result, result + min(len(pattern), self.MAX_SELECTION) - 1)
+
+        self.btn_search.configure(text="Abbrechen")
+        # Task an master hängen, damit er ein Schließen des Fensters überlebt
+        self.search_task = BackgroundTask(
+            self.master, lambda progress: self.view.find(pattern, start, progress), on_progress, on_done).start()
+
+    def on_close(self):
+        self.closed = True
+        if self.search_task:
+            # mmap erst schließen, wenn der Such-Thread fertig ist
+            self.search_task.cancel()
+        else:
+            self.view.close()
+        self.destroy()
+
+
+class LogicTab(ctk.CTkFrame):
+    """
+    Tab für Logik-Berechnungen (Hex/Dez/Bin).
+    Funktionen:
+    - Bit-Matrix (32 Bits & 64 Bits)
+    - Echtzeit-Umrechnung
+    - Prüfsummen (CRC32, Adler-32, RFC 1071) und Hashes für Dateien/Hex-Daten
+    - Hex-Dump großer Dateien; markierte Bytes landen in der Bit-Matrix
+    - Bit-Ausdrücke wie (x >> 4) & 0xF0 ^ ~y, auch für ganze Dateien mit Werten
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        
+        self.engine = LogicEngine()
+        self.history = getattr(master, "history", None)
+
+        self.label_title = ctk.CTkLabel(self, text="Bit-Matrix & Konverter", font=("Arial", 20, "bold"))
+        self.label_title.pack(pady=10)
+
+        # Container für die Eingabefelder
+        self.frame_inputs = ctk.CTkFrame(self)
+        self.frame_inputs.pack(pady=10, padx=10, fill="x")
+
+        # Dezimal
+        self.label_dec = ctk.CTkLabel(self.frame_inputs, text="Dezimal:")
+        self.label_dec.grid(row=0, column=0, padx=5, pady=5)
+        self.entry_dec = ctk.CTkEntry(self.frame_inputs)
+        self.entry_dec.grid(row=0, column=1, padx=5, pady=5)
+        self.entry_dec.bind("<KeyRelease>", self.on_dec_change)
+
+        # Hex
+        self.label_hex = ctk.CTkLabel(self.frame_inputs, text="Hex:")
+        self.label_hex.grid(row=0, column=2, padx=5, pady=5)
+        self.entry_hex = ctk.CTkEntry(self.frame_inputs)
+        self.entry_hex.grid(row=0, column=3, padx=5, pady=5)
+        self.entry_hex.bind("<KeyRelease>", self.on_hex_change)
+
+        # Binär
+        self.label_bin = ctk.CTkLabel(self.frame_inputs, text="Binär (32-Bit):")
+        self.label_bin.grid(row=0, column=4, padx=5, pady=5)
+        self.entry_bin = ctk.CTkEntry(self.frame_inputs, width=220)
+        self.entry_bin.grid(row=0, column=5, padx=5, pady=5)
+        self.entry_bin.bind("<KeyRelease>", self.on_bin_change)
+
+        # Hex-Dump
+        self.btn_dump = ctk.CTkButton(self.frame_inputs, text="Hex-Dump...", width=100, command=self.open_dump)
+        self.btn_dump.grid(row=0, column=6, padx=5, pady=5)
+
+        # Bit-Ausdruck (x = aktueller Wert, weitere Variablen im zweiten Feld)
+        self.expr_task = None
+        self.expr_result = None
+
+        self.frame_expr = ctk.CTkFrame(self)
+        self.frame_expr.pack(pady=(0, 10), padx=10, fill="x")
+        self.frame_expr.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkLabel(self.frame_expr, text="Ausdruck:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        self.entry_expr = ctk.CTkEntry(self.frame_expr, placeholder_text="z.B. (x >> 4) & 0xF0 ^ ~y")
+        self.entry_expr.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        self.entry_expr.bind("<KeyRelease>", self.on_expr_change)
+        self.option_expr_width = ctk.CTkOptionMenu(self.frame_expr, values=[f"{w} Bit" for w in BitExpression.WIDTHS],
+                                                   width=90, command=self.on_expr_change)
+        self.option_expr_width.set("32 Bit")
+        self.option_expr_width.grid(row=0, column=2, padx=5, pady=5)
+        self.btn_expr_apply = ctk.CTkButton(self.frame_expr, text="→ Matrix", width=100, command=self.apply_expr_result)
+        self.btn_expr_apply.grid(row=0, column=3, padx=5, pady=5)
+
+        ctk.CTkLabel(self.frame_expr, text="Variablen:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
+        self.entry_expr_vars = ctk.CTkEntry(self.frame_expr, placeholder_text="y=0xFF, z=3  (x = aktueller Wert)")
+        self.entry_expr_vars.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self.entry_expr_vars.bind("<KeyRelease>", self.on_expr_change)
+        self.btn_expr_file = ctk.CTkButton(self.frame_expr, text="Datei auswerten...", width=195, command=self.evaluate_expr_file)
+        self.btn_expr_file.grid(row=1, column=2, columnspan=2, padx=5, pady=5)
+
+        self.label_expr_result = ctk.CTkLabel(self.frame_expr, text="", font=("Consolas", 12), anchor="w")
+        self.label_expr_result.grid(row=2, column=0, columnspan=4, padx=5, pady=(0, 5), sticky="ew")
+
+        # Matrix Container
+        self.frame_matrix_container = ctk.CTkFrame(self)
+        self.frame_matrix_container.pack(pady=10, padx=10, fill="both", expand=True)
+
+        # 32-Bit Matrix (nur noch diese)
+        ctk.CTkLabel(self.frame_matrix_container, text="32-Bit Matrix (Integer)", font=("Arial", 14, "bold")).pack(pady=(5,0))
+        self.create_bit_matrix(self.frame_matrix_container, 32, "bits32", height=140)
+
+        self.current_value = 0
+
+        # Prüfsummen & Hashes (Datei oder Hex-Daten)
+        self.checksum_engine = ChecksumEngine()
+        self.checksum_task = None
+
+        self.frame_checksum = ctk.CTkFrame(self)
+        self.frame_checksum.pack(pady=(0, 10), padx=10, fill="x")
+        self.frame_checksum.grid_columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(self.frame_checksum, text="Prüfsummen & Hashes", font=("Arial", 14, "bold")).grid(
+            row=0, column=0, columnspan=3, padx=5, pady=(5, 0), sticky="w")
+
+        self.entry_hex_data = ctk.CTkEntry(self.frame_checksum, placeholder_text="Hex-Daten, z.B. 45 00 00 3c 1c 46")
+        self.entry_hex_data.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
+        self.entry_hex_data.bind("<Return>", self.checksum_hex)
+        self.btn_checksum_hex = ctk.CTkButton(self.frame_checksum, text="Hex berechnen", width=110, command=self.checksum_hex)
+        self.btn_checksum_hex.grid(row=1, column=1, padx=5, pady=5)
+        self.btn_checksum_file = ctk.CTkButton(self.frame_checksum, text="Datei wählen...", width=110, command=self.checksum_file)
+        self.btn_checksum_file.grid(row=1, column=2, padx=5, pady=5)
+
+        self.progress_checksum = ctk.CTkProgressBar(self.frame_checksum)
+        self.progress_checksum.set(0)
+        self.progress_checksum.grid(row=2, column=0, padx=5, pady=5, sticky="ew")
+        self.label_checksum_status = ctk.CTkLabel(self.frame_checksum, text="", text_color="gray60")
+        self.label_checksum_status.grid(row=2, column=1, columnspan=2, padx=5, pady=5, sticky="w")
+
+        self.txt_checksum = ctk.CTkTextbox(self.frame_checksum, height=110, font=("Consolas", 12), fg_color=("gray95", "gray15"))
+        self.txt_checksum.grid(row=3, column=0, columnspan=3, padx=5, pady=(0, 5), sticky="ew")
+        self.txt_checksum.configure(state="disabled")
+
+        # Verlauf & Favoriten
+        if self.history:
+            self.history_bar = HistoryBar(self, self.history, "logic", self.apply_history)
+            self.history_bar.pack(after=self.label_title, anchor="e", padx=10)
+            for entry in (self.entry_dec, self.entry_hex, self.entry_bin):
+                entry.bind("<Return>", self.history_bar.commit)
+                entry.bind("<FocusOut>", self.history_bar.commit)
+
+    def create_bit_matrix(self, parent, bit_count, attr_prefix, height):
+        scroll = ctk.CTkScrollableFrame(parent, orientation="horizontal", height=height)
+        scroll.pack(fill="x", padx=5, pady=5)
+        
+        bits = [0] * bit_count  # Initialize all bits to 0
+        buttons = []
+        
+        setattr(self, f"{attr_prefix}_state", bits)
+        setattr(self, f"{attr_prefix}_btns", buttons)
+
+        inner_frame = ctk.CTkFrame(scroll, fg_color="transparent")
+        inner_frame.pack()
+
+        for i in range(bit_count):
+            byte_group = i // 8
+            bit_in_byte = i % 8
+            
+            if bit_in_byte == 0:
+                frame_byte = ctk.CTkFrame(inner_frame, fg_color="transparent")
+                frame_byte.pack(side="left", padx=5)
+                
+                byte_num = (bit_count // 8) - 1 - byte_group
+                ctk.CTkLabel(frame_byte, text=f"Byte {byte_num}", font=("Arial", 10, "bold")).pack()
+                
+                frame_bits_in_byte = ctk.CTkFrame(frame_byte, fg_color="transparent")
+                frame_bits_in_byte.pack()
+            
+            frame_single = ctk.CTkFrame(frame_bits_in_byte, fg_color="transparent")
+            frame_single.pack(side="left", padx=1)
+
+            # bit_index is the actual bit position (MSB to LSB)
+            bit_index = bit_count - 1 - i
+            btn = ctk.CTkButton(
+                frame_single, text="0", width=28, height=28, fg_color="gray", font=("Arial", 11, "bold"),
+                command=lambda idx=bit_index, p=attr_prefix: self.toggle_bit(idx, p)
+            )
+            btn.pack()
+            
+            val = 2**(7-bit_in_byte)
+            ctk.CTkLabel(frame_single, text=str(val), font=("Arial", 8), text_color="gray60").pack()
+            
+            buttons.append(btn)
+
+    def toggle_bit(self, bit_index, attr_prefix):
+        """Toggle a bit at the given position (0 = LSB, 31 = MSB)"""
+        bits = getattr(self, f"{attr_prefix}_state")
+        
+        # Toggle the bit directly at bit_index
+        bits[bit_index] = 1 - bits[bit_index]
+        
+        # Calculate value from bits
+        self.current_value = self.engine.from_bits(bits)
+        self.update_gui(source="matrix32")
+
+    def update_matrix_gui(self, attr_prefix):
+        """Update button display based on bit state"""
+        bits = getattr(self, f"{attr_prefix}_state")
+        btns = getattr(self, f"{attr_prefix}_btns")
+        bit_count = len(bits)
+        
+        for i, btn in enumerate(btns):
+            # Button i corresponds to bit (bit_count - 1 - i)
+            bit_idx = bit_count - 1 - i
+            state = bits[bit_idx]
+            btn.configure(text="1" if state else "0", fg_color="#1f6aa5" if state else "gray")
+
+    def update_bits_from_value(self, val, bit_count, attr_prefix):
+        """Update bit array from integer value"""
+        bits = getattr(self, f"{attr_prefix}_state")
+        bits[:bit_count] = self.engine.to_bits(val, bit_count)
+
+    def update_gui(self, source=None):
+        dec_str, hex_str, bin_str = self.engine.format_value(self.current_value)
+        if source != "dec":
+            self.entry_dec.delete(0, "end")
+            self.entry_dec.insert(0, dec_str)
+        if source != "hex":
+            self.entry_hex.delete(0, "end")
+            self.entry_hex.insert(0, hex_str)
+        if source != "bin":
+            self.entry_bin.delete(0, "end")
+            self.entry_bin.insert(0, bin_str)
+            
+        if source in ["dec", "hex", "bin"]:
+             self.update_bits_from_value(self.current_value, 32, "bits32")
+        
+        self.update_matrix_gui("bits32")
+        self.on_expr_change()
+
+        # Erst bei Enter oder Verlassen eines Eingabefeldes in den Verlauf
+        if self.history:
+            self.history_bar.set_current(f"{dec_str} (0x{hex_str})", {"value": self.current_value},
+                                         {"dec": dec_str, "hex": hex_str, "bin": bin_str})
+
+    def apply_history(self, inputs):
+        self.current_value = inputs["value"]
+        self.update_bits_from_value(self.current_value, 32, "bits32")
+        self.update_gui(source="history")
+
+    def open_dump(self):
+        path = filedialog.askopenfilename()
+        if not path:
+            return
+        try:
+            HexDumpWindow(self, path, on_select=self.apply_dump_selection)
+        except OSError as e:
+            messagebox.showerror("Fehler", f"Datei kann nicht geöffnet werden:\n{e}")
+
+    def apply_dump_selection(self, value):
+        self.current_value = value
+        self.update_bits_from_value(value, 32, "bits32")
+        self.update_gui(source="dump")
+
+    def on_dec_change(self, event):
+        txt = self.entry_dec.get()
+        if not txt: return
+        try:
+            val = self.engine.parse(txt, 10)
+            self.current_value = val
+            self.update_bits_from_value(val, 32, "bits32")
+            self.update_gui(source="dec")
+        except ValueError: pass
+
+    def on_hex_change(self, event):
+        txt = self.entry_hex.get()
+        if not txt: return
+        try:
+            val = self.engine.parse(txt, 16)
+            self.current_value = val
+            self.update_bits_from_value(val, 32, "bits32")
+            self.update_gui(source="hex")
+        except ValueError: pass
+
+    def on_bin_change(self, event):
+        txt = self.entry_bin.get()
+        if not txt: return
+        try:
+            val = self.engine.parse(txt, 2)
+            self.current_value = val
+            self.update_bits_from_value(val, 32, "bits32")
+            self.update_gui(source="bin")
+        except ValueError: pass
+
+    def read_expression(self):
+        """Returns (compiled expression, variables). Raises ValueError."""
+        width = int(self.option_expr_width.get().split()[0])
+        expr = BitExpression.compile(self.entry_expr.get(), width)
+        variables = BitExpression.parse_assignments(self.entry_expr_vars.get())
+        return expr, variables
+
+    def on_expr_change(self, event=None):
+        self.expr_result = None
+        if not self.entry_expr.get().strip():
+            self.label_expr_result.configure(text="")
+            return
+        try:
+            expr, variables = self.read_expression()
+            variables.setdefault("x", self.current_value)
+            result = expr.evaluate(variables)
+        except ValueError as e:
+            self.label_expr_result.configure(text=str(e), text_color="red")
+            return
+        self.expr_result = result
+        self.label_expr_result.configure(
+            text=f"= {result}   0x{result:0{expr.width // 4}X}   0b{result:0{expr.width}b}",
+            text_color=("gray10", "gray90"))
+
+    def apply_expr_result(self):
+        if self.expr_result is None:
+            return
+        self.current_value = self.expr_result & LogicEngine.MAX_VALUE
+        self.update_bits_from_value(self.current_value, 32, "bits32")
+        self.update_gui(source="expression")
+
+    def evaluate_expr_file(self):
+        # Laufende Auswertung abbrechen
+        if self.expr_task:
+            self.expr_task.cancel()
+            return
+
+        try:
+            expr, variables = self.read_expression()
+        except ValueError as e:
+            messagebox.showerror("Fehler", f"Ungültiger Ausdruck!\n{e}")
+            return
+        source = filedialog.askopenfilename(filetypes=BitExpression.FILETYPES)
+        if not source:
+            return
+        target = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=ResultExporter.FILETYPES)
+        if not target:
+            return
+
+        def run(progress):
+            start = time.perf_counter()
+            values = BitExpression.load_values(source, expr.width, progress)
+            # Ein Aufruf für alle Werte; x ist hier die Spalte aus der Datei
+            results = expr.evaluate_array({**variables, "x": values})
+            seconds = time.perf_counter() - start
+            with ResultExporter(target, BitExpression.COLUMNS) as exporter:
+                count = exporter.write_rows(expr.result_rows(values, results), progress)
+            return count, seconds
+
+        def on_progress(value):
+            if isinstance(value, tuple):
+                done, total = value
+                self.label_expr_result.configure(text=f"Lese {done / 1024**2:,.1f} / {total / 1024**2:,.1f} MiB...",
+                                                 text_color="gray60")
+            else:
+                self.label_expr_result.configure(text=f"{value:,} Zeilen geschrieben...".replace(",", "."),
+                                                 text_color="gray60")
+
+        def on_done(result, error):
+            self.expr_task = None
+            self.btn_expr_file.configure(text="Datei auswerten...")
+            if error:
+                msg = "Abgebrochen" if isinstance(error, InterruptedError) else f"Fehler: {error}"
+                self.label_expr_result.configure(text=msg, text_color="red")
+                return
+            count, seconds = result
+            self.label_expr_result.configure(
+                text=f"{count:,} Werte ausgewertet in {seconds:.2f} s → {os.path.basename(target)}".replace(",", "."),
+                text_color="gray60")
+
+        self.label_expr_result.configure(text="Starte...", text_color="gray60")
+        self.btn_expr_file.configure(text="Abbrechen")
+        self.expr_task = BackgroundTask(self, run, on_progress, on_done).start()
+
+    def show_checksums(self, results):
+        width = max(len(name) for name in results)
+        text = "\n".join(f"{name.ljust(width)}  {value}" for name, value in results.items())
+        self.txt_checksum.configure(state="normal")
+        self.txt_checksum.delete("0.0", "end")
+        self.txt_checksum.insert("0.0", text)
+        self.txt_checksum.configure(state="disabled")
+
+    def checksum_hex(self, event=None):
+        try:
+            data = self.checksum_engine.parse_hex(self.entry_hex_data.get())
+        except ValueError:
+            self.label_checksum_status.configure(text="Ungültige Hex-Daten!", text_color="red")
+            return
+        self.show_checksums(self.checksum_engine.compute_bytes(data))
+        self.progress_checksum.set(1)
+        self.label_checksum_status.configure(text=f"{len(data)} Byte", text_color="gray60")
+
+    def checksum_file(self):
+        # Laufende Berechnung abbrechen
+        if self.checksum_task:
+            self.checksum_task.cancel()
+            return
+
+        path = filedialog.askopenfilename()
+        if not path:
+            return
+
+        def on_progress(value):
+            done, total = value
+            self.progress_checksum.set(done / total if total else 1)
+            self.label_checksum_status.configure(text=f"{done / 1024**2:,.0f} / {total / 1024**2:,.0f} MiB")
+
+        def on_done(result, error):
+            self.checksum_task = None
+            self.btn_checksum_file.configure(text="Datei wählen...")
+            if error:
+                self.progress_checksum.set(0)
+                msg = "Abgebrochen" if isinstance(error, InterruptedError) else f"Fehler: {error}"
+                self.label_checksum_status.configure(text=msg, text_color="red")
+                return
+            results, size, seconds = result
+            self.show_checksums(results)
+            self.progress_checksum.set(1)
+            rate = size / seconds / 1024**2 if seconds > 0 else 0
+            self.label_checksum_status.configure(
+                text=f"{os.path.basename(path)}: {size / 1024**2:,.1f} MiB in {seconds:.2f} s ({rate:,.0f} MiB/s)",
+                text_color="gray60")
+
+        self.progress_checksum.set(0)
+        self.label_checksum_status.configure(text="Starte...", text_color="gray60")
+        self.btn_checksum_file.configure(text="Abbrechen")
+        self.checksum_task = BackgroundTask(
+            self, lambda progress: self.checksum_engine.compute_file(path, progress=progress),
+            on_progress, on_done).start()
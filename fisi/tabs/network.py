@@ -0,0 +1,500 @@
+import customtkinter as ctk
+import tkinter as tk
+from tkinter import messagebox, filedialog
+import pyperclip
+import os
+import re
+import time
+
+try:
+    import numpy as np  # Optional: beschleunigt Prüfsummen und Massenauswertungen
+except ImportError:
+    np = None
+
+from ..network import AddressSpaceMap, NetworkEngine, ZoneGenerator
+from ..widgets import BackgroundTask, HistoryBar, export_rows_async
+
+
+class NetworkTab(ctk.CTkFrame):
+    """
+    Tab für Netzwerk-Berechnungen.
+    Funktionen:
+    - IP/Subnetz-Rechner
+    - Visuelle Darstellung der UND-Verknüpfung (Binär)
+    - Auslastungs-Heatmap für /8 bis /24 Blöcke (benötigt numpy)
+    - PTR-/hosts-/DHCP-Generator (IPv4 & IPv6)
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.engine = NetworkEngine()
+        self.history = getattr(master, "history", None)
+
+        # Grid-Layout Konfiguration
+        self.grid_columnconfigure(1, weight=1)
+
+        # Überschrift
+        self.label_title = ctk.CTkLabel(self, text="IP & Subnetz Rechner", font=("Arial", 20, "bold"))
+        self.label_title.grid(row=0, column=0, columnspan=2, pady=10, padx=10, sticky="ew")
+
+        # Eingabe IP-Adresse
+        self.label_ip = ctk.CTkLabel(self, text="IP-Adresse:")
+        self.label_ip.grid(row=2, column=0, padx=10, pady=5, sticky="w")
+        self.entry_ip = ctk.CTkEntry(self, placeholder_text="z.B. 192.168.178.1")
+        self.entry_ip.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+
+        # Eingabe Subnetzmaske (CIDR)
+        self.label_cidr = ctk.CTkLabel(self, text="CIDR (z.B. 24):")
+        self.label_cidr.grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        self.slider_cidr = ctk.CTkSlider(self, from_=0, to=32, number_of_steps=32, command=self.update_cidr_label)
+        self.slider_cidr.set(24) # Standardwert
+        self.slider_cidr.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+        
+        self.label_cidr_val = ctk.CTkLabel(self, text="/24")
+        self.label_cidr_val.grid(row=3, column=2, padx=10, pady=5)
+
+        # Berechnen Button
+        self.btn_calc = ctk.CTkButton(self, text="Berechnen", command=self.calculate_network)
+        self.btn_calc.grid(row=4, column=0, columnspan=2, pady=10, padx=10, sticky="ew")
+
+        # Ergebnisse Bereich (Scrollable Frame für Cards)
+        self.result_frame = ctk.CTkScrollableFrame(self)
+        self.result_frame.grid(row=5, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
+        self.grid_rowconfigure(5, weight=1)
+
+        # Helper Funktion für Cards (Click-to-Copy)
+        def create_card(parent, title, value_var, row, col, color=None):
+            card = ctk.CTkFrame(parent)
+            card.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
+            
+            # Hover Effekt simulieren
+            def on_enter(e): card.configure(border_width=1, border_color="gray50")
+            def on_leave(e): card.configure(border_width=0)
+            card.bind("<Enter>", on_enter)
+            card.bind("<Leave>", on_leave)
+
+            # Copy Funktion
+            def copy_card(e):
+                val = value_var.get()
+                if val and val != "---":
+                    pyperclip.copy(val)
+                    lbl_val.configure(text_color="green")
+                    self.after(500, lambda: lbl_val.configure(text_color=color if color else ("black", "white")))
+
+            card.bind("<Button-1>", copy_card)
+            
+            lbl_title = ctk.CTkLabel(card, text=title, font=("Arial", 12, "bold"), text_color="gray70")
+            lbl_title.pack(anchor="w", padx=10, pady=(5,0))
+            lbl_title.bind("<Button-1>", copy_card)
+            
+            # WICHTIG: Text color standard setzen damit sichtbar
+            lbl_val = ctk.CTkLabel(card, textvariable=value_var, font=("Consolas", 14), text_color=color if color else ("black", "white"))
+            lbl_val.pack(anchor="w", padx=10, pady=(0,5))
+            lbl_val.bind("<Button-1>", copy_card)
+            
+            return card
+
+        self.result_frame.grid_columnconfigure(0, weight=1)
+        self.result_frame.grid_columnconfigure(1, weight=1)
+
+        # Variablen für Ergebnisse
+        self.var_net_id = ctk.StringVar(value="---")
+        self.var_broadcast = ctk.StringVar(value="---")
+        self.var_first_ip = ctk.StringVar(value="---")
+        self.var_last_ip = ctk.StringVar(value="---")
+        self.var_hosts = ctk.StringVar(value="---")
+        self.var_mask = ctk.StringVar(value="---")
+        
+        self.var_bin_ip = ctk.StringVar(value="")
+        self.var_bin_mask = ctk.StringVar(value="")
+        self.var_bin_net = ctk.StringVar(value="")
+
+        # Cards erstellen
+        create_card(self.result_frame, "Netzwerk-ID", self.var_net_id, 0, 0, "#1f6aa5")
+        create_card(self.result_frame, "Broadcast", self.var_broadcast, 0, 1)
+        create_card(self.result_frame, "Erste IP", self.var_first_ip, 1, 0)
+        create_card(self.result_frame, "Letzte IP", self.var_last_ip, 1, 1)
+        create_card(self.result_frame, "Nutzer Hosts", self.var_hosts, 2, 0)
+        create_card(self.result_frame, "Subnetzmaske", self.var_mask, 2, 1)
+
+        ctk.CTkLabel(self.result_frame, text="(Klicke auf die Werte zum Kopieren)", font=("Arial", 10), text_color="gray60").grid(row=2, column=2, sticky="e", padx=10)
+
+        # Binäre Visualisierung Bereich
+        self.lbl_bin_title = ctk.CTkLabel(self.result_frame, text="Binäre Analyse", font=("Arial", 14, "bold"))
+        self.lbl_bin_title.grid(row=3, column=0, columnspan=2, pady=(20, 10), sticky="w")
+        
+        self.frame_bin = ctk.CTkFrame(self.result_frame)
+        self.frame_bin.grid(row=4, column=0, columnspan=2, sticky="ew")
+        
+        ctk.CTkLabel(self.frame_bin, text="IP Adresse:", width=100, anchor="e").grid(row=0, column=0, padx=5, pady=2)
+        ctk.CTkLabel(self.frame_bin, textvariable=self.var_bin_ip, font=("Consolas", 12)).grid(row=0, column=1, sticky="w")
+        
+        ctk.CTkLabel(self.frame_bin, text="Subnetzmaske:", width=100, anchor="e").grid(row=1, column=0, padx=5, pady=2)
+        ctk.CTkLabel(self.frame_bin, textvariable=self.var_bin_mask, font=("Consolas", 12)).grid(row=1, column=1, sticky="w")
+        
+        sep = ctk.CTkFrame(self.frame_bin, height=2, fg_color="gray")
+        sep.grid(row=2, column=1, sticky="ew", pady=2)
+        
+        ctk.CTkLabel(self.frame_bin, text="Netzwerk:", width=100, anchor="e").grid(row=3, column=0, padx=5, pady=2)
+        ctk.CTkLabel(self.frame_bin, textvariable=self.var_bin_net, font=("Consolas", 12), text_color="#1f6aa5").grid(row=3, column=1, sticky="w")
+
+        # Copy & Export Buttons (verschoben)
+        self.frame_actions = ctk.CTkFrame(self, fg_color="transparent")
+        self.frame_actions.grid(row=6, column=0, columnspan=3, pady=10)
+
+        self.btn_copy = ctk.CTkButton(self.frame_actions, text="Ergebnisse Kopieren", command=self.copy_results, width=100)
+        self.btn_copy.pack(side="left", padx=5)
+
+        self.btn_export = ctk.CTkButton(self.frame_actions, text="Subnetz-Tabelle exportieren", command=self.export_subnets, width=100)
+        self.btn_export.pack(side="left", padx=5)
+
+        self.btn_heatmap = ctk.CTkButton(self.frame_actions, text="Heatmap...", command=self.open_heatmap, width=100)
+        self.btn_heatmap.pack(side="left", padx=5)
+
+        self.btn_zone = ctk.CTkButton(self.frame_actions, text="PTR/hosts/DHCP...", command=self.open_zone_generator, width=100)
+        self.btn_zone.pack(side="left", padx=5)
+
+        self.label_export = ctk.CTkLabel(self.frame_actions, text="", text_color="gray60")
+        self.label_export.pack(side="left", padx=5)
+
+        # Verlauf & Favoriten
+        if self.history:
+            self.history_bar = HistoryBar(self, self.history, "network", self.apply_history)
+            self.history_bar.grid(row=1, column=0, columnspan=3, padx=10, pady=(0, 5), sticky="e")
+
+    def update_cidr_label(self, value):
+        self.label_cidr_val.configure(text=f"/{int(value)}")
+
+    def calculate_network(self):
+        ip_str = self.entry_ip.get()
+        cidr = int(self.slider_cidr.get())
+
+        key = f"{ip_str}/{cidr}"
+        try:
+            result = self.engine.calculate(ip_str, cidr)
+            
+            # Update Variablen
+            self.var_net_id.set(result["network"])
+            self.var_mask.set(result["netmask"])
+            self.var_broadcast.set(result["broadcast"])
+            self.var_hosts.set(f"{result['num_hosts']:,}".replace(",", "."))
+            
+            self.var_first_ip.set(result["first_host"] or "N/A")
+            self.var_last_ip.set(result["last_host"] or "N/A")
+
+            # Binäre Darstellung
+            self.var_bin_ip.set(f"{result['bin_ip']}  ({ip_str})")
+            self.var_bin_mask.set(f"{result['bin_mask']}  (AND)")
+            self.var_bin_net.set(f"{result['bin_net']}  (=)")
+
+            if self.history:
+                self.history_bar.record(key, {"ip": ip_str, "cidr": cidr}, result)
+
+        except ValueError as e:
+            messagebox.showerror("Fehler", f"Ungültige IP-Adresse!\n{e}")
+
+    def apply_history(self, inputs):
+        self.entry_ip.delete(0, "end")
+        self.entry_ip.insert(0, inputs["ip"])
+        self.slider_cidr.set(inputs["cidr"])
+        self.update_cidr_label(inputs["cidr"])
+        self.calculate_network()
+
+    def copy_results(self):
+        try:
+            text = f"Netzwerk: {self.var_net_id.get()}\n"
+            text += f"Maske: {self.var_mask.get()}\n"
+            text += f"Broadcast: {self.var_broadcast.get()}\n"
+            text += f"Hosts: {self.var_hosts.get()}\n"
+            text += f"Range: {self.var_first_ip.get()} - {self.var_last_ip.get()}"
+            pyperclip.copy(text)
+            messagebox.showinfo("Kopiert", "Wichtige Daten wurden kopiert!")
+        except Exception as e:
+            messagebox.showerror("Fehler", str(e))
+
+    def export_subnets(self):
+        """Exportiert das Netz aufgeteilt in Subnetze (CSV/JSONL, optional gzip)."""
+        ip_str = self.entry_ip.get()
+        cidr = int(self.slider_cidr.get())
+
+        dialog = ctk.CTkInputDialog(text=f"Ziel-CIDR für die Subnetz-Tabelle (/{cidr} bis /32):",
+                                    title="Subnetz-Tabelle exportieren")
+        answer = dialog.get_input()
+        if not answer:
+            return
+        try:
+            rows = self.engine.iter_subnets(ip_str, cidr, int(answer.strip().lstrip("/")))
+        except ValueError as e:
+            messagebox.showerror("Fehler", f"Ungültige Eingabe!\n{e}")
+            return
+
+        export_rows_async(self, NetworkEngine.SUBNET_COLUMNS, rows, self.btn_export, self.label_export)
+
+    def open_heatmap(self):
+        if np is None:
+            messagebox.showerror("Fehler", "Die Heatmap benötigt numpy.\nInstallation: pip install numpy")
+            return
+        # Aktuelles Netz übernehmen, wenn es als Heatmap-Bereich taugt
+        network = "10.0.0.0/8"
+        cidr = int(self.slider_cidr.get())
+        if AddressSpaceMap.MIN_PREFIX <= cidr <= AddressSpaceMap.MAX_PREFIX:
+            try:
+                network = f"{self.engine.calculate(self.entry_ip.get(), cidr)['network']}/{cidr}"
+            except ValueError:
+                pass
+        HeatmapWindow(self, network)
+
+    def open_zone_generator(self):
+        # Aktuelles Netz vorbelegen (IPv6 kann im Fenster eingegeben werden)
+        cidr = int(self.slider_cidr.get())
+        try:
+            network = f"{self.engine.calculate(self.entry_ip.get(), cidr)['network']}/{cidr}"
+        except ValueError:
+            network = ""
+        ZoneGeneratorWindow(self, network)
+
+class HeatmapWindow(ctk.CTkToplevel):
+    """
+    Auslastungs-Heatmap eines IPv4-Blocks (/8 bis /24).
+    Linksklick zoomt hinein, Rechtsklick/Zurück wieder heraus.
+    """
+    CANVAS_SIZE = 512
+    ZOOM_BITS = 4
+
+    def __init__(self, master, network="10.0.0.0/8", **kwargs):
+        super().__init__(master, **kwargs)
+        self.map = None
+        self.view = None  # (Basisadresse, Präfixlänge)
+        self.view_stack = []
+        self.file_allocations = None
+        self.photo = None
+        self.grid = None
+        self.scale = 1
+        self.build_ms = 0
+
+        self.title("IPv4 Auslastungs-Heatmap")
+        self.geometry("560x820")
+        self.grid_columnconfigure(0, weight=1)
+
+        # Steuerung
+        frame_ctrl = ctk.CTkFrame(self)
+        frame_ctrl.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+        frame_ctrl.grid_columnconfigure(0, weight=1)
+        self.entry_network = ctk.CTkEntry(frame_ctrl, placeholder_text="Netz, z.B. 10.0.0.0/8")
+        self.entry_network.insert(0, network)
+        self.entry_network.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        self.entry_network.bind("<Return>", self.build)
+        self.btn_file = ctk.CTkButton(frame_ctrl, text="Datei laden...", width=100, command=self.load_file)
+        self.btn_file.grid(row=0, column=1, padx=5, pady=5)
+        ctk.CTkButton(frame_ctrl, text="Anzeigen", width=90, command=self.build).grid(row=0, column=2, padx=5, pady=5)
+        ctk.CTkButton(frame_ctrl, text="Zurück", width=70, command=self.zoom_out).grid(row=0, column=3, padx=5, pady=5)
+
+        self.txt_allocations = ctk.CTkTextbox(self, height=90, font=("Consolas", 12))
+        self.txt_allocations.grid(row=1, column=0, padx=10, sticky="ew")
+        self.txt_allocations.insert("0.0", "# Belegte Präfixe oder Adressen, eine pro Zeile\n10.0.0.0/16\n10.1.0.0/20\n10.2.3.4\n")
+
+        self.label_file = ctk.CTkLabel(self, text="", text_color="gray60", anchor="w")
+        self.label_file.grid(row=2, column=0, padx=10, sticky="ew")
+
+        # Heatmap (ein einziges Bild statt Widgets pro Block)
+        self.canvas = tk.Canvas(self, width=self.CANVAS_SIZE, height=self.CANVAS_SIZE,
+                                bg="#2d2d2d", highlightthickness=0, cursor="crosshair")
+        self.canvas.grid(row=3, column=0, padx=10, pady=5)
+        self.canvas_image = self.canvas.create_image(0, 0, anchor="nw")
+        self.canvas.bind("<Button-1>", self.zoom_in)
+        self.canvas.bind("<Button-3>", self.zoom_out)
+        self.canvas.bind("<Motion>", self.on_hover)
+
+        self.label_info = ctk.CTkLabel(self, text="", anchor="w", justify="left")
+        self.label_info.grid(row=4, column=0, padx=10, sticky="ew")
+        self.label_hover = ctk.CTkLabel(self, text="", text_color="gray60", anchor="w")
+        self.label_hover.grid(row=5, column=0, padx=10, pady=(0, 10), sticky="ew")
+
+    def load_file(self):
+        path = filedialog.askopenfilename(filetypes=[("Text", "*.txt *.csv *.lst"), ("Alle Dateien", "*.*")])
+        if not path:
+            return
+
+        def run(progress):
+            with open(path, encoding="utf-8", errors="replace") as f:
+                # Nur die erste Spalte, falls die Datei CSV ist
+                return AddressSpaceMap.parse_allocations(re.split(r"[,;\s]", line.strip(), 1)[0] for line in f)
+
+        def on_done(result, error):
+            self.btn_file.configure(state="normal")
+            if error:
+                self.label_file.configure(text=f"Fehler: {error}", text_color="red")
+                return
+            self.file_allocations = result
+            self.label_file.configure(text=f"{os.path.basename(path)}: {len(result[0]):,} Einträge".replace(",", "."),
+                                      text_color="gray60")
+            self.build()
+
+        self.btn_file.configure(state="disabled")
+        self.label_file.configure(text="Lade...", text_color="gray60")
+        BackgroundTask(self, run, on_done=on_done).start()
+
+    def build(self, event=None):
+        try:
+            self.map = AddressSpaceMap(self.entry_network.get())
+            starts, ends = AddressSpaceMap.parse_allocations(self.txt_allocations.get("0.0", "end").splitlines())
+        except ValueError as e:
+            self.label_info.configure(text=f"Fehler: {e}", text_color="red")
+            return
+        if self.file_allocations is not None:
+            starts = np.concatenate([starts, self.file_allocations[0]])
+            ends = np.concatenate([ends, self.file_allocations[1]])
+
+        start = time.perf_counter()
+        self.map.mark(starts, ends)
+        self.build_ms = (time.perf_counter() - start) * 1000
+        self.view_stack = []
+        self.view = (self.map.base, self.map.prefix)
+        self.render()
+
+    def render(self):
+        base, prefix = self.view
+        self.grid = grid = self.map.heatmap(base, prefix)
+        side, per_cell = self.map.view_shape(prefix)
+        self.scale = max(1, self.CANVAS_SIZE // side)
+        self.photo = tk.PhotoImage(data=AddressSpaceMap.to_ppm(grid), format="PPM")
+        if self.scale > 1:
+            self.photo = self.photo.zoom(self.scale)
+        self.canvas.itemconfigure(self.canvas_image, image=self.photo)
+
+        total = 1 << (32 - prefix)
+        used = int(round(grid.mean() * total))
+        cell_prefix = 33 - per_cell.bit_length()
+        self.label_info.configure(
+            text=f"Ansicht {NetworkEngine.int_to_ip(base)}/{prefix}: {used:,} von {total:,} Adressen belegt "
+                 f"({used / total:.1%})\n1 Zelle = /{cell_prefix} ({per_cell} Adressen), "
+                 f"Aufbau {self.build_ms:.0f} ms".replace(",", "."),
+            text_color=("gray10", "gray90"))
+
+    def cell_at(self, event):
+        if not self.view:
+            return None
+        side, _ = self.map.view_shape(self.view[1])
+        col, row = event.x // self.scale, event.y // self.scale
+        if not (0 <= col < side and 0 <= row < side):
+            return None
+        return self.map.cell_prefix(*self.view, col, row), (row, col)
+
+    def zoom_in(self, event):
+        cell = self.cell_at(event)
+        if not cell:
+            return
+        (address, _), _ = cell
+        prefix = min(self.view[1] + self.ZOOM_BITS, 32 - AddressSpaceMap.MIN_VIEW_BITS)
+        if prefix == self.view[1]:
+            return
+        self.view_stack.append(self.view)
+        self.view = (address & ~((1 << (32 - prefix)) - 1) & 0xFFFFFFFF, prefix)
+        self.render()
+
+    def zoom_out(self, event=None):
+        if self.view_stack:
+            self.view = self.view_stack.pop()
+            self.render()
+
+    def on_hover(self, event):
+        cell = self.cell_at(event)
+        if not cell:
+            return
+        (address, prefix), (row, col) = cell
+        self.label_hover.configure(text=f"{NetworkEngine.int_to_ip(address)}/{prefix}: {self.grid[row, col]:.0%} belegt")
+
+
+class ZoneGeneratorWindow(ctk.CTkToplevel):
+    """
+    Erzeugt PTR-Records, hosts-Einträge oder eine DHCP-Deklaration für ein
+    IPv4/IPv6-Netz und schreibt sie gestreamt in eine Datei.
+    """
+    def __init__(self, master, network="", **kwargs):
+        super().__init__(master, **kwargs)
+        self.task = None
+
+        self.title("Zonen-/Hosts-Generator")
+        self.geometry("520x380")
+        self.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkLabel(self, text="Netz (IPv4/IPv6):").grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
+        self.entry_network = ctk.CTkEntry(self, placeholder_text="z.B. 10.0.0.0/16 oder 2001:db8::/64")
+        self.entry_network.insert(0, network)
+        self.entry_network.grid(row=0, column=1, padx=10, pady=(10, 5), sticky="ew")
+
+        ctk.CTkLabel(self, text="Format:").grid(row=1, column=0, padx=10, pady=5, sticky="w")
+        self.option_format = ctk.CTkOptionMenu(self, values=list(ZoneGenerator.FORMATS))
+        self.option_format.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
+
+        ctk.CTkLabel(self, text="Domain:").grid(row=2, column=0, padx=10, pady=5, sticky="w")
+        self.entry_domain = ctk.CTkEntry(self)
+        self.entry_domain.insert(0, "example.com")
+        self.entry_domain.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+
+        ctk.CTkLabel(self, text="Hostname-Vorlage:").grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        self.entry_template = ctk.CTkEntry(self)
+        self.entry_template.insert(0, "host-{ip}")
+        self.entry_template.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+        ctk.CTkLabel(self, text="{ip} = Adresse mit '-', {n} = laufende Nummer", text_color="gray60",
+                     font=("Arial", 10)).grid(row=4, column=1, padx=10, sticky="w")
+
+        ctk.CTkLabel(self, text="Max. Anzahl:").grid(row=5, column=0, padx=10, pady=5, sticky="w")
+        self.entry_limit = ctk.CTkEntry(self, placeholder_text="leer = alle (IPv6: Pflicht ab /96)")
+        self.entry_limit.grid(row=5, column=1, padx=10, pady=5, sticky="ew")
+
+        self.btn_generate = ctk.CTkButton(self, text="Erzeugen...", command=self.generate)
+        self.btn_generate.grid(row=6, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
+
+        self.progress = ctk.CTkProgressBar(self)
+        self.progress.set(0)
+        self.progress.grid(row=7, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
+        self.label_status = ctk.CTkLabel(self, text="", text_color="gray60")
+        self.label_status.grid(row=8, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+
+    def generate(self):
+        # Laufende Erzeugung abbrechen
+        if self.task:
+            self.task.cancel()
+            return
+
+        fmt = ZoneGenerator.FORMATS[self.option_format.get()]
+        try:
+            limit_txt = self.entry_limit.get().strip().replace(".", "")
+            generator = ZoneGenerator(self.entry_network.get(), self.entry_domain.get(),
+                                      self.entry_template.get(), int(limit_txt) if limit_txt else None)
+        except ValueError as e:
+            self.label_status.configure(text=f"Fehler: {e}", text_color="red")
+            return
+
+        path = filedialog.asksaveasfilename(defaultextension=".zone" if fmt == "ptr" else ".txt",
+                                            filetypes=ZoneGenerator.FILETYPES)
+        if not path:
+            return
+        start = time.perf_counter()
+
+        def on_progress(value):
+            done, total = value
+            rate = done / max(time.perf_counter() - start, 1e-6)
+            self.progress.set(done / total)
+            self.label_status.configure(text=f"{done:,} / {total:,} Records ({rate:,.0f}/s)".replace(",", "."),
+                                        text_color="gray60")
+
+        def on_done(count, error):
+            self.task = None
+            self.btn_generate.configure(text="Erzeugen...")
+            if error:
+                self.progress.set(0)
+                msg = "Abgebrochen" if isinstance(error, InterruptedError) else f"Fehler: {error}"
+                self.label_status.configure(text=msg, text_color="red")
+                return
+            self.progress.set(1)
+            seconds = time.perf_counter() - start
+            self.label_status.configure(
+                text=f"{count:,} Records in {seconds:.1f} s → {os.path.basename(path)}".replace(",", "."),
+                text_color="gray60")
+
+        self.progress.set(0)
+        self.btn_generate.configure(text="Abbrechen")
+        self.task = BackgroundTask(self, lambda progress: generator.write(path, fmt, progress),
+                                   on_progress, on_done).start()
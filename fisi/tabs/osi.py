@@ -0,0 +1,83 @@
+import customtkinter as ctk
+import time
+
+from ..ports import PortIndex
+from ..widgets import VirtualList
+
+
+class OSITab(ctk.CTkFrame):
+    """
+    Tab für das OSI-Schichtmodell.
+    Mit Protokoll-/Port-Suche (IANA).
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        
+        self.label_title = ctk.CTkLabel(self, text="OSI-Schichtmodell", font=("Arial", 20, "bold"))
+        self.label_title.pack(pady=10)
+
+        # Protokoll-/Port-Suche (Index wird erst in on_show geladen)
+        self.port_index = None
+        self.frame_search = ctk.CTkFrame(self)
+        self.frame_search.pack(fill="x", padx=10)
+        self.frame_search.grid_columnconfigure(0, weight=1)
+
+        self.entry_search = ctk.CTkEntry(self.frame_search, placeholder_text="Protokoll, Port oder Schicht suchen (z.B. http, 443, L4)")
+        self.entry_search.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        self.entry_search.bind("<KeyRelease>", self.search)
+        self.label_search = ctk.CTkLabel(self.frame_search, text="", text_color="gray60")
+        self.label_search.grid(row=0, column=1, padx=10, pady=5)
+
+        self.list_ports = VirtualList(self.frame_search, height=180)
+        self.list_ports.grid(row=1, column=0, columnspan=2, padx=5, pady=(0, 5), sticky="ew")
+
+        self.scroll_frame = ctk.CTkScrollableFrame(self)
+        self.scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Data for layers (7 to 1)
+        layers = [
+            (7, "Anwendungsschicht (Application)", "Stellt Funktionen für Anwendungen bereit (Datenaustausch, E-Mail).", "HTTP, FTP, SMTP, DNS", "Daten"),
+            (6, "Darstellungsschicht (Presentation)", "Umwandlung der Systemabhängigen Daten in ein unabhängiges Format (Verschlüsselung, Kompression).", "ASCII, JPEG, SSL/TLS", "Daten"),
+            (5, "Sitzungsschicht (Session)", "Steuerung der Verbindungen und des Datenaustauschs.", "RPC, NetBIOS", "Daten"),
+            (4, "Transportschicht (Transport)", "Segmentierung des Datenstroms, Staukontrolle, Fehlerkorrektur.", "TCP, UDP", "Segmente"),
+            (3, "Vermittlungsschicht (Network)", "Logische Adressierung (IP) und Routing.", "IP, ICMP, IPsec", "Pakete"),
+            (2, "Sicherungsschicht (Data Link)", "Physische Adressierung (MAC), Zugriffskontrolle, Fehlererkennung.", "Ethernet, WLAN, ARP", "Frames"),
+            (1, "Bitübertragungsschicht (Physical)", "Übertragung der Bitfolge über das Medium (Kabel, Funk).", "DSL, ISDN, Bluetooth", "Bits")
+        ]
+
+        for num, name, desc, protos, pdu in layers:
+            card = ctk.CTkFrame(self.scroll_frame)
+            card.pack(fill="x", pady=5, padx=5)
+            
+            # Header
+            header = ctk.CTkFrame(card, fg_color="#1f6aa5", height=30)
+            header.pack(fill="x")
+            ctk.CTkLabel(header, text=f"{num}. {name}", text_color="white", font=("Arial", 12, "bold")).pack(side="left", padx=10)
+            ctk.CTkLabel(header, text=f"PDU: {pdu}", text_color="white", font=("Arial", 10)).pack(side="right", padx=10)
+
+            # Content
+            content = ctk.CTkFrame(card, fg_color="transparent")
+            content.pack(fill="x", padx=10, pady=5)
+            
+            ctk.CTkLabel(content, text=desc, wraplength=400, justify="left").pack(anchor="w")
+            ctk.CTkLabel(content, text=f"Protokolle: {protos}", text_color="gray70", font=("Arial", 10)).pack(anchor="w", pady=(5,0))
+
+    def on_show(self):
+        if self.port_index is not None:
+            return
+        try:
+            self.port_index = PortIndex.load()
+        except OSError:
+            self.label_search.configure(text=f"{PortIndex.FILE} nicht gefunden", text_color="red")
+            return
+        self.list_ports.format_row = self.port_index.format_entry
+        self.search()
+
+    def search(self, event=None):
+        if self.port_index is None:
+            return
+        start = time.perf_counter()
+        results = self.port_index.search(self.entry_search.get())
+        elapsed = time.perf_counter() - start
+        self.list_ports.set_items(results)
+        self.label_search.configure(text=f"{len(results)} Treffer ({elapsed * 1e6:.0f} µs)", text_color="gray60")
@@ -0,0 +1,102 @@
+import customtkinter as ctk
+from tkinter import messagebox, filedialog
+
+from ..settings import AppSettings
+
+
+class SettingsTab(ctk.CTkFrame):
+    """
+    Tab für Einstellungen (Design, Skalierung, Speicher-Profiling).
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        
+        self.label_title = ctk.CTkLabel(self, text="Einstellungen", font=("Arial", 20, "bold"))
+        self.label_title.pack(pady=20)
+
+        # Erscheinungsbild
+        self.frame_appearance = ctk.CTkFrame(self)
+        self.frame_appearance.pack(pady=10, padx=20, fill="x")
+        
+        ctk.CTkLabel(self.frame_appearance, text="Erscheinungsbild:", font=("Arial", 14)).pack(side="left", padx=20, pady=10)
+        self.option_appearance = ctk.CTkOptionMenu(self.frame_appearance, values=AppSettings.APPEARANCE_MODES,
+                                                   command=self.change_appearance)
+        settings = getattr(master, "settings", None)
+        self.option_appearance.set(settings["appearance"] if settings else ctk.get_appearance_mode())
+        self.option_appearance.pack(side="right", padx=20, pady=10)
+
+        # Skalierung
+        self.frame_scaling = ctk.CTkFrame(self)
+        self.frame_scaling.pack(pady=10, padx=20, fill="x")
+        
+        ctk.CTkLabel(self.frame_scaling, text="UI Skalierung:", font=("Arial", 14)).pack(side="left", padx=20, pady=10)
+        self.option_scaling = ctk.CTkOptionMenu(self.frame_scaling, values=AppSettings.SCALINGS,
+                                                command=self.change_scaling)
+        self.option_scaling.set(settings["scaling"] if settings else "100%")
+        self.option_scaling.pack(side="right", padx=20, pady=10)
+
+        # Speicher-Profiling
+        self.memory = getattr(master, "memory", None)
+        if self.memory:
+            self.frame_memory = ctk.CTkFrame(self)
+            self.frame_memory.pack(pady=10, padx=20, fill="both", expand=True)
+            self.frame_memory.grid_columnconfigure(0, weight=1)
+            self.frame_memory.grid_rowconfigure(1, weight=1)
+
+            self.switch_memory = ctk.CTkSwitch(self.frame_memory, text="Speicher-Profiling (tracemalloc, verlangsamt die App)",
+                                               font=("Arial", 14), command=self.toggle_memory)
+            self.switch_memory.grid(row=0, column=0, padx=20, pady=10, sticky="w")
+            if self.memory.enabled:
+                self.switch_memory.select()
+            ctk.CTkButton(self.frame_memory, text="Aktualisieren", width=110, command=self.show_memory).grid(
+                row=0, column=1, padx=5, pady=10)
+            ctk.CTkButton(self.frame_memory, text="JSON speichern...", width=130, command=self.dump_memory).grid(
+                row=0, column=2, padx=(5, 20), pady=10)
+
+            self.txt_memory = ctk.CTkTextbox(self.frame_memory, height=200, font=("Consolas", 12),
+                                             fg_color=("gray95", "gray15"), wrap="none")
+            self.txt_memory.grid(row=1, column=0, columnspan=3, padx=20, pady=(0, 10), sticky="nsew")
+            self.show_memory()
+
+    def on_show(self):
+        if self.memory:
+            self.show_memory()
+
+    def toggle_memory(self):
+        if self.switch_memory.get():
+            self.memory.enable()
+        else:
+            self.memory.disable()
+        self.show_memory()
+
+    def show_memory(self):
+        if self.memory.enabled or self.memory.entries:
+            text = self.memory.format_report()
+        else:
+            text = ("Aus. Nach dem Einschalten werden Tabs beim ersten Öffnen und alle Berechnungen gemessen.\n"
+                    "Für die Messung aller Tabs ab Programmstart: python fisi_toolkit.py --profile-memory")
+        self.txt_memory.configure(state="normal")
+        self.txt_memory.delete("0.0", "end")
+        self.txt_memory.insert("0.0", text)
+        self.txt_memory.configure(state="disabled")
+
+    def dump_memory(self):
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            self.memory.dump(path)
+        except OSError as e:
+            messagebox.showerror("Fehler", f"Speichern fehlgeschlagen!\n{e}")
+
+    def change_appearance(self, new_appearance_mode: str):
+        if hasattr(self.master, "change_appearance_mode_event"):
+            self.master.change_appearance_mode_event(new_appearance_mode)
+        else:
+            ctk.set_appearance_mode(new_appearance_mode)
+
+    def change_scaling(self, new_scaling: str):
+        if hasattr(self.master, "change_scaling_event"):
+            self.master.change_scaling_event(new_scaling)
+        else:
+            ctk.set_widget_scaling(AppSettings.scaling_factor(new_scaling))
@@ -0,0 +1,312 @@
+import customtkinter as ctk
+from tkinter import messagebox, filedialog
+import time
+
+from ..raid import RaidEngine
+from ..widgets import HistoryBar, export_rows_async
+
+
+class StorageTab(ctk.CTkFrame):
+    """
+    Tab für Speicher-Berechnungen (RAID).
+    Funktionen:
+    - RAID 0, 1, 5, 6, 10, 50, 60 (Spans konfigurierbar)
+    - Unterschiedlich große Disks (Größenliste) inkl. Verschnitt pro Disk
+    - Berechnung Brutto/Netto Kapazität
+    - Anzeige der Verschnitt/Paritäts-Infos
+    - Günstigste Konfiguration für eine Ziel-Kapazität (Katalog-Suche)
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        
+        self.engine = RaidEngine()
+        self.history = getattr(master, "history", None)
+
+        self.grid_columnconfigure(1, weight=1)
+
+        self.label_title = ctk.CTkLabel(self, text="RAID Kalkulator", font=("Arial", 20, "bold"))
+        self.label_title.grid(row=0, column=0, columnspan=2, pady=10, padx=10, sticky="ew")
+
+        # RAID Level Auswahl
+        self.label_raid = ctk.CTkLabel(self, text="RAID Level:")
+        self.label_raid.grid(row=2, column=0, padx=10, pady=5, sticky="w")
+        self.option_raid = ctk.CTkOptionMenu(self, values=RaidEngine.LEVELS)
+        self.option_raid.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+
+        # Festplatten Anzahl
+        self.label_disks = ctk.CTkLabel(self, text="Anzahl Festplatten:")
+        self.label_disks.grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        self.entry_disks = ctk.CTkEntry(self, placeholder_text="Mind. je nach RAID")
+        self.entry_disks.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+
+        # Kapazität pro Disk
+        self.label_size = ctk.CTkLabel(self, text="Größe pro Disk (GB):")
+        self.label_size.grid(row=4, column=0, padx=10, pady=5, sticky="w")
+        self.entry_size = ctk.CTkEntry(self, placeholder_text="z.B. 1000 oder je Disk: 4000; 4000; 8000")
+        self.entry_size.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
+
+        # Spans (nur RAID 50/60)
+        self.label_spans = ctk.CTkLabel(self, text="Spans (RAID 50/60):")
+        self.label_spans.grid(row=5, column=0, padx=10, pady=5, sticky="w")
+        self.entry_spans = ctk.CTkEntry(self)
+        self.entry_spans.insert(0, "2")
+        self.entry_spans.grid(row=5, column=1, padx=10, pady=5, sticky="ew")
+
+        # Berechnen Button
+        self.btn_calc = ctk.CTkButton(self, text="Berechnen", command=self.calculate_raid)
+        self.btn_calc.grid(row=6, column=0, columnspan=2, pady=15, padx=10, sticky="ew")
+
+        # Ergebnisse Bereich (Cards)
+        self.result_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.result_frame.grid(row=7, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
+        self.grid_rowconfigure(7, weight=1)
+
+        def create_card(parent, title, value_var, row, col):
+            card = ctk.CTkFrame(parent)
+            card.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
+            
+            lbl_title = ctk.CTkLabel(card, text=title, font=("Arial", 12, "bold"), text_color="gray70")
+            lbl_title.pack(anchor="w", padx=10, pady=(5,0))
+            
+            lbl_val = ctk.CTkLabel(card, textvariable=value_var, font=("Consolas", 14))
+            lbl_val.pack(anchor="w", padx=10, pady=(0,5))
+            return card
+
+        self.result_frame.grid_columnconfigure(0, weight=1)
+        self.result_frame.grid_columnconfigure(1, weight=1)
+
+        # Variablen
+        self.var_brutto = ctk.StringVar(value="---")
+        self.var_netto = ctk.StringVar(value="---")
+        self.var_effizienz = ctk.StringVar(value="---")
+        self.var_toleranz = ctk.StringVar(value="---")
+        self.var_formel = ctk.StringVar(value="---")
+        self.var_verschnitt = ctk.StringVar(value="---")
+
+        create_card(self.result_frame, "Brutto Kapazität", self.var_brutto, 0, 0)
+        create_card(self.result_frame, "Netto Kapazität", self.var_netto, 0, 1)
+        create_card(self.result_frame, "Effizienz", self.var_effizienz, 1, 0)
+        create_card(self.result_frame, "Ausfallsicherheit", self.var_toleranz, 1, 1)
+        
+        # Formel Card (Full Width)
+        card_formula = ctk.CTkFrame(self.result_frame)
+        card_formula.grid(row=2, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        ctk.CTkLabel(card_formula, text="Verwendete Formel", font=("Arial", 12, "bold"), text_color="gray70").pack(anchor="w", padx=10, pady=(5,0))
+        ctk.CTkLabel(card_formula, textvariable=self.var_formel, font=("Consolas", 14, "italic")).pack(anchor="w", padx=10, pady=(0,5))
+
+        # Verschnitt Card (Full Width)
+        card_waste = ctk.CTkFrame(self.result_frame)
+        card_waste.grid(row=3, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        ctk.CTkLabel(card_waste, text="Verschnitt (ungenutzt)", font=("Arial", 12, "bold"), text_color="gray70").pack(anchor="w", padx=10, pady=(5,0))
+        ctk.CTkLabel(card_waste, textvariable=self.var_verschnitt, font=("Consolas", 14), wraplength=600, justify="left").pack(anchor="w", padx=10, pady=(0,5))
+
+        self.error_label = ctk.CTkLabel(self, text="", text_color="red")
+        self.error_label.grid(row=8, column=0, columnspan=2, pady=5)
+
+        # Export: alle RAID Level für 2..n Disks
+        self.btn_export = ctk.CTkButton(self, text="Sweep exportieren (alle Level, 2..n Disks)", command=self.export_sweep)
+        self.btn_export.grid(row=9, column=0, padx=10, pady=5, sticky="w")
+        self.label_export = ctk.CTkLabel(self, text="", text_color="gray60")
+        self.label_export.grid(row=9, column=1, padx=10, pady=5, sticky="w")
+
+        # Umkehrung: günstigste Konfiguration für eine Ziel-Kapazität
+        self.btn_optimize = ctk.CTkButton(self, text="Konfiguration für Ziel-Kapazität finden...", command=self.open_optimizer)
+        self.btn_optimize.grid(row=10, column=0, padx=10, pady=5, sticky="w")
+
+        # Verlauf & Favoriten
+        if self.history:
+            self.history_bar = HistoryBar(self, self.history, "storage", self.apply_history)
+            self.history_bar.grid(row=1, column=0, columnspan=2, padx=10, pady=(0, 5), sticky="e")
+
+    def read_sizes(self):
+        """Liest eine Größe (mit Disk-Anzahl) oder eine ;-getrennte Liste je Disk."""
+        parts = [p.strip().replace(",", ".") for p in self.entry_size.get().split(";") if p.strip()]
+        sizes = [float(p) for p in parts]
+        if len(sizes) > 1:
+            # Die Liste bestimmt die Anzahl der Disks
+            self.entry_disks.delete(0, "end")
+            self.entry_disks.insert(0, str(len(sizes)))
+            return sizes
+        return sizes * int(self.entry_disks.get())
+
+    def calculate_raid(self):
+        raid_type = self.option_raid.get()
+        self.error_label.configure(text="")
+        
+        try:
+            sizes = self.read_sizes()
+            spans = int(self.entry_spans.get() or 2)
+        except ValueError:
+            self.error_label.configure(text="Bitte gültige Zahlen eingeben!")
+            return
+        if not sizes:
+            self.error_label.configure(text="Bitte gültige Zahlen eingeben!")
+            return
+
+        mixed = min(sizes) != max(sizes)
+        size_key = "+".join(f"{size:g}" for size in sizes) if mixed else f"{len(sizes)}x{sizes[0]:g}"
+        key = f"{raid_type} {size_key}" + (f" ({spans} Spans)" if raid_type in ("RAID 50", "RAID 60") else "")
+        try:
+            result = self.engine.calculate_sizes(raid_type, sizes, spans)
+        except ValueError as e:
+            self.error_label.configure(text=f"Fehler: {e}")
+            return
+
+        self.var_brutto.set(f"{result['brutto']:.2f} GB")
+        self.var_netto.set(f"{result['netto']:.2f} GB")
+        self.var_effizienz.set(f"{result['efficiency']:.1f} %")
+        self.var_toleranz.set(result["fault_tolerance"])
+        self.var_formel.set(result["formula"])
+        per_disk = ", ".join(f"Disk {i}: {w:g} GB" for i, w in enumerate(result["waste"], 1) if w > 0)
+        self.var_verschnitt.set(f"{result['waste_total']:.2f} GB" + (f" ({per_disk})" if per_disk else ""))
+
+        if self.history:
+            inputs = {"raid": raid_type, "disks": len(sizes), "size": sizes[0], "spans": spans}
+            if mixed:
+                inputs["sizes"] = sizes
+            self.history_bar.record(key, inputs, result)
+
+    def apply_history(self, inputs):
+        self.option_raid.set(inputs["raid"])
+        self.entry_disks.delete(0, "end")
+        self.entry_disks.insert(0, str(inputs["disks"]))
+        self.entry_size.delete(0, "end")
+        self.entry_size.insert(0, "; ".join(f"{size:g}" for size in inputs.get("sizes", [inputs["size"]])))
+        self.entry_spans.delete(0, "end")
+        self.entry_spans.insert(0, str(inputs.get("spans", 2)))
+        self.calculate_raid()
+
+    def export_sweep(self):
+        self.error_label.configure(text="")
+        try:
+            num_disks = int(self.entry_disks.get())
+            size_disk = float(self.entry_size.get().split(";")[0].replace(",", "."))
+        except ValueError:
+            self.error_label.configure(text="Bitte gültige Zahlen eingeben!")
+            return
+
+        max_disks = min(max(num_disks, 2), RaidEngine.MAX_DISKS)
+        rows = self.engine.sweep(RaidEngine.LEVELS, range(2, max_disks + 1), [size_disk])
+        export_rows_async(self, RaidEngine.SWEEP_COLUMNS, rows, self.btn_export, self.label_export)
+
+    def open_optimizer(self):
+        RaidOptimizerWindow(self, self.engine)
+
+
+class RaidOptimizerWindow(ctk.CTkToplevel):
+    """
+    Umkehrung des RAID-Rechners: günstigste Konfigurationen für eine
+    Ziel-Kapazität aus einem Katalog von Festplatten (Name; Größe GB; Preis).
+    """
+    EXAMPLE_CATALOGUE = (
+        "HDD 4 TB; 4000; 89,90\n"
+        "HDD 8 TB; 8000; 169,00\n"
+        "HDD 12 TB; 12000; 229,00\n"
+        "HDD 16 TB; 16000; 289,00\n"
+        "HDD 20 TB; 20000; 379,00\n"
+        "SSD 1,92 TB; 1920; 189,00\n"
+        "SSD 3,84 TB; 3840; 329,00\n"
+    )
+
+    def __init__(self, master, engine, **kwargs):
+        super().__init__(master, **kwargs)
+        self.engine = engine
+        self.rows = []
+
+        self.title("RAID Konfiguration finden")
+        self.geometry("820x640")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(4, weight=1)
+
+        # Vorgaben
+        frame_inputs = ctk.CTkFrame(self)
+        frame_inputs.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+
+        ctk.CTkLabel(frame_inputs, text="Ziel Netto (GB):").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        self.entry_target = ctk.CTkEntry(frame_inputs, width=110, placeholder_text="z.B. 50000")
+        self.entry_target.grid(row=0, column=1, padx=5, pady=5)
+        ctk.CTkLabel(frame_inputs, text="Min. Ausfallsicherheit:").grid(row=0, column=2, padx=5, pady=5, sticky="w")
+        self.option_failures = ctk.CTkOptionMenu(frame_inputs, values=["0", "1", "2", "3"], width=70)
+        self.option_failures.set("1")
+        self.option_failures.grid(row=0, column=3, padx=5, pady=5)
+        ctk.CTkLabel(frame_inputs, text="Max. Slots:").grid(row=0, column=4, padx=5, pady=5, sticky="w")
+        self.entry_slots = ctk.CTkEntry(frame_inputs, width=60)
+        self.entry_slots.insert(0, "24")
+        self.entry_slots.grid(row=0, column=5, padx=5, pady=5)
+        ctk.CTkLabel(frame_inputs, text="Top:").grid(row=0, column=6, padx=5, pady=5, sticky="w")
+        self.entry_top = ctk.CTkEntry(frame_inputs, width=50)
+        self.entry_top.insert(0, "10")
+        self.entry_top.grid(row=0, column=7, padx=5, pady=5)
+
+        # Katalog
+        frame_catalogue = ctk.CTkFrame(self, fg_color="transparent")
+        frame_catalogue.grid(row=1, column=0, padx=10, sticky="ew")
+        ctk.CTkLabel(frame_catalogue, text="Katalog (Name; Größe GB; Preis)", font=("Arial", 12, "bold")).pack(side="left", padx=5)
+        ctk.CTkButton(frame_catalogue, text="CSV laden...", width=100, command=self.load_catalogue).pack(side="right", padx=5)
+
+        self.txt_catalogue = ctk.CTkTextbox(self, height=140, font=("Consolas", 12))
+        self.txt_catalogue.grid(row=2, column=0, padx=10, pady=5, sticky="ew")
+        self.txt_catalogue.insert("0.0", self.EXAMPLE_CATALOGUE)
+
+        # Aktionen
+        frame_actions = ctk.CTkFrame(self, fg_color="transparent")
+        frame_actions.grid(row=3, column=0, padx=10, pady=5, sticky="ew")
+        ctk.CTkButton(frame_actions, text="Suchen", command=self.search).pack(side="left", padx=5)
+        self.btn_export = ctk.CTkButton(frame_actions, text="Exportieren", width=100, command=self.export)
+        self.btn_export.pack(side="left", padx=5)
+        self.label_status = ctk.CTkLabel(frame_actions, text="", text_color="gray60")
+        self.label_status.pack(side="left", padx=10)
+
+        self.txt_result = ctk.CTkTextbox(self, font=("Consolas", 12), fg_color=("gray95", "gray15"))
+        self.txt_result.grid(row=4, column=0, padx=10, pady=(5, 10), sticky="nsew")
+        self.txt_result.configure(state="disabled")
+
+        self.entry_target.bind("<Return>", self.search)
+
+    def load_catalogue(self):
+        path = filedialog.askopenfilename(filetypes=[("CSV", "*.csv"), ("Text", "*.txt"), ("Alle Dateien", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, encoding="utf-8-sig") as f:
+                text = f.read()
+        except OSError as e:
+            messagebox.showerror("Fehler", f"Datei kann nicht gelesen werden:\n{e}")
+            return
+        self.txt_catalogue.delete("0.0", "end")
+        self.txt_catalogue.insert("0.0", text)
+
+    def search(self, event=None):
+        try:
+            target = float(self.entry_target.get().replace(",", "."))
+            max_disks = int(self.entry_slots.get())
+            top_n = int(self.entry_top.get())
+        except ValueError:
+            self.label_status.configure(text="Bitte gültige Zahlen eingeben!", text_color="red")
+            return
+        try:
+            catalogue = self.engine.parse_catalogue(self.txt_catalogue.get("0.0", "end"))
+            start = time.perf_counter()
+            self.rows = self.engine.optimize(target, int(self.option_failures.get()), catalogue, max_disks, top_n)
+            elapsed = time.perf_counter() - start
+        except ValueError as e:
+            self.label_status.configure(text=f"Fehler: {e}", text_color="red")
+            return
+
+        lines = [f"{'#':>3}  {'RAID':<8}{'Spans':>5}  {'SKU':<20}{'Disks':>6}{'Netto GB':>12}{'Ausfall':>8}{'Preis':>12}{'Preis/TB':>10}"]
+        for i, (raid_type, spans, name, disks, _, netto, failures, price, price_tb) in enumerate(self.rows, 1):
+            lines.append(f"{i:>3}  {raid_type:<8}{spans if spans > 1 else '-':>5}  {name[:19]:<20}{disks:>6}"
+                         f"{netto:>12,.0f}{failures:>8}{price:>12,.2f}{price_tb:>10,.2f}")
+        if not self.rows:
+            lines.append("Keine Konfiguration erfüllt die Vorgaben.")
+        self.txt_result.configure(state="normal")
+        self.txt_result.delete("0.0", "end")
+        self.txt_result.insert("0.0", "\n".join(lines))
+        self.txt_result.configure(state="disabled")
+        self.label_status.configure(text=f"{len(catalogue)} SKUs, {elapsed * 1000:.1f} ms", text_color="gray60")
+
+    def export(self):
+        if not self.rows:
+            self.label_status.configure(text="Erst suchen!", text_color="red")
+            return
+        export_rows_async(self, RaidEngine.OPTIMIZE_COLUMNS, self.rows, self.btn_export, self.label_status)
@@ -0,0 +1,178 @@
+import math
+from fractions import Fraction
+
+try:
+    import numpy as np  # Optional: beschleunigt Prüfsummen und Massenauswertungen
+except ImportError:
+    np = None
+
+from .profiler import profiled
+
+
+class UnitConverterEngine:
+    """
+    Core logic for handling unit conversions to ensure testability independent of UI.
+    """
+    BATCH_COLUMNS = ("wert", "von", "ergebnis", "nach")
+
+    def __init__(self):
+        self.units_map = {
+            "Bit":   ("Bit (b)", 1/8, "-"),
+            "Byte":  ("Byte (B)", 1, "-"),
+            "KiB":   ("Kibibyte (KiB)", 1024, "2^10"),
+            "MiB":   ("Mebibyte (MiB)", 1024**2, "2^20"),
+            "GiB":   ("Gibibyte (GiB)", 1024**3, "2^30"),
+            "TiB":   ("Tebibyte (TiB)", 1024**4, "2^40"),
+            "PiB":   ("Pebibyte (PiB)", 1024**5, "2^50"),
+            "KB":    ("Kilobyte (KB)", 1000, "10^3"),
+            "MB":    ("Megabyte (MB)", 1000**2, "10^6"),
+            "GB":    ("Gigabyte (GB)", 1000**3, "10^9"),
+            "TB":    ("Terabyte (TB)", 1000**4, "10^12"),
+            "PB":    ("Petabyte (PB)", 1000**5, "10^15")
+        }
+        self.unit_names = list(self.units_map.keys())
+
+        # Datenraten in Bit pro Sekunde (dezimal und binär)
+        self.rate_units_map = {
+            "bit/s":   ("Bit pro Sekunde (bit/s)", 1, "-"),
+            "Kbit/s":  ("Kilobit/s (Kbit/s)", 1000, "10^3"),
+            "Mbit/s":  ("Megabit/s (Mbit/s)", 1000**2, "10^6"),
+            "Gbit/s":  ("Gigabit/s (Gbit/s)", 1000**3, "10^9"),
+            "Tbit/s":  ("Terabit/s (Tbit/s)", 1000**4, "10^12"),
+            "Kibit/s": ("Kibibit/s (Kibit/s)", 1024, "2^10"),
+            "Mibit/s": ("Mebibit/s (Mibit/s)", 1024**2, "2^20"),
+            "Gibit/s": ("Gibibit/s (Gibit/s)", 1024**3, "2^30"),
+            "Tibit/s": ("Tebibit/s (Tibit/s)", 1024**4, "2^40")
+        }
+        self.rate_unit_names = list(self.rate_units_map.keys())
+
+        # Faktor-Matrix: factor_matrix[src][i] rechnet src direkt in unit_names[i] um
+        self.factor_matrix = {
+            src: [float(Fraction(src_factor) / Fraction(dst_factor))
+                  for _, dst_factor, _ in self.units_map.values()]
+            for src, (_, src_factor, _) in self.units_map.items()
+        }
+
+    def parse_input(self, val_str: str) -> float:
+        """Parses German formatted number string to float."""
+        if not val_str:
+            raise ValueError("Empty input")
+        return float(val_str.replace(".", "").replace(",", "."))
+
+    @profiled
+    def convert(self, val: float, src_unit: str, dst_unit: str) -> tuple[float, float]:
+        """Converts value from source unit to destination unit. Returns (result_value, bytes_value)."""
+        _, src_factor, _ = self.units_map[src_unit]
+        _, dst_factor, _ = self.units_map[dst_unit]
+        
+        bytes_val = val * src_factor
+        result = bytes_val / dst_factor
+        return result, bytes_val
+
+    @profiled
+    def convert_all(self, val: float, src_unit: str) -> list:
+        """Converts val into every unit of unit_names in one pass (same order)."""
+        return [val * factor for factor in self.factor_matrix[src_unit]]
+
+    def transfer_time(self, size: float, size_unit: str, rate: float, rate_unit: str,
+                      efficiency: float = 1.0) -> float:
+        """Returns the seconds needed to move size over a link of rate at the given efficiency (0..1]."""
+        effective = rate * self.rate_units_map[rate_unit][1] * efficiency
+        if effective <= 0:
+            raise ValueError("Bandbreite und Effizienz müssen größer 0 sein")
+        return size * self.units_map[size_unit][1] * 8 / effective
+
+    def required_rate(self, size: float, size_unit: str, seconds: float, rate_unit: str,
+                      efficiency: float = 1.0) -> float:
+        """Solves for the nominal link rate (in rate_unit) that moves size within seconds."""
+        if seconds <= 0 or efficiency <= 0:
+            raise ValueError("Zeitfenster und Effizienz müssen größer 0 sein")
+        rate = size * self.units_map[size_unit][1] * 8 / (seconds * efficiency) / self.rate_units_map[rate_unit][1]
+        if not math.isfinite(rate):
+            raise ValueError("Bandbreite nicht darstellbar (Werte zu groß oder zu klein)")
+        return rate
+
+    @profiled
+    def transfer_grid(self, sizes, rates, efficiencies) -> list:
+        """What-if table in one pass. sizes: [(value, unit)], rates: [(value, unit)],
+        efficiencies: [0..1]. Returns one row of seconds per size; the columns follow
+        itertools.product(rates, efficiencies)."""
+        rate_bits = [rate * self.rate_units_map[rate_unit][1] for rate, rate_unit in rates]
+        size_bits = [size * self.units_map[size_unit][1] * 8 for size, size_unit in sizes]
+        if np is not None:
+            effective = np.outer(np.asarray(rate_bits, dtype=np.float64), np.asarray(efficiencies, dtype=np.float64)).ravel()
+            if not (effective > 0).all():
+                raise ValueError("Bandbreite und Effizienz müssen größer 0 sein")
+            return (np.asarray(size_bits, dtype=np.float64)[:, None] / effective[None, :]).tolist()
+
+        effective_rates = [bits * efficiency for bits in rate_bits for efficiency in efficiencies]
+        if not all(effective > 0 for effective in effective_rates):
+            raise ValueError("Bandbreite und Effizienz müssen größer 0 sein")
+        return [[bits / effective for effective in effective_rates] for bits in size_bits]
+
+    def format_duration(self, seconds: float) -> str:
+        """Formats seconds as 'T d HH:MM:SS' (or German seconds below one minute). Raises ValueError."""
+        if not math.isfinite(seconds):
+            raise ValueError("Dauer nicht darstellbar (Werte zu groß oder zu klein)")
+        if seconds < 60:
+            return f"{self.format_number(seconds)} s"
+        total = int(round(seconds))
+        days, rest = divmod(total, 86400)
+        hours, rest = divmod(rest, 3600)
+        minutes, secs = divmod(rest, 60)
+        clock = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return f"{days} d {clock}" if days else clock
+
+    def convert_batch(self, values, src_unit: str, dst_unit: str):
+        """Lazily yields BATCH_COLUMNS rows for every value in values."""
+        src_factor = self.units_map[src_unit][1]
+        dst_factor = self.units_map[dst_unit][1]
+        for val in values:
+            yield (val, src_unit, val * src_factor / dst_factor, dst_unit)
+
+    def format_number(self, n: float) -> str:
+        """Formats float to German number string."""
+        if n >= 1 or n == 0:
+            res_str = f"{n:,.4f}".replace(",", "X").replace(".", ",").replace("X", ".")
+            if "," in res_str:
+                res_str = res_str.rstrip("0").rstrip(",")
+        else:
+            res_str = f"{n:.10f}".replace(".", ",")
+            res_str = res_str.rstrip("0").rstrip(",")
+        return res_str
+    
+    @profiled
+    def generate_explanation(self, val: float, src: str, dst: str, bytes_val: float, result: float) -> str:
+        """Generates step-by-step explanation for the conversion."""
+        _, src_factor, src_base = self.units_map[src]
+        _, dst_factor, dst_base = self.units_map[dst]
+        
+        lines = []
+        
+        # Helper for formatting numbers in text (reusing format_number)
+        def fmt(n): return self.format_number(n)
+
+        # Schritt 1: Zu Bytes
+        if src == "Byte":
+            lines.append(f"1. {fmt(val)} {src} sind bereits Bytes.")
+        elif src == "Bit":
+            lines.append(f"1. {fmt(val)} {src} / 8 = {fmt(bytes_val)} Byte")
+        else:
+            op_str = f"* {fmt(src_factor)}"
+            if src_base != "-": op_str += f" ({src_base})"
+            lines.append(f"1. {fmt(val)} {src} in Byte umrechnen:")
+            lines.append(f"   {fmt(val)} {op_str} = {fmt(bytes_val)} Byte")
+
+        # Schritt 2: Zu Ziel
+        if dst == "Byte":
+            lines.append(f"2. {fmt(bytes_val)} Byte ist die Zieleinheit.")
+        elif dst == "Bit":
+            lines.append(f"2. {fmt(bytes_val)} Byte * 8 = {fmt(result)} Bit")
+        else:
+            res_str = self.format_number(result) # Use format_number for consistency
+            lines.append(f"2. {fmt(bytes_val)} Byte in {dst} umrechnen:")
+            op_str = f"/ {fmt(dst_factor)}"
+            if dst_base != "-": op_str += f" ({dst_base})"
+            lines.append(f"   {fmt(bytes_val)} {op_str} = {res_str} {dst}")
+            
+        return "\n".join(lines)
@@ -0,0 +1,211 @@
+import customtkinter as ctk
+from tkinter import messagebox, filedialog
+import threading
+
+from .export import ResultExporter
+
+
+class BackgroundTask:
+    """
+    Führt func(progress) in einem Thread aus.
+    Fortschritt und Ergebnis holt die UI per after() ab.
+    """
+    POLL_MS = 100
+
+    def __init__(self, widget, func, on_progress=None, on_done=None):
+        self.widget = widget
+        self.func = func
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.progress = None
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        self.widget.after(self.POLL_MS, self._poll)
+        return self
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _set_progress(self, value):
+        if self.cancelled:
+            raise InterruptedError("Abgebrochen")
+        self.progress = value
+
+    def _run(self):
+        try:
+            self.result = self.func(self._set_progress)
+        except Exception as e:
+            self.error = e
+
+    def _poll(self):
+        if self.on_progress and self.progress is not None:
+            self.on_progress(self.progress)
+        if self._thread.is_alive():
+            self.widget.after(self.POLL_MS, self._poll)
+        elif self.on_done:
+            self.on_done(self.result, self.error)
+
+
+class HistoryBar(ctk.CTkFrame):
+    """
+    Verlauf-Suche (Präfix) und Favoriten-Stern für einen Tab.
+    Gespeichert wird nur bei einer ausdrücklichen Berechnung (record/commit),
+    nicht bei jedem Zwischenstand beim Tippen.
+    """
+    def __init__(self, master, store, tab_name, on_select, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.store = store
+        self.tab_name = tab_name
+        self.on_select = on_select
+        self.entries = {}
+        self.current = None
+        self.committed_key = None
+
+        ctk.CTkLabel(self, text="Verlauf:", font=("Arial", 11), text_color="gray60").pack(side="left", padx=(0, 5))
+
+        self.combo = ctk.CTkComboBox(self, values=[], width=220, command=self.select)
+        self.combo.set("")
+        self.combo.pack(side="left")
+        self.combo.bind("<KeyRelease>", self.refresh)
+
+        self.btn_star = ctk.CTkButton(self, text="☆", width=28, command=self.save_preset,
+                                      fg_color="transparent", text_color=("gray10", "gray90"),
+                                      hover_color=("gray70", "gray30"))
+        self.btn_star.pack(side="left", padx=(5, 0))
+
+        self.refresh()
+
+    def refresh(self, event=None):
+        prefix = self.combo.get() if event else ""
+        self.entries = dict(self.store.search(self.tab_name, prefix))
+        self.combo.configure(values=list(self.entries))
+
+    def select(self, key):
+        if key in self.entries:
+            self.on_select(self.entries[key])
+
+    def set_current(self, key, inputs, result):
+        """Merkt sich die angezeigte Berechnung für Favorit und commit(), ohne sie zu speichern."""
+        self.current = (key, inputs, result)
+
+    def clear(self):
+        """Nach ungültiger Eingabe: nichts speichern, bis wieder ein Ergebnis angezeigt wird."""
+        self.current = None
+
+    def commit(self, event=None):
+        """Schreibt die angezeigte Berechnung in den Verlauf (einmal je Schlüssel in Folge)."""
+        if self.current and self.current[0] != self.committed_key:
+            self.store.record(self.tab_name, *self.current)
+            self.committed_key = self.current[0]
+
+    def record(self, key, inputs, result):
+        self.set_current(key, inputs, result)
+        self.commit()
+
+    def save_preset(self):
+        if self.current:
+            key, inputs, _ = self.current
+            self.store.save_preset(self.tab_name, key, inputs)
+            self.btn_star.configure(text="★")
+            self.after(800, lambda: self.btn_star.configure(text="☆"))
+
+
+def export_rows_async(widget, columns, rows, button=None, status_label=None):
+    """Asks for a target file and streams rows there in a background thread."""
+    path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=ResultExporter.FILETYPES)
+    if not path:
+        return
+
+    def run(progress):
+        with ResultExporter(path, columns) as exporter:
+            return exporter.write_rows(rows, progress)
+
+    def on_progress(count):
+        if status_label:
+            status_label.configure(text=f"{count:,} Zeilen...".replace(",", "."))
+
+    def on_done(count, error):
+        if button:
+            button.configure(state="normal")
+        if error:
+            if status_label: status_label.configure(text="")
+            messagebox.showerror("Fehler", f"Export fehlgeschlagen!\n{error}")
+        elif status_label:
+            status_label.configure(text=f"{count:,} Zeilen exportiert".replace(",", "."))
+
+    if button:
+        button.configure(state="disabled")
+    BackgroundTask(widget, run, on_progress, on_done).start()
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Liste mit beliebig vielen Zeilen: Es werden nur die sichtbaren Zeilen
+    über format_row(item) als Text gerendert, statt ein Widget pro Eintrag.
+    """
+    FONT_SIZE = 12
+
+    def __init__(self, master, format_row=str, **kwargs):
+        super().__init__(master, **kwargs)
+        self.format_row = format_row
+        self.items = []
+        self.top = 0
+        self.visible_rows = 1
+        self.line_height = ctk.CTkFont(family="Consolas", size=self.FONT_SIZE).metrics("linespace")
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        self.txt = ctk.CTkTextbox(self, wrap="none", activate_scrollbars=False,
+                                  font=("Consolas", self.FONT_SIZE), fg_color=("gray95", "gray15"))
+        self.txt.grid(row=0, column=0, sticky="nsew")
+        self.txt.configure(state="disabled")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scroll)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.txt.bind("<Configure>", self.on_resize)
+        self.txt.bind("<MouseWheel>", self.on_wheel)
+        self.txt.bind("<Button-4>", self.on_wheel)
+        self.txt.bind("<Button-5>", self.on_wheel)
+
+    def set_items(self, items):
+        """items: beliebige Sequenz (Liste, range, ...)."""
+        self.items = items
+        self.top = 0
+        self.render()
+
+    def render(self):
+        count = len(self.items)
+        self.top = max(0, min(self.top, count - self.visible_rows))
+        lines = [self.format_row(item) for item in self.items[self.top:self.top + self.visible_rows]]
+        self.txt.configure(state="normal")
+        self.txt.delete("0.0", "end")
+        self.txt.insert("0.0", "\n".join(lines))
+        self.txt.configure(state="disabled")
+        if count:
+            self.scrollbar.set(self.top / count, min(1.0, (self.top + self.visible_rows) / count))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def on_resize(self, event):
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        rows = max(1, int(event.height // (self.line_height * scaling)))
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.render()
+
+    def on_scroll(self, action, value, unit=None):
+        if action == "moveto":
+            self.top = int(float(value) * len(self.items))
+        else:
+            self.top += int(value) * (self.visible_rows if unit == "pages" else 1)
+        self.render()
+
+    def on_wheel(self, event):
+        self.top += -3 if event.num == 4 or event.delta > 0 else 3
+        self.render()
+        return "break"
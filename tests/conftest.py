@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Unit tests: python -m pytest tests
+# The standalone scripts (gen_comparison.py, load_test.py, mem_benchmark.py) are not collected.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
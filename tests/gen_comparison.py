@@ -1,27 +1,43 @@
 import sys
 import os
 import random
+import argparse
+import hashlib
+import ipaddress
+import json
+import time
+import zlib
+from fractions import Fraction
+from multiprocessing import Pool, cpu_count
 
-# Add parent directory to path to import fisi_toolkit
+# Add parent directory to path to import the fisi package
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from fisi_toolkit import UnitConverterEngine
+from fisi.units import UnitConverterEngine
+from fisi.network import NetworkEngine
+from fisi.logic import LogicEngine
+from fisi.raid import RaidEngine
+from fisi.checksum import ChecksumEngine
+
+# Relative tolerance for float conversions against the exact Fraction reference
+REL_TOLERANCE = 4 * sys.float_info.epsilon
+
 
 def generate_cases():
     engine = UnitConverterEngine()
     units = engine.unit_names
-    
+
     interesting_pairs = [
-        ("KB", "Byte"), ("KiB", "Byte"), 
+        ("KB", "Byte"), ("KiB", "Byte"),
         ("GB", "MB"), ("GiB", "MiB"),
         ("TB", "TiB"), ("Bit", "Byte")
     ]
-    
+
     with open("tests/comparison_results.md", "w", encoding="utf-8") as f:
         f.write("# Local Unit Helper Conversion Results\n\n")
         f.write("| # | Value | Source | Dest | Local Result | Bytes Value |\n")
         f.write("|---|---|---|---|---|---|\n")
-        
+
         count = 1
         # 1. Guaranteed interesting cases (12 cases)
         for src, dst in interesting_pairs:
@@ -36,12 +52,463 @@ def generate_cases():
             src = random.choice(units)
             dst = random.choice(units)
             if src == dst: continue
-            
+
             val = round(random.uniform(0.1, 10000.0), 4)
             res, bytes_val = engine.convert(val, src, dst)
             f.write(f"| {count} | {val} | {src} | {dst} | {res:g} | {bytes_val:g} |\n")
             count += 1
 
 
+# ---------------------------------------------------------------------------
+# Differential fuzzing
+#
+# Every domain provides three functions:
+#   gen_<domain>(rng)         -> random case (JSON-serializable list)
+#   check_<domain>(case)      -> None if toolkit and reference agree, else a message
+#   shrink_<domain>(case)     -> simpler candidate cases used for minimization
+# ---------------------------------------------------------------------------
+
+unit_engine = UnitConverterEngine()
+network_engine = NetworkEngine()
+logic_engine = LogicEngine()
+raid_engine = RaidEngine()
+checksum_engine = ChecksumEngine()
+
+
+# --- Subnet (NetworkEngine vs. ipaddress) ---
+
+def gen_subnet(rng):
+    cidr = rng.randint(0, 32)
+    if rng.random() < 0.05:
+        # Invalid/odd inputs: both sides must reject them
+        octets = [str(rng.choice([0, 1, 255, 256, 999, -1])) for _ in range(rng.choice([3, 4, 5]))]
+        return [".".join(octets), cidr]
+    return [str(ipaddress.IPv4Address(rng.getrandbits(32))), cidr]
+
+
+def check_subnet(case):
+    ip_str, cidr = case
+    try:
+        ref = ipaddress.IPv4Network(f"{ip_str}/{cidr}", strict=False)
+    except ValueError:
+        ref = None
+    try:
+        res = network_engine.calculate(ip_str, cidr)
+    except ValueError:
+        res = None
+
+    if ref is None or res is None:
+        if ref is None and res is None:
+            return None
+        return f"Validierung abweichend: toolkit={res is not None} ipaddress={ref is not None}"
+
+    hosts = ref.num_addresses - 2 if ref.num_addresses > 2 else 0
+    if hosts > 0:
+        first_host = str(next(iter(ref.hosts())))
+        last_host = str(ref[-2])
+    else:
+        first_host = last_host = None
+
+    expected = {
+        "network": str(ref.network_address),
+        "netmask": str(ref.netmask),
+        "broadcast": str(ref.broadcast_address),
+        "num_hosts": hosts,
+        "first_host": first_host,
+        "last_host": last_host,
+        "bin_net": ".".join(f"{int(o):08b}" for o in str(ref.network_address).split(".")),
+    }
+    for key, value in expected.items():
+        if res[key] != value:
+            return f"{key}: toolkit={res[key]!r} ipaddress={value!r}"
+    return None
+
+
+def shrink_subnet(case):
+    ip_str, cidr = case
+    try:
+        ip = int(ipaddress.IPv4Address(ip_str))
+    except ValueError:
+        return
+    # Clear the highest set bit first, then try smaller prefixes
+    for bit in range(31, -1, -1):
+        if ip & (1 << bit):
+            yield [str(ipaddress.IPv4Address(ip & ~(1 << bit))), cidr]
+    for smaller in (0, cidr // 2, cidr - 1):
+        if 0 <= smaller < cidr:
+            yield [ip_str, smaller]
+
+
+# --- Units (UnitConverterEngine vs. Fraction) ---
+
+def gen_units(rng):
+    src = rng.choice(unit_engine.unit_names)
+    dst = rng.choice(unit_engine.unit_names)
+    kind = rng.random()
+    if kind < 0.3:
+        val = float(rng.randint(0, 10**6))
+    elif kind < 0.6:
+        val = round(rng.uniform(0.0, 10000.0), rng.randint(0, 6))
+    else:
+        val = rng.uniform(0.0, 1.0) * 10.0 ** rng.randint(-12, 18)
+    return [val, src, dst]
+
+
+def check_units(case):
+    val, src, dst = case
+    result, bytes_val = unit_engine.convert(val, src, dst)
+    src_factor = Fraction(unit_engine.units_map[src][1])
+    dst_factor = Fraction(unit_engine.units_map[dst][1])
+
+    exact_bytes = Fraction(val) * src_factor
+    exact_result = exact_bytes / dst_factor
+    all_result = unit_engine.convert_all(val, src)[unit_engine.unit_names.index(dst)]
+    for name, got, exact in (("bytes", bytes_val, exact_bytes), ("result", result, exact_result),
+                             ("convert_all", all_result, exact_result)):
+        if abs(Fraction(got) - exact) > REL_TOLERANCE * abs(exact):
+            return f"{name}: toolkit={got!r} exakt={float(exact)!r}"
+
+    # German formatting must survive a parse round trip
+    formatted = unit_engine.format_number(val)
+    parsed = unit_engine.parse_input(formatted)
+    digits = 4 if val >= 1 or val == 0 else 10
+    expected = float(f"{val:.{digits}f}")
+    if parsed != expected:
+        return f"format/parse: {formatted!r} -> {parsed!r}, erwartet {expected!r}"
+    return None
+
+
+def shrink_units(case):
+    val, src, dst = case
+    for simpler in (0.0, 1.0, float(round(val)), round(val, 2)):
+        if simpler != val:
+            yield [simpler, src, dst]
+
+
+# --- Bits (LogicEngine vs. int()) ---
+
+BASE_DIGITS = {2: "01", 10: "0123456789", 16: "0123456789abcdefABCDEF"}
+
+
+def gen_bits(rng):
+    base = rng.choice([2, 10, 16])
+    length = rng.randint(1, 40)
+    txt = "".join(rng.choice(BASE_DIGITS[base]) for _ in range(length))
+    if rng.random() < 0.05:
+        txt = rng.choice(["-", " ", "_", "x", "0x"]) + txt
+    return [txt, base]
+
+
+def check_bits(case):
+    txt, base = case
+    try:
+        ref = min(int(txt, base), LogicEngine.MAX_VALUE)
+    except ValueError:
+        ref = None
+    try:
+        val = logic_engine.parse(txt, base)
+    except ValueError:
+        val = None
+    if val != ref:
+        return f"parse: toolkit={val!r} int()={ref!r}"
+    if val is None or val < 0:
+        return None
+
+    bits = logic_engine.to_bits(val, 32)
+    if logic_engine.from_bits(bits) != val:
+        return f"bits round trip: {val} -> {bits}"
+    dec_str, hex_str, bin_str = logic_engine.format_value(val)
+    if (int(dec_str), int(hex_str, 16), int(bin_str, 2)) != (val, val, val):
+        return f"format: {val} -> {dec_str}/{hex_str}/{bin_str}"
+    return None
+
+
+def shrink_bits(case):
+    txt, base = case
+    for i in range(len(txt)):
+        if len(txt) > 1:
+            yield [txt[:i] + txt[i+1:], base]
+
+
+# --- RAID (calculate_sizes vs. calculate_batch vs. smallest-member reference) ---
+
+RAID_PARITY = {"RAID 0": 0, "RAID 5": 1, "RAID 6": 2}
+
+
+def gen_raid(rng):
+    raid_type = rng.choice(RaidEngine.LEVELS)
+    spans = rng.randint(1, 4)
+    num_disks = rng.randint(1, 16)
+    sizes = [rng.choice([500.0, 1000.0, 2000.0, 4000.0, 8000.0, 1920.0, 3840.0]) for _ in range(num_disks)]
+    return [raid_type, sizes, spans]
+
+
+def raid_reference(raid_type, sizes, spans):
+    """Independent smallest-member model: (netto, used GB per disk) or None if the layout is invalid."""
+    n = len(sizes)
+    if raid_type in RAID_PARITY:
+        parity = RAID_PARITY[raid_type]
+        if n < max(2, parity + 2):
+            return None
+        return (n - parity) * min(sizes), min(sizes)
+    if raid_type == "RAID 1":
+        return (min(sizes), min(sizes)) if n >= 2 else None
+    if raid_type == "RAID 10":
+        if n < 4 or n % 2:
+            return None
+        used = min(min(sizes[i:i + 2]) for i in range(0, n, 2))
+        return n / 2 * used, used
+    parity = 1 if raid_type == "RAID 50" else 2
+    if spans < 2 or n % spans or n // spans < parity + 2:
+        return None
+    per_span = n // spans
+    used = min(min(sizes[i:i + per_span]) for i in range(0, n, per_span))
+    return spans * (per_span - parity) * used, used
+
+
+def check_raid(case):
+    raid_type, sizes, spans = case
+    ref = raid_reference(raid_type, sizes, spans)
+    try:
+        res = raid_engine.calculate_sizes(raid_type, sizes, spans)
+    except ValueError:
+        res = None
+    if (ref is None) != (res is None):
+        return f"Validierung abweichend: toolkit={res is not None} referenz={ref is not None}"
+    if res is None:
+        return None
+    netto, used = ref
+    waste = [size - used for size in sizes]
+    if res["netto"] != netto or res["waste"] != waste:
+        return f"toolkit={res['netto']!r}/{res['waste']!r} referenz={netto!r}/{waste!r}"
+
+    # Batch-Pfad (numpy) muss dieselben Werte liefern, auch für mehrere Layouts
+    brutto_b, netto_b, waste_b = raid_engine.calculate_batch(raid_type, [sizes, sizes[::-1]], spans)
+    if netto_b[0] != res["netto"] or brutto_b[0] != res["brutto"] or abs(waste_b[0] - res["waste_total"]) > 1e-6:
+        return f"batch: {netto_b[0]!r}/{brutto_b[0]!r}/{waste_b[0]!r} != {res['netto']!r}/{res['brutto']!r}/{res['waste_total']!r}"
+    return None
+
+
+def shrink_raid(case):
+    raid_type, sizes, spans = case
+    for i in range(len(sizes)):
+        if len(sizes) > 1:
+            yield [raid_type, sizes[:i] + sizes[i+1:], spans]
+    for i, size in enumerate(sizes):
+        if size != 1000.0:
+            yield [raid_type, sizes[:i] + [1000.0] + sizes[i+1:], spans]
+
+
+# --- RAID optimizer (branch and bound vs. brute force over a tiny catalogue) ---
+
+def gen_optimize(rng):
+    catalogue = [[f"SKU{i}", rng.choice([500.0, 960.0, 1000.0, 2000.0, 4000.0, 8000.0]), float(rng.randint(20, 400))]
+                 for i in range(rng.randint(1, 3))]
+    return [catalogue, float(rng.randint(100, 30000)), rng.randint(0, 3), rng.randint(2, 16), rng.randint(1, 6)]
+
+
+def optimize_reference(catalogue, target, min_failures, max_disks):
+    """Every feasible (sku, level, spans, disks) layout via calculate() with its cost."""
+    feasible = {}
+    for name, size, price in catalogue:
+        for raid_type in RaidEngine.LEVELS:
+            for spans in (range(2, max_disks + 1) if raid_type in ("RAID 50", "RAID 60") else [1]):
+                for disks in range(2, max_disks + 1):
+                    try:
+                        res = raid_engine.calculate(raid_type, disks, size, spans)
+                    except ValueError:
+                        continue
+                    failures = disks - 1 if raid_type == "RAID 1" else RaidEngine.GUARANTEED_FAILURES[raid_type]
+                    if failures >= min_failures and res["netto"] >= target - 1e-9:
+                        feasible[(name, raid_type, spans, disks)] = disks * price
+    return feasible
+
+
+def check_optimize(case):
+    catalogue, target, min_failures, max_disks, top_n = case
+    rows = raid_engine.optimize(target, min_failures, [tuple(sku) for sku in catalogue], max_disks, top_n)
+    feasible = optimize_reference(catalogue, target, min_failures, max_disks)
+    for raid_type, spans, name, disks, size, netto, failures, cost, _ in rows:
+        if feasible.get((name, raid_type, spans, disks)) != cost:
+            return f"Zeile {name}/{raid_type}/{spans} mit {disks} Disks für {cost} nicht gültig: {feasible.get((name, raid_type, spans, disks))}"
+        if failures < min_failures:
+            return f"Zeile {name}/{raid_type} übersteht nur {failures} Ausfälle"
+    expected = sorted(feasible.values())[:top_n]
+    got = [row[7] for row in rows]
+    if got != expected:
+        return f"Kosten toolkit={got} brute_force={expected}"
+    return None
+
+
+def shrink_optimize(case):
+    catalogue, target, min_failures, max_disks, top_n = case
+    for i in range(len(catalogue)):
+        if len(catalogue) > 1:
+            yield [catalogue[:i] + catalogue[i+1:], target, min_failures, max_disks, top_n]
+    if top_n > 1:
+        yield [catalogue, target, min_failures, max_disks, top_n - 1]
+    if max_disks > 2:
+        yield [catalogue, target, min_failures, max_disks - 1, top_n]
+    if min_failures > 0:
+        yield [catalogue, target, min_failures - 1, max_disks, top_n]
+
+
+# --- Checksums (ChecksumEngine vs. hashlib/zlib, gestückelt über Chunk-Grenzen) ---
+
+def gen_checksum(rng):
+    length = rng.randint(0, 64) if rng.random() < 0.5 else rng.randint(0, 2000)
+    data = bytes(rng.getrandbits(8) for _ in range(length))
+    # Zufällige Schnittpunkte, auch ungerade, damit das RFC-1071-Restbyte über Chunks getragen wird
+    cuts = sorted(rng.randint(0, length) for _ in range(rng.randint(0, 6)))
+    return [data.hex(), cuts]
+
+
+def internet_checksum_reference(data):
+    if len(data) % 2:
+        data += b"\0"
+    total = sum((data[i] << 8) | data[i + 1] for i in range(0, len(data), 2))
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def check_checksum(case):
+    data_hex, cuts = case
+    data = bytes.fromhex(data_hex)
+    ref = {"CRC32": f"0x{zlib.crc32(data):08X}", "Adler-32": f"0x{zlib.adler32(data):08X}",
+           "Internet (RFC 1071)": f"0x{internet_checksum_reference(data):04X}",
+           "MD5": hashlib.md5(data).hexdigest(), "SHA-1": hashlib.sha1(data).hexdigest(),
+           "SHA-256": hashlib.sha256(data).hexdigest()}
+
+    whole = checksum_engine.compute_bytes(data)
+    if whole != ref:
+        return "compute_bytes: " + ", ".join(f"{k}={whole[k]} statt {ref[k]}" for k in ref if whole[k] != ref[k])
+
+    state = checksum_engine.new_state()
+    bounds = [0] + cuts + [len(data)]
+    for start, end in zip(bounds, bounds[1:]):
+        checksum_engine.update(state, memoryview(data)[start:end])
+    chunked = checksum_engine.finalize(state)
+    if chunked != ref:
+        return f"Chunks {cuts}: " + ", ".join(f"{k}={chunked[k]} statt {ref[k]}" for k in ref if chunked[k] != ref[k])
+    return None
+
+
+def shrink_checksum(case):
+    data_hex, cuts = case
+    for i in range(len(cuts)):
+        yield [data_hex, cuts[:i] + cuts[i+1:]]
+    data = bytes.fromhex(data_hex)
+    for size in (len(data) // 2, len(data) - 1):
+        if 0 <= size < len(data):
+            yield [data[:size].hex(), [min(c, size) for c in cuts]]
+
+
+DOMAINS = {
+    "subnet": (gen_subnet, check_subnet, shrink_subnet),
+    "units": (gen_units, check_units, shrink_units),
+    "bits": (gen_bits, check_bits, shrink_bits),
+    "raid": (gen_raid, check_raid, shrink_raid),
+    "optimize": (gen_optimize, check_optimize, shrink_optimize),
+    "checksum": (gen_checksum, check_checksum, shrink_checksum),
+}
+
+
+def run_check(check, case):
+    try:
+        return check(case)
+    except Exception as e:
+        return f"Exception: {type(e).__name__}: {e}"
+
+
+def minimize(domain, case):
+    """Greedily replaces the case by simpler variants as long as it still fails."""
+    _, check, shrink = DOMAINS[domain]
+    message = run_check(check, case)
+    progress = True
+    while progress:
+        progress = False
+        for candidate in shrink(case):
+            candidate_message = run_check(check, candidate)
+            if candidate_message is not None:
+                case, message = candidate, candidate_message
+                progress = True
+                break
+    return case, message
+
+
+def run_shard(task):
+    """Runs one deterministic shard. The RNG only depends on (seed, shard index)."""
+    seed, shard, count, domains = task
+    rng = random.Random(f"{seed}:{shard}")
+    failures = []
+    for i in range(count):
+        domain = domains[i % len(domains)]
+        gen, check, _ = DOMAINS[domain]
+        case = gen(rng)
+        if run_check(check, case) is not None:
+            minimal, message = minimize(domain, case)
+            failures.append({"domain": domain, "shard": shard, "index": i,
+                             "case": minimal, "original": case, "message": message})
+    return count, failures
+
+
+def fuzz(total, seed, workers, shards, domains, out_path):
+    per_shard, rest = divmod(total, shards)
+    tasks = [(seed, k, per_shard + (1 if k < rest else 0), domains) for k in range(shards)]
+
+    start = time.perf_counter()
+    done = 0
+    seen = set()
+    failures = []
+    with Pool(workers) as pool:
+        for count, shard_failures in pool.imap_unordered(run_shard, tasks, chunksize=1):
+            done += count
+            for failure in shard_failures:
+                key = (failure["domain"], json.dumps(failure["case"]))
+                if key not in seen:
+                    seen.add(key)
+                    failures.append(failure)
+            elapsed = time.perf_counter() - start
+            print(f"\r{done:,}/{total:,} Fälle  {done / elapsed:,.0f}/s  {len(failures)} Fehler", end="", flush=True)
+    print()
+
+    failures.sort(key=lambda f: (f["domain"], f["shard"], f["index"]))
+    with open(out_path, "w", encoding="utf-8") as f:
+        for failure in failures:
+            f.write(json.dumps(failure, ensure_ascii=False) + "\n")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential fuzzing of the FISI Toolkit engines.")
+    parser.add_argument("--cases", type=int, default=1_000_000, help="Anzahl Testfälle gesamt")
+    parser.add_argument("--seed", type=int, default=0, help="Seed für reproduzierbare Läufe")
+    parser.add_argument("--workers", type=int, default=cpu_count(), help="Anzahl Prozesse")
+    parser.add_argument("--shards", type=int, default=None, help="Anzahl Shards (Standard: 8 pro Prozess)")
+    parser.add_argument("--domains", default=",".join(DOMAINS), help="Kommagetrennt: subnet,units,bits,raid,optimize,checksum")
+    parser.add_argument("--out", default=os.path.join(os.path.dirname(__file__), "fuzz_failures.jsonl"),
+                        help="Ausgabedatei für minimierte Fehlerfälle (JSONL)")
+    parser.add_argument("--report", action="store_true", help="Nur comparison_results.md neu erzeugen")
+    args = parser.parse_args()
+
+    if args.report:
+        generate_cases()
+        return 0
+
+    domains = [d.strip() for d in args.domains.split(",") if d.strip()]
+    unknown = [d for d in domains if d not in DOMAINS]
+    if unknown:
+        parser.error(f"Unbekannte Domäne(n): {', '.join(unknown)}")
+    shards = args.shards or args.workers * 8
+
+    failures = fuzz(args.cases, args.seed, args.workers, shards, domains, args.out)
+    for failure in failures[:20]:
+        print(f"[{failure['domain']}] {failure['case']}: {failure['message']}")
+    if failures:
+        print(f"{len(failures)} minimierte Fehlerfälle in {args.out}")
+    return 1 if failures else 0
+
+
 if __name__ == "__main__":
-    generate_cases()
+    sys.exit(main())
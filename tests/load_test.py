@@ -0,0 +1,115 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+# Load test for the local API (python fisi_toolkit.py --serve).
+# Every connection is kept alive and sends requests back to back.
+
+PAYLOADS = {
+    "subnet": lambda rng: {"ip": f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}",
+                           "cidr": rng.randint(0, 32)},
+    "raid": lambda rng: {"raid": rng.choice(["RAID 0", "RAID 1", "RAID 5", "RAID 6", "RAID 10"]),
+                         "disks": rng.choice([4, 6, 8, 12]), "size": rng.choice([1000, 4000, 16000])},
+    "units": lambda rng: {"value": rng.uniform(0, 10000), "src": rng.choice(["GB", "GiB", "TB"]),
+                          "dst": rng.choice(["MB", "MiB", "TiB"])},
+}
+
+
+def build_request(host, endpoint, batch, rng):
+    make = PAYLOADS[endpoint]
+    data = [make(rng) for _ in range(batch)] if batch > 1 else make(rng)
+    body = json.dumps(data).encode("utf-8")
+    head = (f"POST /api/{endpoint} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Verbindung geschlossen")
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def client(args, deadline, stats, seed):
+    rng = random.Random(seed)
+    # A few pre-built requests are enough; building JSON must not dominate the client
+    requests = [build_request(args.host, args.endpoint, args.batch, rng) for _ in range(16)]
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        i = 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(requests[i % len(requests)])
+            await writer.drain()
+            status = await read_response(reader)
+            stats["latency"].append(time.perf_counter() - start)
+            stats["requests"] += 1
+            if status != 200:
+                stats["errors"] += 1
+            i += 1
+    finally:
+        writer.close()
+
+
+async def fetch_metrics(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /api/metrics HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    return json.loads(data.split(b"\r\n\r\n", 1)[1])
+
+
+async def run(args):
+    stats = {"requests": 0, "errors": 0, "latency": []}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(client(args, deadline, stats, seed) for seed in range(args.connections)))
+    elapsed = time.perf_counter() - start
+
+    samples = sorted(stats["latency"])
+
+    def pct(p):
+        return samples[min(len(samples) - 1, int(p * len(samples)))] * 1000 if samples else 0.0
+
+    print(f"Endpunkt:     /api/{args.endpoint} (Batch {args.batch}, {args.connections} Verbindungen)")
+    print(f"Anfragen:     {stats['requests']:,} in {elapsed:.1f} s, {stats['errors']} Fehler")
+    print(f"Durchsatz:    {stats['requests'] / elapsed:,.0f} Anfragen/s, "
+          f"{stats['requests'] * args.batch / elapsed:,.0f} Elemente/s")
+    print(f"Latenz (ms):  p50 {pct(0.5):.2f}  p95 {pct(0.95):.2f}  p99 {pct(0.99):.2f}")
+
+    if args.metrics:
+        print(json.dumps(await fetch_metrics(args.host, args.port), indent=2))
+    return 1 if stats["errors"] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for the FISI Toolkit API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--endpoint", choices=sorted(PAYLOADS), default="subnet")
+    parser.add_argument("--batch", type=int, default=1, help="Elemente pro Anfrage")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Sekunden")
+    parser.add_argument("--metrics", action="store_true", help="Server-Metriken am Ende ausgeben")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import argparse
+import json
+import os
+import sys
+
+# Memory benchmark: runs typical engine operations under MemoryProfiler
+# (tracemalloc) and compares peak/retained bytes against a stored baseline.
+#
+#   python tests/mem_benchmark.py                 -> compare with tests/mem_baseline.json
+#   python tests/mem_benchmark.py --update        -> write a new baseline
+#   python tests/mem_benchmark.py --tabs          -> also build every tab (needs a display)
+#
+# Exit code 1 if an entry got more expensive than the baseline allows. The numbers
+# depend on the Python/numpy version, so the comparison uses a relative tolerance
+# plus a fixed slack; entries missing on either side (e.g. without numpy) are skipped.
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fisi.checksum import ChecksumEngine
+from fisi.logic import LogicEngine, BitExpression, np
+from fisi.network import NetworkEngine, AddressSpaceMap
+from fisi.ports import PortIndex
+from fisi.profiler import MemoryProfiler
+from fisi.raid import RaidEngine
+from fisi.units import UnitConverterEngine
+
+BASELINE = os.path.join(os.path.dirname(__file__), "mem_baseline.json")
+
+
+def run_operations():
+    units = UnitConverterEngine()
+    for value in range(1000):
+        units.convert(value, "GiB", "MB")
+    units.convert_all(1.5, "TB")
+    units.transfer_grid([(v, "GB") for v in (1, 10, 100, 1000)], [(v, "Mbit/s") for v in (10, 100, 1000)], [1.0, 0.9])
+
+    network = NetworkEngine()
+    for cidr in (8, 16, 24, 30):
+        network.calculate("10.20.30.40", cidr)
+
+    raid = RaidEngine()
+    for level in RaidEngine.LEVELS:
+        for disks in (4, 8, 12):
+            try:
+                raid.calculate(level, disks, 4000)
+            except ValueError:
+                pass
+    layouts = [[4000 + (i * 37 + d * 11) % 4000 for d in range(8)] for i in range(20000)]
+    raid.calculate_batch("RAID 6", layouts)
+    del layouts  # viele kleine Listen machen jeden weiteren Snapshot langsamer
+
+    logic = LogicEngine()
+    for value in range(0, 1 << 32, 1 << 20):
+        logic.from_bits(logic.to_bits(value, 32))
+
+    expr = BitExpression.compile("(x >> 4) & 0xF0 ^ ~y", 32)
+    expr.evaluate({"x": 0x1234, "y": 0xFF})
+    if np is not None:
+        samples = np.arange(1_000_000, dtype=np.uint64)
+        expr.evaluate_array({"x": samples, "y": 0xFF})
+
+        space = AddressSpaceMap("10.0.0.0/8")
+        starts = np.arange(0, 1 << 24, 64, dtype=np.int64) + space.base
+        space.mark(starts, starts + 16)
+        space.heatmap(space.base, 8)
+
+    ChecksumEngine().compute_bytes(bytes(range(256)) * 32768)
+
+    index = PortIndex.load()
+    for query in ("http", "22", "L4", "ssh", "d"):
+        index.search(query)
+
+
+def build_tabs(profiler):
+    """Builds every tab once in a hidden window (needs a display)."""
+    from fisi.app import App
+    app = App()
+    app.withdraw()
+    app.memory = profiler
+    for name in app.tab_specs:
+        # Der Start-Tab wurde schon ohne diesen Profiler gebaut
+        if name in app.frames:
+            app.frames.pop(name).destroy()
+        app.get_frame(name)
+    app.on_close()
+
+
+def compare(report, baseline, tolerance, slack):
+    """Entries whose peak or retained bytes exceed baseline * (1 + tolerance) + slack."""
+    current = {(e["kind"], e["name"]): e for e in report["entries"]}
+    regressions = []
+    for base in baseline["entries"]:
+        entry = current.get((base["kind"], base["name"]))
+        if entry is None:
+            continue
+        for key in ("peak", "retained"):
+            limit = base[key] * (1 + tolerance) + slack
+            if entry[key] > limit:
+                regressions.append((base["name"], key, base[key], entry[key]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory benchmark for the FISI Toolkit engines and tabs.")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update", action="store_true", help="Baseline neu schreiben")
+    parser.add_argument("--json", help="Vollständigen Bericht als JSON speichern")
+    parser.add_argument("--tabs", action="store_true", help="Auch alle Tabs aufbauen (benötigt Display)")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Erlaubte Abweichung (Anteil)")
+    parser.add_argument("--slack", type=int, default=256 * 1024, help="Erlaubte Abweichung (Bytes)")
+    args = parser.parse_args()
+
+    profiler = MemoryProfiler()
+    profiler.enable()
+    try:
+        run_operations()
+        if args.tabs:
+            build_tabs(profiler)
+        report = profiler.report()
+    finally:
+        profiler.disable()
+
+    print(profiler.format_report(report) if report["entries"] else "Keine Messungen")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"entries": [{k: e[k] for k in ("kind", "name", "peak", "retained")} for e in report["entries"]]},
+                      f, indent=2)
+            f.write("\n")
+        print(f"\nBaseline geschrieben: {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.tolerance, args.slack)
+    print()
+    if not regressions:
+        print(f"Keine Regression gegenüber {os.path.basename(args.baseline)} "
+              f"(Toleranz {args.tolerance:.0%} + {args.slack // 1024} KiB)")
+        return 0
+    for name, key, before, after in regressions:
+        print(f"REGRESSION {name} {key}: {MemoryProfiler.format_bytes(before)} -> {MemoryProfiler.format_bytes(after)}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
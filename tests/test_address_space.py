@@ -0,0 +1,53 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fisi.network import AddressSpaceMap  # noqa: E402
+
+
+def test_parse_allocations_aligns_prefixes():
+    starts, ends = AddressSpaceMap.parse_allocations(["# Kommentar", "", "10.0.0.5/24", "10.0.1.7"])
+    assert starts.tolist() == [0x0A000000, 0x0A000107]
+    assert ends.tolist() == [0x0A000100, 0x0A000108]
+
+
+@pytest.mark.parametrize("line", ["10.0.0", "10.0.0.1/33", "foo"])
+def test_parse_allocations_rejects_invalid_lines(line):
+    with pytest.raises(ValueError, match="Zeile 1"):
+        AddressSpaceMap.parse_allocations([line])
+
+
+def test_mark_merges_overlaps_and_clips():
+    space = AddressSpaceMap("10.0.0.0/24")
+    starts, ends = AddressSpaceMap.parse_allocations(
+        ["10.0.0.0/26", "10.0.0.32/27", "10.0.0.64/32", "9.255.255.0/24", "10.0.0.192/25"])  # /25 wird auf .128 ausgerichtet
+    space.mark(starts, ends)
+    assert space.used() == 64 + 1 + 128
+    expected = np.zeros(256, dtype=bool)
+    expected[:64] = expected[64] = expected[128:] = True
+    assert (np.unpackbits(space.bits).astype(bool) == expected).all()
+
+
+def test_heatmap_cells_follow_hilbert_layout():
+    space = AddressSpaceMap("10.0.0.0/16")
+    space.mark([0x0A000000], [0x0A000100])  # erstes /24 voll
+    grid = space.heatmap(space.base, 16)
+    side, per_cell = space.view_shape(16)
+    assert grid.shape == (side, side) and per_cell == 1
+    assert grid.sum() == 256
+    first, prefix = space.cell_prefix(space.base, 16, 0, 0)
+    assert (first, prefix) == (space.base, 32)
+    with pytest.raises(ValueError):
+        space.heatmap(space.base, 8)
+
+
+@pytest.mark.parametrize("network", ["10.0.0.0/7", "10.0.0.0/25", "kein netz"])
+def test_rejects_networks_out_of_range(network):
+    with pytest.raises(ValueError):
+        AddressSpaceMap(network)
+
+
+def test_to_ppm_header():
+    data = AddressSpaceMap.to_ppm(np.array([[0.0, 1.0]]))
+    assert data.startswith(b"P6 2 1 255\n")
+    assert data[-6:-3] == bytes((45, 45, 45))
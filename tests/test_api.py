@@ -0,0 +1,85 @@
+import asyncio
+import json
+
+import pytest
+
+from fisi.api import ApiServer, api_process_batch
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_batch_returns_item_errors_inline():
+    results = api_process_batch("/api/subnet", [{"ip": "10.0.0.1", "cidr": 24}, {"ip": "10.0.0.1"}, {"ip": "x", "cidr": 8}])
+    assert results[0]["network"] == "10.0.0.0"
+    assert results[1]["error"].startswith("KeyError")
+    assert "Expected 4 octets" in results[2]["error"]
+
+
+@pytest.mark.parametrize("item", [
+    {"raid": "RAID 5", "disks": 1e10, "size": 1},
+    {"raid": "RAID 5", "disks": 4, "size": 1, "spans": 10 ** 9},
+    {"raid": "RAID 5", "sizes": [1] * 5000},
+])
+def test_raid_rejects_huge_layouts(item):
+    assert "Max." in api_process_batch("/api/raid", [item])[0]["error"]
+
+
+@pytest.mark.parametrize("item", [
+    {"value": 1e308, "src": "TB", "dst": "Bit"},          # Ergebnis läuft über
+    {"raid": "RAID 0", "disks": 4, "size": 1e308},
+])
+def test_non_finite_results_are_item_errors(item):
+    path = "/api/units" if "value" in item else "/api/raid"
+    assert "error" in api_process_batch(path, [item])[0]
+
+
+@pytest.mark.parametrize("body", [b'{"value": NaN, "src": "GB", "dst": "MB"}',
+                                  b'{"value": Infinity, "src": "GB", "dst": "MB"}',
+                                  b'{"value": 1e309, "src": "GB", "dst": "MB"}'])
+def test_non_finite_input_is_rejected(body):
+    status, payload = run(ApiServer().run_endpoint("/api/units", body))
+    assert status == 400
+    assert "Ungültiges JSON" in payload["error"]
+
+
+def test_process_pool_is_created_lazily():
+    server = ApiServer()
+    items = [{"value": 1, "src": "GB", "dst": "MB"}] * 3
+    status, payload = run(server.run_endpoint("/api/units", json.dumps(items).encode()))
+    assert status == 200 and payload[0]["result"] == 1000
+    assert server.executor is None
+
+
+async def request(server, raw):
+    listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.split(b"\r\n")[0].decode(), json.loads(body)
+
+
+def test_http_request():
+    body = b'{"ip": "192.168.178.1", "cidr": 24}'
+    status, payload = run(request(ApiServer(), b"POST /api/subnet HTTP/1.1\r\nConnection: close\r\n"
+                                  b"Content-Length: %d\r\n\r\n%s" % (len(body), body)))
+    assert status == "HTTP/1.1 200 OK"
+    assert payload["broadcast"] == "192.168.178.255"
+
+
+def test_unexpected_errors_answer_500():
+    server = ApiServer()
+
+    async def broken(method, path, body):
+        raise MemoryError
+
+    server.dispatch = broken
+    status, payload = run(request(server, b"GET /api/metrics HTTP/1.1\r\n\r\n"))
+    assert status == "HTTP/1.1 500 Internal Server Error"
+    assert payload == {"error": "Interner Fehler"}
@@ -0,0 +1,48 @@
+import pytest
+
+from fisi.binary import BinaryFileView
+
+
+@pytest.fixture
+def view(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\x89PNG\r\n" + bytes(range(32)) + b"needle" + b"\x00" * 20)
+    v = BinaryFileView(str(path))
+    yield v
+    v.close()
+
+
+def test_format_rows(view):
+    rows = view.format_rows(0, 2)
+    assert rows[0].startswith("00000000  89 50 4e 47 0d 0a 00 01")
+    assert rows[0].endswith("|.PNG............|")
+    assert rows[1].startswith("00000010  ")
+    assert view.row_count(16) == 4
+    assert len(view.format_rows(3, 10)) == 1
+
+
+def test_binary_rows_and_columns(view):
+    row = view.format_rows(0, 1, bytes_per_row=4, binary=True)[0]
+    assert row[view.hex_column(0, True):view.hex_column(1, True) - 1] == "10001001"
+    assert row[view.ascii_column(1, 4, True)] == "P"
+    assert view.byte_at_column(view.hex_column(2, True) + 3, 4, True) == 2
+    assert view.byte_at_column(0, 4, True) is None
+
+
+@pytest.mark.parametrize("chunk", [3, 7, 1 << 20])
+def test_find_across_chunks(view, monkeypatch, chunk):
+    monkeypatch.setattr(BinaryFileView, "SEARCH_CHUNK", chunk)
+    pattern = BinaryFileView.parse_pattern('"needle"')
+    assert view.find(pattern) == 38
+    assert view.find(pattern, 39) == -1
+    assert view.find(BinaryFileView.parse_pattern("50 4e 47")) == 1
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    v = BinaryFileView(str(path))
+    assert v.row_count(16) == 1
+    assert v.format_rows(0, 5) == ["00000000  " + " " * 47 + "  ||"]
+    assert v.find(b"x") == -1
+    v.close()
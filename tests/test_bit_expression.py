@@ -0,0 +1,68 @@
+import pytest
+
+import fisi.logic
+from fisi.logic import BitExpression
+
+
+@pytest.fixture(params=["numpy", "int"])
+def numpy_mode(request, monkeypatch):
+    if request.param == "int":
+        monkeypatch.setattr(fisi.logic, "np", None)
+    elif fisi.logic.np is None:
+        pytest.skip("numpy nicht installiert")
+    return request.param
+
+
+@pytest.mark.parametrize("text, width, values, expected", [
+    ("(x >> 4) & 0xF0 ^ ~y", 8, {"x": 0xAB, "y": 0x3C}, ((0xAB >> 4) & 0xF0) ^ 0xC3),
+    ("x << 9", 8, {"x": 1}, 0),
+    ("x - 1", 16, {"x": 0}, 0xFFFF),
+    ("-x", 32, {"x": 1}, 0xFFFFFFFF),
+    ("x * x + 1", 8, {"x": 16}, 1),
+    ("x >> 64", 64, {"x": 2**64 - 1}, 0),
+])
+def test_evaluate(text, width, values, expected):
+    assert BitExpression.compile(text, width).evaluate(values) == expected
+
+
+def test_evaluate_array_matches_evaluate(numpy_mode):
+    expr = BitExpression("(x << s) | (x >> (16 - s)) ^ k", 16)
+    xs = list(range(0, 65536, 997))
+    results = expr.evaluate_array({"x": xs, "s": 3, "k": 0x5A5A})
+    assert [int(r) for r in results] == [expr.evaluate({"x": x, "s": 3, "k": 0x5A5A}) for x in xs]
+
+
+@pytest.mark.parametrize("text, width", [("", 8), ("x + ", 8), ("x.y", 8), ("__import__", 8),
+                                         ("0x100", 8), ("x / 2", 8), ("x", 12), ("~" * 200 + "x", 8)])
+def test_rejects_invalid_expressions(text, width):
+    with pytest.raises(ValueError):
+        BitExpression(text, width)
+
+
+def test_missing_variable():
+    with pytest.raises(ValueError, match="y"):
+        BitExpression("x & y", 8).evaluate({"x": 1})
+
+
+def test_parse_assignments():
+    assert BitExpression.parse_assignments("x=0x12, y=3; z=0b11") == {"x": 18, "y": 3, "z": 3}
+    with pytest.raises(ValueError):
+        BitExpression.parse_assignments("_x=1")
+    with pytest.raises(ValueError):
+        BitExpression.parse_assignments("x=-1")
+
+
+def test_load_values(tmp_path, numpy_mode):
+    text = tmp_path / "werte.txt"
+    text.write_text("# Kommentar\n42\n0x2A  # Hex\n\n0b101010\n", encoding="utf-8")
+    assert [int(v) for v in BitExpression.load_values(str(text), 32)] == [42, 42, 42]
+    dump = tmp_path / "werte.bin"
+    dump.write_bytes(bytes([1, 0, 2, 1, 9]))
+    assert [int(v) for v in BitExpression.load_values(str(dump), 16)] == [1, 0x102]
+
+
+def test_result_rows(numpy_mode):
+    expr = BitExpression("x ^ 0xFF", 8)
+    values = list(range(4)) if fisi.logic.np is None else fisi.logic.np.arange(4, dtype="uint64")
+    rows = list(expr.result_rows(values, expr.evaluate_array({"x": values})))
+    assert rows[1] == (1, 0xFE, "FE")
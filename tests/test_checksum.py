@@ -0,0 +1,63 @@
+import hashlib
+import zlib
+
+import pytest
+
+import fisi.checksum
+from fisi.checksum import ChecksumEngine
+
+engine = ChecksumEngine()
+
+# IPv4-Header aus RFC 1071 / Wikipedia, Prüfsummenfeld genullt
+IP_HEADER = bytes.fromhex("450000730000400040110000c0a80001c0a800c7")
+
+
+@pytest.fixture(params=["numpy", "array"])
+def numpy_mode(request, monkeypatch):
+    if request.param == "array":
+        monkeypatch.setattr(fisi.checksum, "np", None)
+    elif fisi.checksum.np is None:
+        pytest.skip("numpy nicht installiert")
+    return request.param
+
+
+def test_compute_bytes_matches_reference(numpy_mode):
+    data = bytes(range(256)) * 5 + b"x"
+    results = engine.compute_bytes(data)
+    assert results["CRC32"] == f"0x{zlib.crc32(data):08X}"
+    assert results["Adler-32"] == f"0x{zlib.adler32(data):08X}"
+    assert results["SHA-256"] == hashlib.sha256(data).hexdigest()
+    assert results["MD5"] == hashlib.md5(data).hexdigest()
+
+
+def test_internet_checksum_of_ip_header(numpy_mode):
+    assert engine.compute_bytes(IP_HEADER, ["Internet (RFC 1071)"]) == {"Internet (RFC 1071)": "0xB861"}
+
+
+@pytest.mark.parametrize("cuts", [(1,), (3, 4, 7), (5, 6, 19)])
+def test_update_in_odd_chunks_matches_single_pass(numpy_mode, cuts):
+    state = engine.new_state()
+    bounds = (0, *cuts, len(IP_HEADER))
+    for lo, hi in zip(bounds, bounds[1:]):
+        engine.update(state, IP_HEADER[lo:hi])
+    assert engine.finalize(state) == engine.compute_bytes(IP_HEADER)
+
+
+def test_compute_file_streams_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(ChecksumEngine, "BUFFER_SIZE", 64)
+    data = bytes(range(256)) * 3 + b"abc"
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    calls = []
+    results, size, _ = engine.compute_file(str(path), progress=calls.append)
+    assert size == len(data)
+    assert results == engine.compute_bytes(data)
+    assert calls[-1] == (len(data), len(data)) and len(calls) == -(-len(data) // 64)
+
+
+def test_parse_hex_and_unknown_algorithm():
+    assert ChecksumEngine.parse_hex("45:00-0x3C, 0Xff") == b"\x45\x00\x3c\xff"
+    with pytest.raises(ValueError):
+        ChecksumEngine.parse_hex("zz")
+    with pytest.raises(ValueError):
+        engine.new_state(["CRC64"])
@@ -0,0 +1,46 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from fisi.export import ResultExporter
+
+COLUMNS = ("raid", "disks", "netto_gb")
+ROWS = [("RAID 5", n, (n - 1) * 1000.0) for n in range(3, 40)]
+
+
+def read_text(path):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name", ["out.csv", "out.csv.gz"])
+def test_csv_export(tmp_path, monkeypatch, name):
+    monkeypatch.setattr(ResultExporter, "CHUNK_ROWS", 5)
+    path = tmp_path / name
+    calls = []
+    with ResultExporter(str(path), COLUMNS) as exporter:
+        assert exporter.write_rows(iter(ROWS), progress=calls.append) == len(ROWS)
+    rows = list(csv.reader(read_text(path).splitlines()))
+    assert rows[0] == list(COLUMNS)
+    assert rows[1:] == [[str(v) for v in row] for row in ROWS]
+    assert calls[-1] == len(ROWS) and len(calls) == -(-len(ROWS) // 5)
+
+
+@pytest.mark.parametrize("name", ["out.jsonl", "out.jsonl.gz"])
+def test_jsonl_export(tmp_path, name):
+    path = tmp_path / name
+    with ResultExporter(str(path), COLUMNS) as exporter:
+        exporter.write_rows(ROWS)
+    records = [json.loads(line) for line in read_text(path).splitlines()]
+    assert records == [dict(zip(COLUMNS, row)) for row in ROWS]
+
+
+def test_format_detection_and_errors(tmp_path):
+    exporter = ResultExporter(str(tmp_path / "x.JSON.gz"), COLUMNS)
+    assert (exporter.fmt, exporter.compress) == ("jsonl", True)
+    assert ResultExporter(str(tmp_path / "x.txt"), COLUMNS).fmt == "csv"
+    with pytest.raises(ValueError):
+        ResultExporter(str(tmp_path / "x.csv"), COLUMNS, fmt="xml")
@@ -0,0 +1,35 @@
+import pytest
+
+import gen_comparison
+
+
+@pytest.mark.parametrize("domain", sorted(gen_comparison.DOMAINS))
+def test_short_fuzz_run_has_no_failures(domain):
+    count, failures = gen_comparison.run_shard((1, 0, 200, [domain]))
+    assert count == 200
+    assert failures == []
+
+
+@pytest.mark.parametrize("case", [
+    ["192.168.178.1", 24],
+    ["10.0.0.1", 31],
+    ["10.0.0.1", 32],
+    ["0.0.0.0", 0],
+    ["256.1.1.1", 24],
+    ["1.2.3", 8],
+])
+def test_subnet_edge_cases(case):
+    assert gen_comparison.check_subnet(case) is None
+
+
+def test_minimize_keeps_a_failing_case():
+    def check(case):
+        return "zu groß" if case > 10 else None
+
+    gen_comparison.DOMAINS["_test"] = (None, check, lambda case: [case // 2, case - 1])
+    try:
+        minimal, message = gen_comparison.minimize("_test", 1000)
+    finally:
+        del gen_comparison.DOMAINS["_test"]
+    assert minimal == 11
+    assert message == "zu groß"
@@ -0,0 +1,45 @@
+from fisi.history import HistoryStore
+
+
+def make_store(tmp_path):
+    return HistoryStore(str(tmp_path / "history.sqlite3"))
+
+
+def test_records_are_written_on_close(tmp_path):
+    store = make_store(tmp_path)
+    store.record("network", "10.0.0.1/24", {"ip": "10.0.0.1", "cidr": 24}, {"network": "10.0.0.0"})
+    store.close()
+
+    store = make_store(tmp_path)
+    assert store.search("network", "10.") == [("10.0.0.1/24", {"ip": "10.0.0.1", "cidr": 24})]
+    store.close()
+
+
+def test_search_is_a_prefix_search_per_tab(tmp_path):
+    store = make_store(tmp_path)
+    for key in ("192.168.0.1/24", "192.168.1.1/24", "10.0.0.1/8"):
+        store.record("network", key, {"key": key}, {})
+    store.record("storage", "192.168.x", {}, {})
+    store.close()
+
+    store = make_store(tmp_path)
+    assert sorted(key for key, _ in store.search("network", "192.168.")) == ["192.168.0.1/24", "192.168.1.1/24"]
+    assert store.search("network", "172.") == []
+    assert [key for key, _ in store.search("storage", "")] == ["192.168.x"]
+    store.close()
+
+
+def test_repeated_keys_are_listed_once_and_presets_first(tmp_path):
+    store = make_store(tmp_path)
+    store.record("converter", "1 GB GiB", {"amount": "1"}, {})
+    store.record("converter", "1 GB GiB", {"amount": "1"}, {})
+    store.record("converter", "2 GB GiB", {"amount": "2"}, {})
+    store.save_preset("converter", "1 TB GiB", {"amount": "1", "src": "TB"})
+    store.close()
+
+    store = make_store(tmp_path)
+    keys = [key for key, _ in store.search("converter", "")]
+    assert keys[0] == "1 TB GiB"
+    assert sorted(keys) == ["1 GB GiB", "1 TB GiB", "2 GB GiB"]
+    assert len(store.search("converter", "", limit=2)) == 2
+    store.close()
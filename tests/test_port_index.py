@@ -0,0 +1,39 @@
+import gzip
+
+from fisi.ports import PortIndex
+
+ENTRIES = [(80, "tcp", "http", "www www-http", 7, "World Wide Web"),
+           (443, "tcp", "https", "", 7, "HTTP über TLS"),
+           (22, "tcp", "ssh", "", 7, "Secure Shell"),
+           (None, "-", "ethernet", "", 2, "IEEE 802.3")]
+
+index = PortIndex(ENTRIES)
+
+
+def test_search_empty_query_returns_all_entries():
+    result = index.search("  ")
+    assert list(result) == [0, 1, 2, 3]
+    assert len(result) == len(ENTRIES) and result[2] == 2
+
+
+def test_search_prefix_matches_name_alias_and_port():
+    assert index.search("http") == [0, 1]
+    assert index.search("www") == [0]
+    assert index.search("44") == [1]
+    assert index.search("nope") == []
+
+
+def test_search_by_layer():
+    assert index.search("L2") == [3]
+    assert index.search("Schicht 7") == [0, 1, 2]
+
+
+def test_load_reads_tsv(tmp_path):
+    path = tmp_path / PortIndex.FILE
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("53\tudp\tdomain\tdns\t7\tDNS\n\t-\tarp\t\t2\tAddress Resolution\n")
+    loaded = PortIndex.load(str(path))
+    assert loaded.entries[0][:3] == (53, "udp", "domain")
+    assert loaded.entries[1][0] is None
+    assert loaded.search("dns") == [0]
+    assert "53/udp" in loaded.format_entry(0)
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from fisi.profiler import MemoryProfiler, profiled
+
+
+@pytest.fixture
+def profiler():
+    p = MemoryProfiler()
+    p.enable()
+    yield p
+    p.disable()
+
+
+@profiled
+def allocate(size):
+    return bytearray(size)
+
+
+def test_nested_measurements_count_towards_outer(profiler):
+    with profiler.measure("tab", "Außen"):
+        keep = bytearray(200_000)
+        with profiler.measure("op", "Innen"):
+            tmp = bytearray(1_000_000)
+            del tmp
+    outer, inner = profiler.entries[("tab", "Außen")], profiler.entries[("op", "Innen")]
+    assert inner["peak"] >= 900_000
+    assert outer["peak"] >= inner["peak"] + 150_000
+    assert outer["retained"] >= 150_000 > inner["retained"]
+    assert outer["top"] and not inner["top"]  # Snapshots nur auf oberster Ebene
+    del keep
+
+
+def test_profiled_records_only_while_enabled(profiler):
+    allocate(500_000)
+    entry = profiler.entries[("op", "allocate")]
+    assert entry["calls"] == 1 and entry["peak"] >= 400_000
+    profiler.disable()
+    allocate(10)
+    assert entry["calls"] == 1
+
+
+def test_concurrent_measurements_are_flagged(profiler):
+    started, release = threading.Event(), threading.Event()
+
+    def worker():
+        with profiler.measure("op", "Thread"):
+            started.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    started.wait(5)
+    with profiler.measure("op", "Haupt"):
+        release.set()
+        thread.join(5)
+    assert profiler.entries[("op", "Thread")]["concurrent"] == 1
+    assert profiler.entries[("op", "Haupt")]["concurrent"] == 1
+    assert "gleichzeitig" in profiler.format_report()
+
+
+def test_report_and_format_bytes(profiler, tmp_path):
+    assert "(noch keine Messungen)" in profiler.format_report()
+    allocate(1000)
+    report = profiler.report()
+    assert [e["name"] for e in report["entries"]] == ["allocate"]
+    profiler.dump(str(tmp_path / "report.json"))
+    assert (tmp_path / "report.json").stat().st_size > 0
+    assert MemoryProfiler.format_bytes(512) == "512 B"
+    assert MemoryProfiler.format_bytes(-1536) == "-1.5 KiB"
+    assert MemoryProfiler.format_bytes(3 << 30) == "3.0 GiB"
@@ -0,0 +1,44 @@
+import pytest
+
+from fisi.raid import RaidEngine
+
+engine = RaidEngine()
+
+
+def test_optimize_lists_larger_layouts_of_the_same_sku():
+    rows = engine.optimize(1000, 1, [("SSD", 1000.0, 100.0)], 8, top_n=20)
+    layouts = {(raid, disks) for raid, spans, sku, disks, *_ in rows}
+    assert ("RAID 5", 3) in layouts and ("RAID 5", 4) in layouts
+    assert ("RAID 1", 2) in layouts and ("RAID 1", 5) in layouts
+    costs = [row[7] for row in rows]
+    assert costs == sorted(costs)
+
+
+@pytest.mark.parametrize("min_failures", [0, 1, 2, 3])
+def test_optimize_applies_min_failures_to_every_level(min_failures):
+    rows = engine.optimize(500, min_failures, [("HDD", 1000.0, 50.0)], 8, top_n=50)
+    assert rows
+    assert all(failures >= min_failures for *_, failures, _, _ in rows)
+    raid1 = [disks for raid, _, _, disks, *_ in rows if raid == "RAID 1"]
+    assert min(raid1) == max(2, min_failures + 1)
+
+
+def test_optimize_keeps_top_n_cheapest():
+    catalogue = [("A", 1000.0, 100.0), ("B", 2000.0, 150.0), ("C", 4000.0, 400.0)]
+    rows = engine.optimize(3000, 1, catalogue, 12, top_n=5)
+    assert len(rows) == 5
+    assert rows[0][:4] == ("RAID 5", 1, "A", 4) and rows[0][7] == 400.0
+
+
+@pytest.mark.parametrize("args", [(0, 1, [("A", 1.0, 1.0)], 4), (1, 1, [("A", 1.0, 1.0)], 1),
+                                  (1, 1, [], 4), (1, 1, [("A", 0.0, 1.0)], 4)])
+def test_optimize_rejects_invalid_input(args):
+    with pytest.raises(ValueError):
+        engine.optimize(*args)
+
+
+def test_calculate_rejects_too_many_disks():
+    with pytest.raises(ValueError):
+        engine.calculate("RAID 0", RaidEngine.MAX_DISKS + 1, 1000)
+    with pytest.raises(ValueError):
+        engine.calculate("RAID 50", 6, 1000, spans=RaidEngine.MAX_DISKS + 1)
@@ -0,0 +1,72 @@
+import math
+
+import pytest
+
+import fisi.units
+from fisi.units import UnitConverterEngine
+
+engine = UnitConverterEngine()
+
+SIZES = [(1, "GB"), (10, "GiB"), (2.5, "TB")]
+RATES = [(100, "Mbit/s"), (1, "Gbit/s"), (10, "Gibit/s")]
+EFFICIENCIES = [1.0, 0.8]
+
+
+@pytest.fixture(params=["numpy", "loop"])
+def numpy_mode(request, monkeypatch):
+    if request.param == "loop":
+        monkeypatch.setattr(fisi.units, "np", None)
+    elif fisi.units.np is None:
+        pytest.skip("numpy nicht installiert")
+    return request.param
+
+
+def test_transfer_grid_matches_transfer_time(numpy_mode):
+    grid = engine.transfer_grid(SIZES, RATES, EFFICIENCIES)
+    assert len(grid) == len(SIZES)
+    for row, (size, size_unit) in zip(grid, SIZES):
+        expected = [engine.transfer_time(size, size_unit, rate, rate_unit, eff)
+                    for (rate, rate_unit) in RATES for eff in EFFICIENCIES]
+        assert row == pytest.approx(expected, rel=1e-12)
+        assert all(type(seconds) is float for seconds in row)
+
+
+@pytest.mark.parametrize("rates, efficiencies", [([(0, "Mbit/s")], [1.0]), ([(1, "Mbit/s")], [0.0]),
+                                                 ([(1, "Mbit/s")], [math.nan])])
+def test_transfer_grid_rejects_zero_rates(numpy_mode, rates, efficiencies):
+    with pytest.raises(ValueError):
+        engine.transfer_grid(SIZES, rates, efficiencies)
+
+
+@pytest.mark.parametrize("seconds, text", [(1.5, "1,5 s"), (60, "00:01:00"), (3661, "01:01:01"),
+                                           (2 * 86400 + 5, "2 d 00:00:05")])
+def test_format_duration(seconds, text):
+    assert engine.format_duration(seconds) == text
+
+
+@pytest.mark.parametrize("seconds", [math.inf, math.nan])
+def test_format_duration_rejects_non_finite(seconds):
+    with pytest.raises(ValueError):
+        engine.format_duration(seconds)
+
+
+def test_huge_input_gives_value_error_instead_of_overflow():
+    size = engine.parse_input("1e400")  # parst zu inf
+    seconds = engine.transfer_grid([(size, "TB")], [(1, "Gbit/s")], [1.0])[0][0]
+    with pytest.raises(ValueError):
+        engine.format_duration(seconds)
+    with pytest.raises(ValueError):
+        engine.required_rate(size, "TB", 3600, "Gbit/s")
+
+
+def test_required_rate_inverts_transfer_time():
+    seconds = engine.transfer_time(10, "TiB", 10, "Gbit/s", 0.8)
+    assert engine.required_rate(10, "TiB", seconds, "Gbit/s", 0.8) == pytest.approx(10)
+
+
+@pytest.mark.parametrize("src", engine.unit_names)
+def test_convert_all_matches_convert(src):
+    results = engine.convert_all(1.5, src)
+    assert len(results) == len(engine.unit_names)
+    for dst, result in zip(engine.unit_names, results):
+        assert result == pytest.approx(engine.convert(1.5, src, dst)[0], rel=1e-12)
@@ -0,0 +1,48 @@
+import gzip
+
+import pytest
+
+from fisi.network import ZoneGenerator
+
+
+def test_ptr_records_v4(tmp_path):
+    gen = ZoneGenerator("192.168.1.0/30", "lan.test")
+    path = tmp_path / "db.zone"
+    assert gen.write(str(path), "ptr") == 2
+    text = path.read_text(encoding="utf-8")
+    assert "$ORIGIN 1.168.192.in-addr.arpa." in text
+    assert "1\tIN\tPTR\thost-192-168-1-1.lan.test.\n" in text
+    assert text.endswith("2\tIN\tPTR\thost-192-168-1-2.lan.test.\n")
+
+
+def test_hosts_v6_gzip_with_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(ZoneGenerator, "CHUNK_LINES", 3)
+    gen = ZoneGenerator("2001:db8::/64", "v6.test", template="n{n}", limit=7)
+    path = tmp_path / "hosts.gz"
+    calls = []
+    assert gen.write(str(path), "hosts", progress=calls.append) == 7
+    lines = gzip.open(path, "rt", encoding="utf-8").read().splitlines()
+    assert lines[1] == "2001:db8::1\tn1.v6.test\tn1"
+    assert lines[-1].startswith("2001:db8::7\t")
+    assert calls == [(3, 7), (6, 7), (7, 7)]
+
+
+def test_reverse_label_v6_nibbles():
+    gen = ZoneGenerator("2001:db8::/48", "v6.test", limit=1)
+    assert gen.origin == "0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa."
+    assert gen.reverse_label(int(gen.net.network_address) + 1) == "1" + ".0" * 19
+
+
+def test_dhcp_block():
+    block = ZoneGenerator("10.1.0.0/24", "dhcp.test").dhcp_block()
+    assert "range 10.1.0.2 10.1.0.254;" in block
+    assert "option routers 10.1.0.1;" in block
+
+
+@pytest.mark.parametrize("kwargs", [{"network": "x"}, {"network": "10.0.0.0/24", "domain": " . "},
+                                    {"network": "10.0.0.0/24", "template": "{host}"},
+                                    {"network": "10.0.0.0/24", "limit": 0},
+                                    {"network": "2001:db8::/32"}])
+def test_rejects_invalid_input(kwargs):
+    with pytest.raises(ValueError):
+        ZoneGenerator(**kwargs)